@@ -0,0 +1,264 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To advance many games in lockstep, generating and applying moves for every board at once with NumPy
+'''
+
+
+import numpy as np
+from bitboard import Bitboard, step_back, INITIAL_BLACK, INITIAL_RED, PROMOTION_ROWS, RED
+from tables import NUM_DARK_SQUARES, ALL_DIRECTIONS, UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT, NEIGHBOR, LANDING
+
+
+NO_WINNER = -1
+NUM_DIRECTIONS = len(ALL_DIRECTIONS)
+BIT_SHIFTS = np.arange(NUM_DARK_SQUARES, dtype = np.uint32)
+# Targets of every (direction, square) pair, flattened like the bits of move_masks.
+NEIGHBOR_TARGETS = np.array(NEIGHBOR, dtype = np.int64).reshape(-1)
+LANDING_TARGETS = np.array(LANDING, dtype = np.int64).reshape(-1)
+PROMOTION = np.array(PROMOTION_ROWS, dtype = np.uint32)
+
+
+def bits_of(squares):
+    '''
+    Function -- bits_of
+        Converts square indices to single-bit masks.
+    Parameters:
+        squares -- an array of integers in [0, 32)
+    Returns:
+        An array of uint32.
+    '''
+    return np.left_shift(np.uint32(1), squares.astype(np.uint32))
+
+
+def from_bitboards(boards):
+    '''
+    Function -- from_bitboards
+        Builds a batch from single boards.
+    Parameters:
+        boards -- a sequence of Bitboard
+    Returns:
+        A BatchBoards with one board per input, in order.
+    '''
+    res = BatchBoards(len(boards))
+    res.black[:] = [board.black for board in boards]
+    res.red[:] = [board.red for board in boards]
+    res.kings[:] = [board.kings for board in boards]
+    res.turn[:] = [board.turn for board in boards]
+    return res
+
+
+class BatchBoards:
+    '''
+    Class -- BatchBoards
+        N boards stored as arrays of 32-bit masks, in the layout of Bitboard, advanced together
+        one hop at a time. A hop is a non-capture move or a single jump. The rules are those of
+        State.search_next_moves and State.search_jump: captures are mandatory, a piece that has
+        captured goes on capturing while it can, on its own, and a man crowned by a jump goes on
+        as a king. A player with no move loses.
+    Attributes:
+        black -- an array of uint32, the black pieces of every board
+        red -- an array of uint32, the red pieces of every board
+        kings -- an array of uint32, the king pieces of every board
+        turn -- an array of uint8, the player to move on every board
+        forced -- an array of uint32, the piece that has to keep capturing, 0 when the turn is not in a capture sequence
+        winner -- an array of int8, the winner of every finished game, NO_WINNER while it goes on
+        plies -- an array of int32, the turns completed on every board
+    Methods:
+        bitboard, movers, jump_masks, quiet_masks, capture_flags, move_masks, move_counts, step, play_random
+    '''
+
+
+    def __init__(self, count):
+        '''
+        Constructor -- creates a new instance of BatchBoards, every board at the initial position.
+        Parameters:
+            self -- the current BatchBoards object
+            count -- an integer, the number of boards
+        '''
+        self.black = np.full(count, INITIAL_BLACK, dtype = np.uint32)
+        self.red = np.full(count, INITIAL_RED, dtype = np.uint32)
+        self.kings = np.zeros(count, dtype = np.uint32)
+        self.turn = np.zeros(count, dtype = np.uint8)
+        self.forced = np.zeros(count, dtype = np.uint32)
+        self.winner = np.full(count, NO_WINNER, dtype = np.int8)
+        self.plies = np.zeros(count, dtype = np.int32)
+
+
+    def __len__(self):
+        '''
+        Method -- __len__
+            Gets the number of boards.
+        Parameters:
+            self -- the current BatchBoards object
+        Returns:
+            An integer.
+        '''
+        return len(self.black)
+
+
+    def bitboard(self, index):
+        '''
+        Method -- bitboard
+            Gets one board as a Bitboard, to search or check it.
+        Parameters:
+            index -- an integer, the board
+        Returns:
+            A Bitboard.
+        '''
+        return Bitboard(int(self.black[index]), int(self.red[index]), int(self.kings[index]), int(self.turn[index]))
+
+
+    def movers(self):
+        '''
+        Method -- movers
+            Splits the pieces of the player to move by the way they may go, as Bitboard.movers
+            does, keeping only the forced piece in a capture sequence.
+        Parameters:
+            N/A
+        Returns:
+            A tuple of two arrays of uint32, the pieces that may move up and those that may move down.
+        '''
+        red_turn = self.turn == RED
+        own = np.where(red_turn, self.red, self.black)
+        own = np.where(self.forced != 0, own & self.forced, own)
+        up = np.where(red_turn, own & self.kings, own)
+        down = np.where(red_turn, own, own & self.kings)
+        return up, down
+
+
+    def jump_masks(self):
+        '''
+        Method -- jump_masks
+            Gets the pieces of the player to move that can capture, per direction.
+        Parameters:
+            N/A
+        Returns:
+            An array of uint32 of shape (N, 4), indexed by board and direction.
+        '''
+        empty = ~(self.black | self.red)
+        opponent = np.where(self.turn == RED, self.black, self.red)
+        up, down = self.movers()
+        res = np.empty((len(self), NUM_DIRECTIONS), dtype = np.uint32)
+        for direction, pieces in ((UP_LEFT, up), (UP_RIGHT, up), (DOWN_LEFT, down), (DOWN_RIGHT, down)):
+            res[:, direction] = pieces & step_back(opponent & step_back(empty, direction), direction)
+        return res
+
+
+    def quiet_masks(self):
+        '''
+        Method -- quiet_masks
+            Gets the pieces of the player to move that have a non-capture move, per direction.
+        Parameters:
+            N/A
+        Returns:
+            An array of uint32 of shape (N, 4), indexed by board and direction.
+        '''
+        empty = ~(self.black | self.red)
+        up, down = self.movers()
+        res = np.empty((len(self), NUM_DIRECTIONS), dtype = np.uint32)
+        for direction, pieces in ((UP_LEFT, up), (UP_RIGHT, up), (DOWN_LEFT, down), (DOWN_RIGHT, down)):
+            res[:, direction] = pieces & step_back(empty, direction)
+        return res
+
+
+    def capture_flags(self):
+        '''
+        Method -- capture_flags
+            Tells which boards have a capture to make.
+        Parameters:
+            N/A
+        Returns:
+            An array of booleans.
+        '''
+        return self.jump_masks().any(axis = 1)
+
+
+    def move_masks(self):
+        '''
+        Method -- move_masks
+            Gets the legal hops of every board: the captures where one exists, the non-capture
+            moves elsewhere. A set bit stands for the piece on that square going in that direction.
+        Parameters:
+            N/A
+        Returns:
+            A tuple (masks, captures): an array of uint32 of shape (N, 4), and the capture flags.
+        '''
+        jumps = self.jump_masks()
+        captures = jumps.any(axis = 1)
+        return np.where(captures[:, None], jumps, self.quiet_masks()), captures
+
+
+    def move_counts(self):
+        '''
+        Method -- move_counts
+            Counts the legal hops of every board, like Bitboard.count_moves.
+        Parameters:
+            N/A
+        Returns:
+            An array of integers.
+        '''
+        return np.bitwise_count(self.move_masks()[0]).sum(axis = 1)
+
+
+    def step(self, rng, active = None):
+        '''
+        Method -- step
+            Plays one hop, picked uniformly among the legal hops, on every unfinished board.
+            A board whose player to move has no move is finished. A jump that can go on keeps
+            the turn, with the piece that jumped forced to continue.
+        Parameters:
+            rng -- a numpy Generator
+            active -- an array of booleans, the boards to play on, None for every board
+        Returns:
+            An array of booleans, the boards a hop was played on.
+        '''
+        masks, captures = self.move_masks()
+        bits = (masks[:, :, None] >> BIT_SHIFTS & 1).reshape(len(self), -1)
+        counts = bits.sum(axis = 1)
+        playing = self.winner == NO_WINNER
+        if active is not None:
+            playing &= active
+        lost = playing & (counts == 0)
+        self.winner[lost] = 1 - self.turn[lost].astype(np.int8)
+        playing &= ~lost
+
+        choice = (rng.random(len(self)) * counts).astype(np.int64)
+        index = np.argmax(np.cumsum(bits, axis = 1) > choice[:, None], axis = 1)
+        to_square = np.where(captures, LANDING_TARGETS[index], NEIGHBOR_TARGETS[index])
+        from_bit = np.where(playing, bits_of(index % NUM_DARK_SQUARES), 0).astype(np.uint32)
+        to_bit = np.where(playing, bits_of(np.maximum(to_square, 0)), 0).astype(np.uint32)
+        over_bit = np.where(playing & captures, bits_of(np.maximum(NEIGHBOR_TARGETS[index], 0)), 0).astype(np.uint32)
+
+        red_turn = self.turn == RED
+        move = from_bit | to_bit
+        self.black = np.where(red_turn, self.black & ~over_bit, self.black ^ move)
+        self.red = np.where(red_turn, self.red ^ move, self.red & ~over_bit)
+        was_king = (self.kings & from_bit) != 0
+        crowned = ~was_king & ((PROMOTION[self.turn] & to_bit) != 0)
+        self.kings = (self.kings & ~(from_bit | over_bit)) | np.where(was_king | crowned, to_bit, 0).astype(np.uint32)
+
+        self.forced = np.where(playing, np.where(captures, to_bit, 0), self.forced).astype(np.uint32)
+        going_on = playing & (self.forced != 0) & self.jump_masks().any(axis = 1)
+        self.forced = np.where(playing & ~going_on, 0, self.forced).astype(np.uint32)
+        ended = playing & ~going_on
+        self.turn = np.where(ended, 1 - self.turn, self.turn).astype(np.uint8)
+        self.plies += ended
+        return playing
+
+
+    def play_random(self, rng, max_plies):
+        '''
+        Method -- play_random
+            Plays random games on every board until each is won or has lasted a number of turns.
+        Parameters:
+            rng -- a numpy Generator
+            max_plies -- an integer, the turns after which a game is left unfinished
+        Returns:
+            An array of int8, the winner of every board, NO_WINNER for unfinished games.
+        '''
+        while True:
+            active = (self.winner == NO_WINNER) & (self.plies < max_plies)
+            if not active.any():
+                return self.winner
+            self.step(rng, active)
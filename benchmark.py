@@ -0,0 +1,493 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To time the rules and rendering hot paths over a fixed corpus of positions, and compare with a stored baseline
+'''
+
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import timeit
+from bitboard import Bitboard, INITIAL_BLACK, INITIAL_RED
+from headless import load_state, stub_display
+from perft import parse_position, format_position
+from simulator import play_game
+from state import State
+
+
+CORPUS_PATH = 'benchmark_corpus.txt'
+BASELINE_PATH = 'benchmark_baseline.json'
+CORPUS_SIZE = 24
+CORPUS_SEED = 20261018
+GAME_SEEDS = range(10)
+REPEAT = 9
+TOLERANCE = 0.25
+# Whole games allocate and collect far more than the hot path benchmarks, so they vary more from run to run.
+TOLERANCES = {'headless_games': 0.5}
+# What a baseline must share with the current run for a slowdown to fail the run. The host name is
+# not one of them: CI hosts change from run to run, and the calibration already scales for their speed.
+RUNNER_KEYS = ('python', 'machine')
+# Timed with every run to gauge how fast the machine is at the moment; never a regression itself.
+CALIBRATION = 'calibration'
+CALIBRATION_LOOPS = 20000
+
+
+def build_corpus(count = CORPUS_SIZE, seed = CORPUS_SEED):
+    '''
+    Function -- build_corpus
+        Plays seeded random games and keeps positions from every phase of the game, so the
+        corpus has kings, captures and crowded and sparse boards.
+    Parameters:
+        count -- an integer, the number of positions
+        seed -- an integer, the seed of the games
+    Returns:
+        A list of Bitboard, with a move for the player to move in each.
+    '''
+    rng = random.Random(seed)
+    res = [Bitboard(INITIAL_BLACK, INITIAL_RED)]
+    while len(res) < count:
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        for ply in range(rng.randrange(4, 80)):
+            moves = board.generate_moves()
+            if not moves:
+                break
+            board = board.apply_move(rng.choice(moves))
+        if board.generate_moves():
+            res.append(board)
+    return res
+
+
+def read_corpus(path = CORPUS_PATH):
+    '''
+    Function -- read_corpus
+        Reads a corpus written by write_corpus.
+    Parameters:
+        path -- a string, the file to read
+    Returns:
+        A list of Bitboard.
+    '''
+    with open(path) as file:
+        return [parse_position(line) for line in file if line.strip()]
+
+
+def write_corpus(boards, path = CORPUS_PATH):
+    '''
+    Function -- write_corpus
+        Writes positions one per line, in the format of perft.parse_position.
+    Parameters:
+        boards -- a list of Bitboard
+        path -- a string, the file to write
+    Returns:
+        N/A, but writes the file.
+    '''
+    with open(path, 'w') as file:
+        for board in boards:
+            file.write(format_position(board) + '\n')
+
+
+def own_cells(state):
+    '''
+    Function -- own_cells
+        Gets the cells holding a piece of the player to move.
+    Parameters:
+        state -- a State
+    Returns:
+        A list of cells.
+    '''
+    return [state.checkerboard[x][y] for x in range(state.num_cells) for y in range(state.num_cells)
+            if state.checkerboard[x][y].occupied and state.checkerboard[x][y].occupied.player == state.turn]
+
+
+def bench_update_valid_moves(states):
+    '''
+    Function -- bench_update_valid_moves
+        Regenerates the valid moves of every position.
+    Parameters:
+        states -- a list of State, one per corpus position
+    Returns:
+        An integer, the positions.
+    '''
+    for state in states:
+        state.update_valid_moves()
+    return len(states)
+
+
+def play_and_refresh(states, refresh):
+    '''
+    Function -- play_and_refresh
+        Plays the first move of every position and takes it back, bringing the valid moves up
+        to date after each.
+    Parameters:
+        states -- a list of State, one per corpus position
+        refresh -- a function of a State, bringing its valid moves up to date
+    Returns:
+        An integer, the refreshes.
+    '''
+    for state in states:
+        record = state.make_move(state.generate_moves()[0])
+        refresh(state)
+        state.unmake_move(record)
+        refresh(state)
+    return 2 * len(states)
+
+
+def bench_refresh_valid_moves(states):
+    '''
+    Function -- bench_refresh_valid_moves
+        Refreshes the valid moves after a move from the piece index, recomputing only the
+        pieces around the changed cells, as update_state does during a game.
+    Parameters:
+        states -- a list of State, one per corpus position
+    Returns:
+        An integer, the refreshes.
+    '''
+    return play_and_refresh(states, State.refresh_valid_moves)
+
+
+def bench_regenerate_valid_moves(states):
+    '''
+    Function -- bench_regenerate_valid_moves
+        Does the work of bench_refresh_valid_moves, regenerating the valid moves from the whole
+        checkerboard instead, the cost the piece index saves.
+    Parameters:
+        states -- a list of State, one per corpus position
+    Returns:
+        An integer, the refreshes.
+    '''
+    return play_and_refresh(states, State.update_valid_moves)
+
+
+def bench_search_next_moves(states):
+    '''
+    Function -- bench_search_next_moves
+        Searches the moves of every piece of the player to move.
+    Parameters:
+        states -- a list of State, one per corpus position
+    Returns:
+        An integer, the pieces searched.
+    '''
+    count = 0
+    for state in states:
+        for cell in own_cells(state):
+            state.search_next_moves(cell)
+            count += 1
+    return count
+
+
+def bench_search_jump(states):
+    '''
+    Function -- bench_search_jump
+        Searches the jump of every piece of the player to move in every direction.
+    Parameters:
+        states -- a list of State, one per corpus position
+    Returns:
+        An integer, the directions searched.
+    '''
+    count = 0
+    for state in states:
+        for cell in own_cells(state):
+            jumps = []
+            for dx, dy in ((-1, 1), (1, 1), (-1, -1), (1, -1)):
+                x, y = cell.coord.x + dx, cell.coord.y + dy
+                if 0 <= x < state.num_cells and 0 <= y < state.num_cells:
+                    state.search_jump(x, y, cell, jumps)
+                    count += 1
+    return count
+
+
+def bench_locate_click(states):
+    '''
+    Function -- bench_locate_click
+        Locates a click in the middle of every cell, and one off the board.
+    Parameters:
+        states -- a list of State, one per corpus position
+    Returns:
+        An integer, the clicks.
+    '''
+    state = states[0]
+    count = 0
+    for col in range(state.num_cells):
+        for row in range(state.num_cells):
+            cell = state.checkerboard[col][row]
+            state.locate_click(cell.bottom_left.x + state.cell_size / 2, cell.bottom_left.y + state.cell_size / 2)
+            count += 1
+    state.locate_click(state.board_size, state.board_size)
+    return count + 1
+
+
+def bench_move_piece(states):
+    '''
+    Function -- bench_move_piece
+        Plays every valid hop of every position and moves the piece back.
+    Parameters:
+        states -- a list of State, one per corpus position
+    Returns:
+        An integer, the calls to move_piece.
+    '''
+    count = 0
+    for state in states:
+        key = state.key
+        for from_key, targets in list(state.valid_moves.items()):
+            from_cell = state.checkerboard[from_key[0]][from_key[1]]
+            for to_cell in targets:
+                piece = from_cell.occupied
+                was_king = piece.is_king
+                state.move_piece(from_cell, to_cell)
+                state.move_piece(to_cell, from_cell)
+                if piece.is_king and not was_king:
+                    piece.uncrown()
+                count += 2
+        state.key = key
+        state.dirty.clear()
+    return count
+
+
+def bench_render_pieces(states):
+    '''
+    Function -- bench_render_pieces
+        Draws a frame of the pieces of every position with stub pens.
+    Parameters:
+        states -- a list of State, one per corpus position
+    Returns:
+        An integer, the positions.
+    '''
+    display = stub_display(states[0])
+    for state in states:
+        display.render_pieces(state.checkerboard)
+        display.scheduler.tick()
+    return len(states)
+
+
+def bench_render_move(states):
+    '''
+    Function -- bench_render_move
+        Plays the first move of every position and takes it back, drawing a frame after each,
+        so every frame only redraws the squares the move touched.
+    Parameters:
+        states -- a list of State, one per corpus position
+    Returns:
+        An integer, the frames drawn.
+    '''
+    for state in states:
+        if state.display is None:
+            state.display = stub_display(state)
+            state.render_pieces()
+            state.display.scheduler.tick()
+        record = state.make_move(state.generate_moves()[0])
+        state.render_pieces()
+        state.display.scheduler.tick()
+        state.unmake_move(record)
+        state.render_pieces()
+        state.display.scheduler.tick()
+    return 2 * len(states)
+
+
+def bench_headless_games(states):
+    '''
+    Function -- bench_headless_games
+        Plays seeded random games with the headless simulator.
+    Parameters:
+        states -- a list of State, one per corpus position
+    Returns:
+        An integer, the plies played.
+    '''
+    plies = 0
+    for seed in GAME_SEEDS:
+        plies += play_game(seed, 'random', 'random', seed)['plies']
+    return plies
+
+
+def bench_calibration(states):
+    '''
+    Function -- bench_calibration
+        Does plain Python work that no change to the game can speed up or slow down, so its
+        time only follows the speed of the machine.
+    Parameters:
+        states -- a list of State, unused
+    Returns:
+        An integer, the loops.
+    '''
+    table = {}
+    for value in range(CALIBRATION_LOOPS):
+        key = value & 1023
+        table[key] = table.get(key, 0) + value
+    return CALIBRATION_LOOPS
+
+
+BENCHMARKS = {'update_valid_moves': bench_update_valid_moves, 'refresh_valid_moves': bench_refresh_valid_moves,
+              'regenerate_valid_moves': bench_regenerate_valid_moves, 'search_next_moves': bench_search_next_moves,
+              'search_jump': bench_search_jump, 'locate_click': bench_locate_click, 'move_piece': bench_move_piece,
+              'render_pieces': bench_render_pieces, 'render_move': bench_render_move,
+              'headless_games': bench_headless_games}
+
+
+def run_benchmarks(boards, names = None, repeat = REPEAT):
+    '''
+    Function -- run_benchmarks
+        Times every benchmark over the corpus. Each one is looped enough times to last at
+        least 0.2 seconds, and the median of several runs is kept. The runs take turns between
+        the benchmarks, so a machine slowing down for a while slows all of them a little rather
+        than a few of them a lot, and the calibration takes its turn too. The time is divided
+        by the number of operations the benchmark reports, such as cells searched or plies played.
+    Parameters:
+        boards -- a list of Bitboard, the corpus
+        names -- a list of strings, the benchmarks to run, None for all of BENCHMARKS
+        repeat -- an integer, the runs per benchmark
+    Returns:
+        A dict with the keys python, the major and minor version, machine and results, results
+        mapping a benchmark name, and CALIBRATION, to a dict with the keys us_per_op and ops.
+    '''
+    runs = {}
+    with open(os.devnull, 'w') as sink, contextlib.redirect_stdout(sink):
+        for name in list(names or BENCHMARKS) + [CALIBRATION]:
+            states = [load_state(board) for board in boards]
+            function = bench_calibration if name == CALIBRATION else BENCHMARKS[name]
+            ops = function(states)
+            timer = timeit.Timer(lambda function = function, states = states: function(states))
+            number, seconds = timer.autorange()
+            runs[name] = (timer, number, ops, [seconds])
+        for run in range(repeat - 1):
+            for timer, number, ops, times in runs.values():
+                times.append(timer.timeit(number))
+    results = {}
+    for name, (timer, number, ops, times) in runs.items():
+        results[name] = {'us_per_op': statistics.median(times) / number / ops * 1e6, 'ops': ops}
+    return {'python': '.'.join(platform.python_version_tuple()[:2]), 'machine': platform.machine(),
+            'results': results}
+
+
+def same_runner(current, baseline):
+    '''
+    Function -- same_runner
+        Tells if a baseline was timed on the kind of machine and the Python of the current
+        results, the only case where their times, scaled by the calibration, can be compared
+        closely enough to fail a run.
+    Parameters:
+        current -- a dict, as returned by run_benchmarks
+        baseline -- a dict, as returned by run_benchmarks
+    Returns:
+        A boolean.
+    '''
+    return all(current.get(key) == baseline.get(key) for key in RUNNER_KEYS)
+
+
+def compare(current, baseline, tolerance = None):
+    '''
+    Function -- compare
+        Compares results with a baseline. When both have a calibration, the ratios are divided
+        by its ratio, so a machine that is busier than when the baseline was timed does not
+        make every benchmark look slower.
+    Parameters:
+        current -- a dict, as returned by run_benchmarks
+        baseline -- a dict, as returned by run_benchmarks
+        tolerance -- a float, the slowdown allowed before a benchmark counts as a regression,
+                     None for the one of TOLERANCES, TOLERANCE if it has none
+    Returns:
+        A list of tuples (name, current us_per_op, baseline us_per_op or None, ratio or None, regressed).
+    '''
+    speed = 1.0
+    if CALIBRATION in current['results'] and CALIBRATION in baseline['results']:
+        speed = current['results'][CALIBRATION]['us_per_op'] / baseline['results'][CALIBRATION]['us_per_op']
+    res = []
+    for name, result in current['results'].items():
+        old = baseline['results'].get(name)
+        if old is None:
+            res.append((name, result['us_per_op'], None, None, False))
+            continue
+        if name == CALIBRATION:
+            res.append((name, result['us_per_op'], old['us_per_op'], speed, False))
+            continue
+        allowed = TOLERANCES.get(name, TOLERANCE) if tolerance is None else tolerance
+        ratio = result['us_per_op'] / old['us_per_op'] / speed
+        res.append((name, result['us_per_op'], old['us_per_op'], ratio, ratio > 1 + allowed))
+    return res
+
+
+def confirm(current, baseline, boards, repeat = REPEAT, tolerance = None):
+    '''
+    Function -- confirm
+        Times the benchmarks that regressed once more and keeps the faster of the two times,
+        so a slowdown only counts if it shows up twice, not when the machine was busy once.
+        The new times are scaled by the calibrations, to the speed of the first run.
+    Parameters:
+        current -- a dict, as returned by run_benchmarks, updated in place
+        baseline -- a dict, as returned by run_benchmarks
+        boards -- a list of Bitboard, the corpus
+        repeat -- an integer, the runs per benchmark
+        tolerance -- a float, as compare takes it
+    Returns:
+        A list of tuples, as returned by compare.
+    '''
+    rows = compare(current, baseline, tolerance)
+    regressed = [row[0] for row in rows if row[4]]
+    if regressed:
+        again = run_benchmarks(boards, regressed, repeat)
+        speed = current['results'][CALIBRATION]['us_per_op'] / again['results'][CALIBRATION]['us_per_op']
+        for name in regressed:
+            result = current['results'][name]
+            result['us_per_op'] = min(result['us_per_op'], again['results'][name]['us_per_op'] * speed)
+        rows = compare(current, baseline, tolerance)
+    return rows
+
+
+def print_comparison(rows):
+    '''
+    Function -- print_comparison
+        Prints the rows of compare as a table.
+    Parameters:
+        rows -- a list of tuples, as returned by compare
+    Returns:
+        N/A, but prints one line per benchmark.
+    '''
+    print('benchmark              us/op   baseline   ratio')
+    for name, us, old, ratio, regressed in rows:
+        if old is None:
+            print('%-18s %10.2f        new' % (name, us))
+        else:
+            print('%-18s %10.2f %10.2f %7.2f%s' % (name, us, old, ratio, '  REGRESSION' if regressed else ''))
+
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Time the checkers hot paths and compare with a baseline.')
+    parser.add_argument('--only', nargs = '+', choices = sorted(BENCHMARKS), help = 'the benchmarks to run')
+    parser.add_argument('--repeat', type = int, default = REPEAT, help = 'runs per benchmark, the median is kept')
+    parser.add_argument('--output', default = None, help = 'a JSON file to write the results to')
+    parser.add_argument('--baseline', default = BASELINE_PATH, help = 'the JSON results to compare with')
+    parser.add_argument('--save-baseline', action = 'store_true', help = 'write the results as the new baseline')
+    parser.add_argument('--tolerance', type = float, default = None,
+                        help = 'allowed slowdown for every benchmark, 0.25 for 25%%, instead of the defaults')
+    parser.add_argument('--write-corpus', action = 'store_true', help = 'regenerate ' + CORPUS_PATH + ' first')
+    args = parser.parse_args()
+    if args.write_corpus or not os.path.exists(CORPUS_PATH):
+        write_corpus(build_corpus())
+    corpus = read_corpus()
+    current = run_benchmarks(corpus, args.only, args.repeat)
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(current, file, indent = 2)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump(current, file, indent = 2)
+    baseline = {'results': {}}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    if not same_runner(current, baseline):
+        print_comparison(compare(current, baseline, args.tolerance))
+        print('baseline timed on another Python or machine type, slowdowns are not failures: '
+              'run with --save-baseline here first')
+        return
+    rows = confirm(current, baseline, corpus, args.repeat, args.tolerance)
+    print_comparison(rows)
+    if any(row[4] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,533 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To represent a checkers position as bitboards over the 32 dark squares
+'''
+
+
+from tables import NUM_SQUARES, NUM_DARK_SQUARES, UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT, ALL_DIRECTIONS
+from tables import DIRECTION_DELTAS, NEIGHBOR, LANDING, SQUARE_STEPS, NO_SQUARE
+from tables import coord_to_square, square_to_coord, on_board, piece_kind
+from move import Move
+from zobrist import PIECE_KEYS, TURN_KEY, hash_masks
+
+
+FULL_MASK = 0xFFFFFFFF
+
+BLACK = 0
+RED = 1
+
+INITIAL_BLACK = 0x00000FFF
+INITIAL_RED = 0xFFF00000
+PROMOTION_ROWS = (0xF0000000, 0x0000000F)
+
+
+def build_steps():
+    '''
+    Function -- build_steps
+        Builds the masks and shifts moving every square one step in each direction.
+        Rows of even and odd parity shift by different amounts, so each direction
+        has two (mask, shift) pairs; the shifts go left when moving up and right when moving down.
+    Parameters:
+        N/A
+    Returns:
+        A tuple of four tuples (mask_a, shift_a, mask_b, shift_b), one per direction.
+    '''
+    steps = []
+    for dx, dy in DIRECTION_DELTAS:
+        masks = {}
+        for square in range(NUM_DARK_SQUARES):
+            x, y = square_to_coord(square)
+            if on_board(x + dx, y + dy):
+                shift = abs(coord_to_square(x + dx, y + dy) - square)
+                masks[shift] = masks.get(shift, 0) | 1 << square
+        (shift_a, mask_a), (shift_b, mask_b) = sorted(masks.items())
+        steps.append((mask_a, shift_a, mask_b, shift_b))
+    return tuple(steps)
+
+
+def build_neighbor_over():
+    '''
+    Function -- build_neighbor_over
+        Builds the square jumped over between every square and each of its jump landings.
+    Parameters:
+        N/A
+    Returns:
+        A list of 32 dicts, mapping a landing square to the square in between.
+    '''
+    res = [{} for square in range(NUM_DARK_SQUARES)]
+    for direction in ALL_DIRECTIONS:
+        for square in range(NUM_DARK_SQUARES):
+            if LANDING[direction][square] != NO_SQUARE:
+                res[square][LANDING[direction][square]] = NEIGHBOR[direction][square]
+    return res
+
+
+STEPS = build_steps()
+NEIGHBOR_OVER = build_neighbor_over()
+(UL_MASK_A, UL_SHIFT_A, UL_MASK_B, UL_SHIFT_B), (UR_MASK_A, UR_SHIFT_A, UR_MASK_B, UR_SHIFT_B), \
+    (DL_MASK_A, DL_SHIFT_A, DL_MASK_B, DL_SHIFT_B), (DR_MASK_A, DR_SHIFT_A, DR_MASK_B, DR_SHIFT_B) = STEPS
+
+
+def step(bits, direction):
+    '''
+    Function -- step
+        Moves every set square of a mask one step in a direction, dropping squares that leave the board.
+    Parameters:
+        bits -- an integer, a mask of squares
+        direction -- an integer, one of the four directions
+    Returns:
+        An integer, the mask of the neighbouring squares.
+    '''
+    mask_a, shift_a, mask_b, shift_b = STEPS[direction]
+    if direction < DOWN_LEFT:
+        return (bits & mask_a) << shift_a | (bits & mask_b) << shift_b
+    return (bits & mask_a) >> shift_a | (bits & mask_b) >> shift_b
+
+
+def step_back(bits, direction):
+    '''
+    Function -- step_back
+        Gets the squares whose neighbour in a direction is in a mask.
+    Parameters:
+        bits -- an integer, a mask of squares
+        direction -- an integer, one of the four directions
+    Returns:
+        An integer, the mask of squares one step behind the input squares.
+    '''
+    mask_a, shift_a, mask_b, shift_b = STEPS[direction]
+    if direction < DOWN_LEFT:
+        return (bits >> shift_a) & mask_a | (bits >> shift_b) & mask_b
+    return (bits << shift_a) & mask_a | (bits << shift_b) & mask_b
+
+
+def decode_moves(masks, targets):
+    '''
+    Function -- decode_moves
+        Lists the moves encoded by per-direction masks of moving pieces.
+    Parameters:
+        masks -- a sequence of four masks, indexed by direction
+        targets -- NEIGHBOR or LANDING, the square reached in each direction
+    Returns:
+        A list of tuples (from_square, to_square).
+    '''
+    res = []
+    for direction in ALL_DIRECTIONS:
+        movers = masks[direction]
+        table = targets[direction]
+        while movers:
+            low = movers & -movers
+            movers ^= low
+            square = low.bit_length() - 1
+            res.append((square, table[square]))
+    return res
+
+
+def from_checkerboard(checkerboard, turn):
+    '''
+    Function -- from_checkerboard
+        Builds a bitboard from the 2D list of cells maintained by State.
+    Parameters:
+        checkerboard -- a 2D list of cells, indexed by column then row
+        turn -- an integer, the player to move
+    Returns:
+        A Bitboard with the same pieces as the checkerboard.
+    '''
+    board = Bitboard(turn = int(turn))
+    for square in range(NUM_DARK_SQUARES):
+        x, y = square_to_coord(square)
+        piece = checkerboard[x][y].occupied
+        if piece:
+            board.put(square, piece.player, piece.is_king)
+    return board
+
+
+class Bitboard:
+    '''
+    Class -- Bitboard
+    Attributes:
+        black -- an integer, the 32-bit mask of squares holding black (human) pieces
+        red -- an integer, the 32-bit mask of squares holding red (computer) pieces
+        kings -- an integer, the 32-bit mask of squares holding king pieces
+        turn -- an integer, 0 when black is to move, 1 when red is to move
+        key -- an integer, the Zobrist key of the position, kept up to date by put and apply_move
+    Methods:
+        put, player_pieces, empty, movers, quiet_masks, jump_masks, quiet_moves, jumps,
+        has_capture, count_moves, valid_moves, capture_paths, extend_capture, generate_moves,
+        quiet_move, copy, apply_move
+    '''
+
+
+    def __init__(self, black = 0, red = 0, kings = 0, turn = BLACK, key = None):
+        '''
+        Constructor -- creates a new instance of Bitboard.
+        Parameters:
+            self -- the current Bitboard object
+            black -- an integer, the mask of black pieces
+            red -- an integer, the mask of red pieces
+            kings -- an integer, the mask of king pieces of either player
+            turn -- an integer, the player to move
+            key -- an integer, the Zobrist key if already known, None to compute it
+        '''
+        self.black = black
+        self.red = red
+        self.kings = kings
+        self.turn = turn
+        self.key = hash_masks(black, red, kings, turn) if key is None else key
+
+
+    def __str__(self):
+        '''
+        Method -- __str__
+            Creates a string representation of the Bitboard, top row first.
+        Parameter:
+            self -- The current Bitboard object
+        Returns:
+            A string representation of the Bitboard.
+        '''
+        rows = []
+        for y in reversed(range(NUM_SQUARES)):
+            row = ''
+            for x in range(NUM_SQUARES):
+                if x % 2 == y % 2:
+                    row += ' '
+                    continue
+                bit = 1 << coord_to_square(x, y)
+                if self.black & bit:
+                    row += 'B' if self.kings & bit else 'b'
+                elif self.red & bit:
+                    row += 'R' if self.kings & bit else 'r'
+                else:
+                    row += '.'
+            rows.append(row)
+        return '\n'.join(rows)
+
+
+    def __eq__(self, board):
+        '''
+        Method -- __eq__
+            Checks if two objects are equal.
+        Parameters:
+            self -- The current Bitboard object
+            board -- An object to compare self to.
+        Returns:
+            A boolean, True if the two objects are equal, False otherwise.
+        '''
+        return self.black == board.black and self.red == board.red and \
+               self.kings == board.kings and self.turn == board.turn
+
+
+    def put(self, square, player, is_king = False):
+        '''
+        Method -- put
+            Places a piece on an empty square.
+        Parameters:
+            square -- an integer, the square index
+            player -- an integer, the owner of the piece
+            is_king -- a boolean, True if the piece is a king piece
+        Returns:
+            N/A. Updates the masks and the key.
+        '''
+        bit = 1 << square
+        self.key ^= PIECE_KEYS[player + 2 * bool(is_king)][square]
+        if player == BLACK:
+            self.black |= bit
+        else:
+            self.red |= bit
+        if is_king:
+            self.kings |= bit
+
+
+    def player_pieces(self, player):
+        '''
+        Method -- player_pieces
+            Gets the mask of the pieces of a player.
+        Parameters:
+            player -- an integer, 0 for black, 1 for red
+        Returns:
+            An integer, the mask of the pieces of the player.
+        '''
+        return self.red if player else self.black
+
+
+    def empty(self):
+        '''
+        Method -- empty
+            Gets the mask of unoccupied squares.
+        Parameters:
+            N/A
+        Returns:
+            An integer, the mask of unoccupied squares.
+        '''
+        return ~(self.black | self.red) & FULL_MASK
+
+
+    def movers(self):
+        '''
+        Method -- movers
+            Splits the pieces of the player to move by the way they may go.
+        Parameters:
+            N/A
+        Returns:
+            A tuple of two masks, the pieces that may move up and the pieces that may move down.
+        '''
+        if self.turn == BLACK:
+            return self.black, self.black & self.kings
+        return self.red & self.kings, self.red
+
+
+    def quiet_masks(self):
+        '''
+        Method -- quiet_masks
+            Gets the pieces of the player to move that have a non-capture move, per direction.
+            The shifts of step_back are written out here, since this is the hot path of move generation.
+        Parameters:
+            N/A
+        Returns:
+            A tuple of four masks, indexed by direction.
+        '''
+        empty = ~(self.black | self.red) & FULL_MASK
+        up, down = self.movers()
+        return (up & ((empty >> UL_SHIFT_A) & UL_MASK_A | (empty >> UL_SHIFT_B) & UL_MASK_B),
+                up & ((empty >> UR_SHIFT_A) & UR_MASK_A | (empty >> UR_SHIFT_B) & UR_MASK_B),
+                down & ((empty << DL_SHIFT_A) & DL_MASK_A | (empty << DL_SHIFT_B) & DL_MASK_B),
+                down & ((empty << DR_SHIFT_A) & DR_MASK_A | (empty << DR_SHIFT_B) & DR_MASK_B))
+
+
+    def jump_masks(self):
+        '''
+        Method -- jump_masks
+            Gets the pieces of the player to move that can capture, per direction.
+        Parameters:
+            N/A
+        Returns:
+            A tuple of four masks, indexed by direction.
+        '''
+        empty = ~(self.black | self.red) & FULL_MASK
+        opponent = self.black if self.turn else self.red
+        up, down = self.movers()
+        res = [0, 0, 0, 0]
+        if up:
+            over = opponent & ((empty >> UL_SHIFT_A) & UL_MASK_A | (empty >> UL_SHIFT_B) & UL_MASK_B)
+            res[UP_LEFT] = up & ((over >> UL_SHIFT_A) & UL_MASK_A | (over >> UL_SHIFT_B) & UL_MASK_B)
+            over = opponent & ((empty >> UR_SHIFT_A) & UR_MASK_A | (empty >> UR_SHIFT_B) & UR_MASK_B)
+            res[UP_RIGHT] = up & ((over >> UR_SHIFT_A) & UR_MASK_A | (over >> UR_SHIFT_B) & UR_MASK_B)
+        if down:
+            over = opponent & ((empty << DL_SHIFT_A) & DL_MASK_A | (empty << DL_SHIFT_B) & DL_MASK_B)
+            res[DOWN_LEFT] = down & ((over << DL_SHIFT_A) & DL_MASK_A | (over << DL_SHIFT_B) & DL_MASK_B)
+            over = opponent & ((empty << DR_SHIFT_A) & DR_MASK_A | (empty << DR_SHIFT_B) & DR_MASK_B)
+            res[DOWN_RIGHT] = down & ((over << DR_SHIFT_A) & DR_MASK_A | (over << DR_SHIFT_B) & DR_MASK_B)
+        return res
+
+
+    def quiet_moves(self):
+        '''
+        Method -- quiet_moves
+            Gets every non-capture move of the player to move.
+        Parameters:
+            N/A
+        Returns:
+            A list of tuples (from_square, to_square).
+        '''
+        return decode_moves(self.quiet_masks(), NEIGHBOR)
+
+
+    def jumps(self):
+        '''
+        Method -- jumps
+            Gets every single-hop capture of the player to move.
+        Parameters:
+            N/A
+        Returns:
+            A list of tuples (from_square, to_square).
+        '''
+        return decode_moves(self.jump_masks(), LANDING)
+
+
+    def has_capture(self):
+        '''
+        Method -- has_capture
+            Tells if the player to move has to capture.
+        Parameters:
+            N/A
+        Returns:
+            A boolean, True if at least one capture is available.
+        '''
+        return any(self.jump_masks())
+
+
+    def count_moves(self):
+        '''
+        Method -- count_moves
+            Counts the valid single-hop moves of the player to move without listing them.
+        Parameters:
+            N/A
+        Returns:
+            An integer, the number of captures if any, otherwise of non-capture moves.
+        '''
+        up_left, up_right, down_left, down_right = self.jump_masks()
+        if not (up_left or up_right or down_left or down_right):
+            up_left, up_right, down_left, down_right = self.quiet_masks()
+        return up_left.bit_count() + up_right.bit_count() + down_left.bit_count() + down_right.bit_count()
+
+
+    def valid_moves(self):
+        '''
+        Method -- valid_moves
+            Gets the valid moves of the player to move, captures only when one is available.
+        Parameters:
+            N/A
+        Returns:
+            A dict with tuple(x, y) of the moving piece as the key and a list of tuple(x, y) destinations.
+        '''
+        res = {}
+        masks = self.jump_masks()
+        if any(masks):
+            moves = decode_moves(masks, LANDING)
+        else:
+            moves = decode_moves(self.quiet_masks(), NEIGHBOR)
+        for from_square, to_square in moves:
+            res.setdefault(square_to_coord(from_square), []).append(square_to_coord(to_square))
+        return res
+
+
+    def capture_paths(self):
+        '''
+        Method -- capture_paths
+            Generates the complete capture sequences of the player to move. As in State,
+            captured pieces leave the board at once, a man crowned mid-sequence goes on
+            capturing as a king, and a sequence only ends when no further jump exists.
+            Sequences ending on the same square with the same captures and crowning
+            are yielded once.
+        Parameters:
+            N/A
+        Returns:
+            A generator of Move, one per distinct complete capture sequence.
+        '''
+        seen = set()
+        pieces = self.player_pieces(self.turn)
+        opponent = self.player_pieces(1 - self.turn)
+        empty = self.empty()
+        promotion = PROMOTION_ROWS[self.turn]
+        for from_square, to_square in self.jumps():
+            is_king = bool(self.kings >> from_square & 1)
+            over = NEIGHBOR_OVER[from_square][to_square]
+            crowned = not is_king and bool(promotion >> to_square & 1)
+            for move in self.extend_capture([from_square, to_square], is_king or crowned, crowned,
+                                            opponent & ~(1 << over), (empty | 1 << from_square | 1 << over) & ~(1 << to_square),
+                                            1 << over):
+                key = (move.path[0], move.path[-1], move.captured, move.crowned)
+                if key not in seen:
+                    seen.add(key)
+                    yield move
+
+
+    def extend_capture(self, path, is_king, crowned, opponent, empty, captured):
+        '''
+        Method -- extend_capture
+            Extends a partial capture sequence with every further jump, recursively.
+        Parameters:
+            path -- a list of integers, the squares visited so far
+            is_king -- a boolean, True if the moving piece is a king by now
+            crowned -- a boolean, True if the piece was crowned during the sequence
+            opponent -- an integer, the mask of opponent pieces still on the board
+            empty -- an integer, the mask of empty squares
+            captured -- an integer, the mask of squares captured so far
+        Returns:
+            A generator of Move, the complete sequences starting with the path.
+        '''
+        square = path[-1]
+        extended = False
+        for over, landing in SQUARE_STEPS[piece_kind(self.turn, is_king)][square]:
+            if landing != NO_SQUARE and opponent >> over & 1 and empty >> landing & 1:
+                extended = True
+                crowns = not is_king and bool(PROMOTION_ROWS[self.turn] >> landing & 1)
+                path.append(landing)
+                yield from self.extend_capture(path, is_king or crowns, crowned or crowns,
+                                               opponent & ~(1 << over), (empty | 1 << square | 1 << over) & ~(1 << landing),
+                                               captured | 1 << over)
+                path.pop()
+        if not extended:
+            yield Move(path, captured, crowned)
+
+
+    def generate_moves(self):
+        '''
+        Method -- generate_moves
+            Gets every move of the player to move, each a whole turn: the complete capture
+            sequences when a capture is available, the non-capture moves otherwise.
+        Parameters:
+            N/A
+        Returns:
+            A list of Move.
+        '''
+        if self.has_capture():
+            return list(self.capture_paths())
+        promotion = PROMOTION_ROWS[self.turn]
+        return [Move((from_square, to_square), 0, not self.kings >> from_square & 1 and bool(promotion >> to_square & 1))
+                for from_square, to_square in self.quiet_moves()]
+
+
+    def quiet_move(self, from_square, to_square):
+        '''
+        Method -- quiet_move
+            Builds the non-capture move between two squares if it is legal in this position,
+            ignoring whether a capture is mandatory. Used to check moves remembered from other positions.
+        Parameters:
+            from_square -- an integer, the square to move from
+            to_square -- an integer, the square to move to
+        Returns:
+            A Move, None if the player to move has no such step.
+        '''
+        from_bit = 1 << from_square
+        if not (self.red if self.turn else self.black) & from_bit or (self.black | self.red) >> to_square & 1:
+            return None
+        is_king = self.kings & from_bit
+        for neighbor, landing in SQUARE_STEPS[piece_kind(self.turn, is_king)][from_square]:
+            if neighbor == to_square:
+                return Move((from_square, to_square), 0, not is_king and bool(PROMOTION_ROWS[self.turn] >> to_square & 1))
+        return None
+
+
+    def copy(self):
+        '''
+        Method -- copy
+            Copies the Bitboard.
+        Parameters:
+            N/A
+        Returns:
+            A new Bitboard with the same pieces and turn.
+        '''
+        return Bitboard(self.black, self.red, self.kings, self.turn, self.key)
+
+
+    def apply_move(self, move):
+        '''
+        Method -- apply_move
+            Plays a whole turn on a copy of the Bitboard.
+        Parameters:
+            move -- a Move of the player to move
+        Returns:
+            A new Bitboard after the move, with the other player to move, and its key
+            updated from the squares the move changes.
+        '''
+        from_square = move.path[0]
+        to_square = move.path[-1]
+        from_bit = 1 << from_square
+        to_bit = 1 << to_square
+        captured = move.captured
+        turn = self.turn
+        was_king = self.kings & from_bit
+        key = self.key ^ TURN_KEY ^ PIECE_KEYS[turn + (2 if was_king else 0)][from_square] ^ \
+              PIECE_KEYS[turn + (2 if was_king or move.crowned else 0)][to_square]
+        remaining = captured
+        while remaining:
+            low = remaining & -remaining
+            remaining ^= low
+            key ^= PIECE_KEYS[1 - turn + (2 if self.kings & low else 0)][low.bit_length() - 1]
+        kings = self.kings & ~captured
+        if was_king or move.crowned:
+            kings = (kings & ~from_bit) | to_bit
+        if turn == BLACK:
+            return Bitboard((self.black & ~from_bit) | to_bit, self.red & ~captured, kings, RED, key)
+        return Bitboard(self.black & ~captured, (self.red & ~from_bit) | to_bit, kings, BLACK, key)
@@ -3,8 +3,9 @@ Created by: Shiyao Wang
 Time: Nov 11, 2020
 Purpose: To represent a cell on the checkerboard
 '''
-import turtle
 from coordinate import Coordinate
+from frozen_cell import CELLS
+from tables import SEARCH_COORDS, piece_kind
 
 
 NUM_EDGE_SQUARE = 4
@@ -22,9 +23,11 @@ class Cell:
         edge -- an integer, the length of the edge of this cell
         color -- a string, the color of this cell
     Methods:
-        is_click_in, is_adjacent, all_adjacent, render_cell, generate_cell_key, get_coords_to_search
+        is_click_in, is_adjacent, all_adjacent, render_cell, generate_cell_key, get_coords_to_search, freeze
     '''
 
+    __slots__ = ('coord', 'bottom_left', 'occupied', 'edge', 'color')
+
 
     def __init__(self, coord = Coordinate(), bottom_left = Coordinate(), edge = -1, color = DEFAULT_COLOR):
         '''
@@ -151,19 +154,22 @@ class Cell:
         Parameters:
             N/A
         Returns:
-            A two-element list of lists of integers. Coordinates to search from this cell.
+            A two-element list of lists of integers, shared from the precomputed tables
+            and not to be modified. Coordinates to search from this cell.
         '''
-        res = []
         try:
-            x_to_search = [self.coord.x - 1, self.coord.x + 1]
-            if self.occupied.is_king:
-                y_to_search = [self.coord.y - 1, self.coord.y + 1]
-            else:
-                y_to_search = [self.coord.y + ( -1 ) ** self.occupied.player]
-            res.append(x_to_search)
-            res.append(y_to_search)
+            return SEARCH_COORDS[piece_kind(self.occupied.player, self.occupied.is_king)][self.coord.x][self.coord.y]
         except AttributeError:
-            NotImplemented
-        return res
+            return []
 
 
+    def freeze(self):
+        '''
+        Method -- freeze
+            Gets the immutable, hashable counterpart of this cell.
+        Parameters:
+            N/A
+        Returns:
+            The interned FrozenCell with the same coordinate.
+        '''
+        return CELLS[self.coord.x][self.coord.y]
@@ -0,0 +1,120 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To run the computer player's search on a background thread, off the Tk event loop
+'''
+
+
+import threading
+from metrics import METRICS
+
+
+class ComputerWorker:
+    '''
+    Class -- ComputerWorker
+        Runs one choose_move of a computer player on a daemon thread, so the window keeps
+        drawing and taking input while it searches. The UI polls done on its timer and takes
+        the move when the search is over. Cancelling asks the computer to stop and play the
+        best move found so far, which an iterative deepening Engine or an Mcts always has.
+        Each worker hands its own stop event to the search, so a cancel reaches that search
+        only, even one that has not started yet, and never the computer's next one.
+    Attributes:
+        computer -- an Engine, ParallelEngine or Mcts, anything whose choose_move takes a stop event
+        thread -- a threading.Thread running the search, None before start
+        move -- a Move, the result, None until the search is over or if there is no move
+        error -- an Exception raised by the search, None if none was
+        cancelled -- a boolean, True once cancel was called before the search was over
+        stop_event -- a threading.Event, given to the search and set by cancel
+    Methods:
+        start, run, done, take, cancel
+    '''
+
+
+    def __init__(self, computer):
+        '''
+        Constructor -- creates a new instance of ComputerWorker, not started.
+        Parameters:
+            self -- the current ComputerWorker object
+            computer -- an Engine, ParallelEngine or Mcts
+        '''
+        self.computer = computer
+        self.thread = None
+        self.move = None
+        self.error = None
+        self.cancelled = False
+        self.stop_event = threading.Event()
+
+
+    def start(self, board):
+        '''
+        Method -- start
+            Starts searching a position on a new thread.
+        Parameters:
+            board -- a Bitboard, owned by the worker from now on
+        Returns:
+            N/A
+        '''
+        self.thread = threading.Thread(target = self.run, args = (board,), name = 'computer', daemon = True)
+        self.thread.start()
+
+
+    def run(self, board):
+        '''
+        Method -- run
+            Searches a position, on the worker thread, keeping the move or the error.
+        Parameters:
+            board -- a Bitboard
+        Returns:
+            N/A
+        '''
+        start = METRICS.start()
+        try:
+            self.move = self.computer.choose_move(board, self.stop_event)
+        except Exception as error:
+            self.error = error
+        METRICS.stop('ai_think', start)
+
+
+    def done(self):
+        '''
+        Method -- done
+            Tells whether the search is over, without waiting.
+        Parameters:
+            N/A
+        Returns:
+            A boolean.
+        '''
+        return self.thread is not None and not self.thread.is_alive()
+
+
+    def take(self):
+        '''
+        Method -- take
+            Gets the move, waiting for the search if it is not over.
+        Parameters:
+            N/A
+        Returns:
+            A Move, None if the player to move has lost.
+        Raises:
+            The exception the search raised, if any.
+        '''
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+        return self.move
+
+
+    def cancel(self):
+        '''
+        Method -- cancel
+            Asks the search to stop and play its best move so far, even one that has not
+            started yet. Does nothing once the search is over.
+        Parameters:
+            N/A
+        Returns:
+            N/A
+        '''
+        if self.done():
+            return
+        self.cancelled = True
+        self.stop_event.set()
@@ -15,6 +15,8 @@ class Coordinate:
         increment_x, increment_y, add_x, add_y, add
     '''
 
+    __slots__ = ('x', 'y')
+
 
     def __init__(self, x = 0, y = 0):
         '''
@@ -0,0 +1,563 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To render the game of Checkers with turtle, on top of a headless State
+'''
+
+
+import time
+import traceback
+import turtle
+from cell import Cell
+from square_renderer import SquareRenderer
+from piece_shapes import register_piece_shapes, shape_name
+from frame_scheduler import FrameScheduler
+
+
+OUT_TIME = 30
+LINE_COLOR = 'black'
+BOARD_COLOR = 'white'
+BRUSH_COLOR = 'dark blue'
+OUT_COLORS = ['red', 'green', 'blue', 'magenta', 'yellow', 'cyan']
+
+FONT = 'Arial'
+FONT_SIZE = 18
+FONT_SIZE_BRUSH = 40
+FONT_TYPE_HEADER = 'bold'
+FONT_TYPE_TEXT = 'normal'
+
+HUMAN = 0
+PLAYER_PROMPT = ['your', 'my']
+GAME_OVER = ['lose', 'win']
+
+AUTO_DELAY = 500
+SLIDE_TIME = 0.15
+CROWN_SIZES = (1.2, 1.4, 1.2)
+WELCOME_LINES = ('Welcome to the game!', 'This is Mr.Robot playing!')
+CANCEL_KEY = 'space'
+THINKING_DOTS = 3
+THINKING_STEP = 0.3
+
+
+class Display:
+    '''
+    Class -- Display
+
+    Attributes:
+        num_cells -- an integer, the number of cells per row / column
+        cell_size -- an integer, the edge length of each cell
+        piece_radius -- an integer, the radius of the piece
+        board_size -- an integer, the edge length of the checkerboard
+        screen -- a turtle screen to draw the UI
+        pen -- a turtle pen to render the checkeerboard
+        renderer -- a SquareRenderer showing the pieces, one shaped turtle per square
+        pen_out -- a turtle pen for visual effects of capture moves
+        pen_header -- a turtle pen for game information updates
+        pen_guide -- a turtle pen for guiding the human player
+        pen_click -- a turtle pen for click error prompts
+        pen_brush -- a turtle pen for welcome page and winner prompts
+        pen_brush_steps -- a turtle pen for steps updating
+        pen_slide -- a turtle wearing the shape of a moving piece
+        scheduler -- a FrameScheduler running the redraws and animations
+        effects -- a list of generators, the queued move, capture and crowning animations
+        checkerboard -- a 2D list of cells, the board render_pieces was last given
+
+    Methods:
+        run
+        think
+        clear_click
+        burst
+        slide
+        crown
+        request_pieces
+        print_welcome
+        print_win
+        print_cell_coord
+        print_click
+        print_invalid_piece
+        print_invalid_move
+        print_turn
+        print_capture
+        render_board
+        render_pieces
+        queue_effect
+        run_effects
+        burst_frames
+        slide_frames
+        crown_frames
+        welcome_frames
+        thinking_frames
+        tint
+    '''
+
+    def __init__(self, state):
+        '''
+        Constructor -- creates a new instance of Display and opens the turtle window.
+        Parameters:
+            self -- the current Display object
+            state -- a State, whose geometry the window is sized for
+        '''
+        self.num_cells = state.num_cells
+        self.cell_size = state.cell_size
+        self.piece_radius = state.piece_radius
+        self.board_size = state.board_size
+
+        turtle.setup(state.window_size, state.window_size + self.cell_size)
+        turtle.screensize(self.board_size, self.board_size)
+        turtle.bgcolor(BOARD_COLOR)
+        turtle.tracer(0, 0)
+
+        self.screen = turtle.Screen()
+        self.pen = turtle.Turtle()
+        self.pen.hideturtle()
+        self.pen_out = turtle.Turtle()
+        self.pen_out.hideturtle()
+        self.pen_header = turtle.Turtle()
+        self.pen_header.hideturtle()
+        self.pen_guide = turtle.Turtle()
+        self.pen_guide.hideturtle()
+        self.pen_click = turtle.Turtle()
+        self.pen_click.hideturtle()
+        self.pen_brush = turtle.Turtle()
+        self.pen_brush.hideturtle()
+        self.pen_brush_steps = turtle.Turtle()
+        self.pen_brush_steps.hideturtle()
+        register_piece_shapes(self.screen, state.piece_colors, self.piece_radius)
+        self.pen_slide = turtle.Turtle()
+        self.pen_slide.hideturtle()
+        self.pen_slide.penup()
+        self.renderer = SquareRenderer(self.num_cells, self.cell_size, (- self.board_size / 2, - self.board_size / 2),
+                                       self.screen)
+        self.scheduler = FrameScheduler(self.screen)
+        self.effects = []
+        self.checkerboard = None
+
+
+    def run(self, click_handler, cancel_handler = None):
+        '''
+        Method -- run
+            Hands clicks to the game and keeps the window open.
+        Parameters:
+            click_handler -- a function of the click coordinate
+            cancel_handler -- a function of no argument, called when CANCEL_KEY is pressed, None for none
+        Returns:
+            N/A, but keeps the game running.
+        '''
+        self.screen.onclick(click_handler)
+        if cancel_handler:
+            self.screen.onkey(cancel_handler, CANCEL_KEY)
+            self.screen.listen()
+        turtle.done()
+
+
+    def think(self, worker, on_done):
+        '''
+        Method -- think
+            Shows that the computer is thinking until its ComputerWorker is done, polling it
+            every frame, then hands over the move.
+        Parameters:
+            worker -- a ComputerWorker, started
+            on_done -- a function of the Move found, None if the search failed
+        Returns:
+            N/A, but calls on_done in a coming frame.
+        '''
+        self.scheduler.animate(self.thinking_frames(worker, on_done))
+
+
+    def clear_click(self):
+        '''
+        Method -- clear_click
+            Clears the click error prompt.
+        Parameters:
+            N/A
+        Returns:
+            N/A, but clears the prompt.
+        '''
+        self.pen_click.clear()
+
+
+    def burst(self, x, y):
+        '''
+        Method -- burst
+            Queues a burst effect on a cell on the checkerboard.
+        Parameters:
+            x -- an integer, the column of the cell
+            y -- an integer, the row of the cell
+        Returns:
+            N/A, but renders a visual effect to the cell in the coming frames.
+        '''
+        self.queue_effect(self.burst_frames(x, y))
+
+
+    def slide(self, from_x, from_y, to_x, to_y, player, is_king):
+        '''
+        Method -- slide
+            Queues the slide of a piece, hiding the cell it moves to until the slide ends.
+        Parameters:
+            from_x -- an integer, the column the piece comes from
+            from_y -- an integer, the row the piece comes from
+            to_x -- an integer, the column the piece moves to
+            to_y -- an integer, the row the piece moves to
+            player -- an integer, the player of the piece
+            is_king -- a boolean, True if the piece was a king before the move
+        Returns:
+            N/A, but moves the piece in the coming frames.
+        '''
+        self.renderer.hold(to_x, to_y)
+        self.queue_effect(self.slide_frames(from_x, from_y, to_x, to_y, shape_name(player, is_king)))
+
+
+    def crown(self, x, y):
+        '''
+        Method -- crown
+            Queues the crowning effect of a piece.
+        Parameters:
+            x -- an integer, the column of the piece
+            y -- an integer, the row of the piece
+        Returns:
+            N/A, but renders a visual effect to the piece in the coming frames.
+        '''
+        self.queue_effect(self.crown_frames(x, y))
+
+
+    def print_welcome(self):
+        '''
+        Method -- print_welcome
+            Prints the welcome page to the UI when the game starts.
+        Parameters:
+            N/A
+        Returns:
+            N/A, but prints the welcome page to the UI.
+        '''
+        self.scheduler.animate(self.welcome_frames())
+
+
+    def print_win(self, turn, move_count):
+        '''
+        Method -- print_win
+            Prints the winner prompts to the UI when the game is over.
+        Parameters:
+            turn -- an integer, the player who has no valid move left
+            move_count -- an integer, steps taken in the game
+        Returns:
+            N/A, but prints the winner prompts to the UI.
+        '''
+        if turn == HUMAN:
+            out_str = 'Ahhh!  '
+        else:
+            out_str = 'Congrats! '
+        out_str += 'You ' + GAME_OVER[turn] + '!'
+        self.pen_brush.write(out_str, align = 'center', font = (FONT, FONT_SIZE_BRUSH, FONT_TYPE_TEXT))
+        out_steps = 'After ' + str(move_count) + ' steps.'
+        self.pen_brush_steps.write(out_steps, align = 'center', font = (FONT, FONT_SIZE_BRUSH, FONT_TYPE_TEXT))
+
+
+    def print_cell_coord(self, col, row):
+        '''
+        Method -- print_cell_coord
+            Prints the coordinate of a cell on the checkerboard to the UI.
+        Parameters:
+            col -- an integer, column number of the cell
+            row -- an integer, row number of the cell
+        Returns:
+            N/A, but prints the coordinate of a cell on the checkerboard to the UI.
+        '''
+        self.pen_click.clear()
+        self.pen_click.write('Cell ' + str(col) +  ' ' + str(row) + ' ' + 'on the board.', font = (FONT, FONT_SIZE, FONT_TYPE_TEXT))
+
+
+    def print_click(self, x, y):
+        '''
+        Method -- print_click
+            Prints the coordinate of the clicked cell to the UI.
+        Parameters:
+            x -- an integer, the X coordinate from the caller
+            y -- an integer, the Y coordinate from the caller
+        Returns:
+            N/A, but prints the coordinate of the clicked cell to the UI.
+        '''
+        self.pen_click.clear()
+        self.pen_click.write('Clicked at ' + str(x) + str(y), font = (FONT, FONT_SIZE, FONT_TYPE_TEXT))
+
+
+    def print_invalid_piece(self, color):
+        '''
+        Method -- print_invalid_piece
+            Prompts a notice to the UI that the selected piece is invalid to move.
+        Parameters:
+            color -- a string, the piece color of the player to move
+        Returns:
+            N/A, but prompts a notice to the UI that the piece is invalid.
+        '''
+        self.pen_click.clear()
+        self.pen_click.write('Not a valid ' + str(color) + ' piece. Try again.', font = (FONT, FONT_SIZE, FONT_TYPE_TEXT))
+
+
+    def print_invalid_move(self):
+        '''
+        Method -- print_invalid_piece
+            Prompts a notice to the UI that the selected cell is invalid to move to.
+        Parameters:
+            N/A
+        Returns:
+            N/A, but prompts a notice to the UI that the cell is invalid.
+        '''
+        self.pen_click.clear()
+        self.pen_click.write('Not a valid move. Try diagnally. Capture if possible.', font = (FONT, FONT_SIZE, FONT_TYPE_TEXT))
+
+
+    def print_turn(self, turn, move_count, color):
+        '''
+        Method -- print_invalid_piece
+            Prints whose turn it is when the player is switched.
+        Parameters:
+            turn -- an integer, the player to move
+            move_count -- an integer, steps taken in the game
+            color -- a string, the piece color of the player to move
+        Returns:
+            N/A, but prints whose turn it is.
+        '''
+        self.pen_header.clear()
+        self.pen_header.write('Checkers!   Move: ' + str(move_count) + "   It's " + PLAYER_PROMPT[turn] + ' turn. ', font = (FONT, FONT_SIZE, FONT_TYPE_HEADER))
+        self.pen_guide.clear()
+        if turn == HUMAN:
+            self.pen_guide.write('Move a ' + color + ' piece by clicking it and a cell.', font = (FONT, FONT_SIZE, FONT_TYPE_TEXT))
+
+
+    def print_capture(self):
+        '''
+        Method -- print_invalid_piece
+            Prompts a notice to the UI that the player should keep capturing.
+        Parameters:
+            N/A
+        Returns:
+            N/A, but prompts a notice to the UI that the player should keep capturing.
+        '''
+        self.pen_guide.clear()
+        self.pen_guide.color('dark red')
+        self.pen_guide.write('Keep capturing with this piece by clicking a cell!', font = (FONT, FONT_SIZE, FONT_TYPE_TEXT))
+        self.pen_guide.color('black')
+
+
+    def render_board(self, checkerboard):
+        '''
+        Method -- render_board
+            Draw the checkerboard with white and gray cells at the beginning of the game.
+        Parameters:
+            checkerboard -- a 2D list of cells to draw
+        Returns:
+            N/A. Draws checkerboard with white and gray cells.
+        '''
+        self.pen.penup()
+        self.pen.color(LINE_COLOR, BOARD_COLOR)
+
+        corner = - self.board_size / 2
+        self.pen.setposition(corner, corner)
+        self.pen_header.setposition(- self.board_size / 2, self.board_size / 2 + self.cell_size / 2)
+        self.pen_guide.setposition(- self.board_size / 2, self.board_size / 2)
+        self.pen_click.setposition(- self.board_size / 2, - self.board_size / 2 - self.cell_size / 2)
+
+        self.pen_brush.up()
+        self.pen_brush.setposition(0, 0)
+        self.pen_brush.color(BRUSH_COLOR)
+
+        self.pen_brush_steps.up()
+        self.pen_brush_steps.setposition(0, - self.cell_size)
+        self.pen_brush_steps.color(BRUSH_COLOR)
+
+        self.print_welcome()
+
+        large_cell = Cell(edge = self.board_size)
+        large_cell.render_cell(self.pen)
+
+        for col in range(self.num_cells):
+            for row in range(self.num_cells):
+                if col % 2 != row % 2:
+                    cell = checkerboard[col][row]
+                    self.pen.setposition(cell.bottom_left.x, cell.bottom_left.y)
+                    cell.render_cell(self.pen)
+        self.renderer.invalidate()
+
+
+    def render_pieces(self, checkerboard):
+        '''
+        Method -- render_pieces
+            Asks for the squares whose piece changed to be redrawn on the next frame.
+        Parameters:
+            checkerboard -- a 2D list of cells to draw the pieces of
+        Returns:
+            N/A. Draws pieces on the next frame.
+        '''
+        self.checkerboard = checkerboard
+        self.request_pieces()
+
+
+    def request_pieces(self):
+        '''
+        Method -- request_pieces
+            Asks for the pieces to be redrawn on the next frame, once however many times it is asked.
+        Parameters:
+            N/A
+        Returns:
+            N/A
+        '''
+        self.scheduler.request_redraw('pieces', lambda: self.renderer.render(self.checkerboard, False))
+
+
+    def queue_effect(self, effect):
+        '''
+        Method -- queue_effect
+            Queues an animation to play after the ones queued before, so the moves and captures
+            of a turn play in order even when the turn itself was computed at once.
+        Parameters:
+            effect -- a generator, drawing one frame per step
+        Returns:
+            N/A
+        '''
+        self.effects.append(effect)
+        if len(self.effects) == 1:
+            self.scheduler.animate(self.run_effects())
+
+
+    def run_effects(self):
+        '''
+        Method -- run_effects
+            The animation playing the queued effects one after the other.
+        Parameters:
+            N/A
+        Returns:
+            A generator.
+        '''
+        while self.effects:
+            yield from self.effects[0]
+            self.effects.pop(0)
+
+
+    def burst_frames(self, x, y):
+        '''
+        Method -- burst_frames
+            Flashes every color of OUT_COLORS for OUT_TIME on a cell, then clears it.
+        Parameters:
+            x -- an integer, the column of the cell
+            y -- an integer, the row of the cell
+        Returns:
+            A generator.
+        '''
+        self.pen_out.up()
+        self.pen_out.setposition(self.renderer.position(x, y))
+        for color in OUT_COLORS:
+            self.tint(color)
+            yield from self.scheduler.wait(OUT_TIME / 1000)
+        self.pen_out.clear()
+
+
+    def slide_frames(self, from_x, from_y, to_x, to_y, shape):
+        '''
+        Method -- slide_frames
+            Slides a piece from a cell to another over SLIDE_TIME, then shows it on the board
+            again, on the cell held since the move was queued.
+        Parameters:
+            from_x -- an integer, the column the piece comes from
+            from_y -- an integer, the row the piece comes from
+            to_x -- an integer, the column the piece moves to
+            to_y -- an integer, the row the piece moves to
+            shape -- a string, the registered shape of the piece
+        Returns:
+            A generator.
+        '''
+        start_x, start_y = self.renderer.position(from_x, from_y)
+        end_x, end_y = self.renderer.position(to_x, to_y)
+        self.pen_slide.shape(shape)
+        self.pen_slide.setposition(start_x, start_y)
+        self.pen_slide.showturtle()
+        start = time.perf_counter()
+        progress = 0
+        while progress < 1:
+            yield
+            progress = min(1, (time.perf_counter() - start) / SLIDE_TIME)
+            self.pen_slide.setposition(start_x + (end_x - start_x) * progress, start_y + (end_y - start_y) * progress)
+        self.renderer.release(to_x, to_y)
+        self.request_pieces()
+        yield
+        self.pen_slide.hideturtle()
+
+
+    def crown_frames(self, x, y):
+        '''
+        Method -- crown_frames
+            Swells a newly crowned piece and shrinks it back to its size.
+        Parameters:
+            x -- an integer, the column of the piece
+            y -- an integer, the row of the piece
+        Returns:
+            A generator.
+        '''
+        pen = self.renderer.pen_at(x, y)
+        for size in CROWN_SIZES:
+            pen.shapesize(size, size)
+            yield from self.scheduler.wait(OUT_TIME / 1000)
+        pen.shapesize(1, 1)
+
+
+    def welcome_frames(self):
+        '''
+        Method -- welcome_frames
+            Shows the two welcome lines for AUTO_DELAY each.
+        Parameters:
+            N/A
+        Returns:
+            A generator.
+        '''
+        for line in WELCOME_LINES:
+            self.pen_brush.clear()
+            self.pen_brush.write(line, align = 'center', font = (FONT, FONT_SIZE_BRUSH, FONT_TYPE_TEXT))
+            yield from self.scheduler.wait(AUTO_DELAY / 1000)
+        self.pen_brush.clear()
+
+
+    def thinking_frames(self, worker, on_done):
+        '''
+        Method -- thinking_frames
+            Cycles the dots of the thinking indicator while the worker searches. A search that
+            raised is reported and hands over None, so the game goes on.
+        Parameters:
+            worker -- a ComputerWorker, started
+            on_done -- a function of the Move found, None if the search failed
+        Returns:
+            A generator.
+        '''
+        start = time.perf_counter()
+        dots = -1
+        while not worker.done():
+            step = int((time.perf_counter() - start) / THINKING_STEP) % (THINKING_DOTS + 1)
+            if step != dots:
+                dots = step
+                self.pen_guide.clear()
+                self.pen_guide.write('Thinking' + '.' * dots + '   Press ' + CANCEL_KEY + ' to make me move now.',
+                                     font = (FONT, FONT_SIZE, FONT_TYPE_TEXT))
+            yield
+        self.pen_guide.clear()
+        try:
+            move = worker.take()
+        except Exception:
+            traceback.print_exc()
+            move = None
+        on_done(move)
+
+
+    def tint(self, color):
+        '''
+        Method -- tint
+            Perform a color flashing across the board.
+        Parameters:
+            color -- a string, the color to flash.
+        Returns:
+            N/A. Performs a color flashing across the board.
+        '''
+        self.pen_out.clear()
+        self.pen_out.color(color)
+        self.pen_out.begin_fill()
+        self.pen_out.down()
+        self.pen_out.circle(self.piece_radius)
+        self.pen_out.end_fill()
+        self.pen_out.up()
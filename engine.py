@@ -0,0 +1,388 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To search for the computer player's moves with negamax alpha-beta
+'''
+
+
+import threading
+import time
+from bitboard import BLACK
+from transposition import TranspositionTable, EXACT, LOWER, UPPER
+from move_picker import MovePicker
+from tables import NUM_DARK_SQUARES
+from metrics import METRICS
+
+
+MAN_VALUE = 100
+KING_VALUE = 160
+ADVANCE_VALUE = 4
+WIN_SCORE = 100000
+MAX_PLY = 128
+CHECK_INTERVAL = 1024
+
+DEFAULT_DEPTH = 64
+DEFAULT_TIME = 1.0
+
+# Men of each player that have crossed into the opponent's half of the board.
+ADVANCED = (0x0FFF0000, 0x0000FFF0)
+
+
+class SearchAborted(Exception):
+    '''
+    Class -- SearchAborted
+        Raised inside the search when the budget runs out or the search is cancelled.
+    '''
+
+
+def evaluate(board):
+    '''
+    Function -- evaluate
+        Scores a position from the point of view of the player to move.
+    Parameters:
+        board -- a Bitboard
+    Returns:
+        An integer, positive when the player to move is ahead.
+    '''
+    black_men = board.black & ~board.kings
+    red_men = board.red & ~board.kings
+    score = MAN_VALUE * (black_men.bit_count() - red_men.bit_count()) + \
+            KING_VALUE * ((board.black & board.kings).bit_count() - (board.red & board.kings).bit_count()) + \
+            ADVANCE_VALUE * ((black_men & ADVANCED[BLACK]).bit_count() - (red_men & ADVANCED[1 - BLACK]).bit_count())
+    return score if board.turn == BLACK else -score
+
+
+def score_to_table(score, ply):
+    '''
+    Function -- score_to_table
+        Converts a score to store in the table. Win scores count the plies from the root,
+        so they are stored as plies from the position itself, which may be reached at any ply.
+    Parameters:
+        score -- an integer, a score from the point of view of the player to move
+        ply -- an integer, the distance of the position from the root
+    Returns:
+        An integer, the score to store.
+    '''
+    if score >= WIN_SCORE - MAX_PLY:
+        return score + ply
+    if score <= MAX_PLY - WIN_SCORE:
+        return score - ply
+    return score
+
+
+def tablebase_score(value, ply):
+    '''
+    Function -- tablebase_score
+        Converts a tablebase value to a search score, counting its distance to the end like
+        a win or loss found by the search.
+    Parameters:
+        value -- an integer, as returned by Tablebase.probe
+        ply -- an integer, the distance from the root
+    Returns:
+        An integer, the score for the player to move.
+    '''
+    if value > 0:
+        return WIN_SCORE - ply - value
+    if value < 0:
+        return ply - value - 1 - WIN_SCORE
+    return 0
+
+
+def score_from_table(score, ply):
+    '''
+    Function -- score_from_table
+        Converts a stored score back to a score relative to the root, undoing score_to_table.
+    Parameters:
+        score -- an integer, a score read from the table
+        ply -- an integer, the distance of the position from the root
+    Returns:
+        An integer, the score from the point of view of the player to move.
+    '''
+    if score >= WIN_SCORE - MAX_PLY:
+        return score - ply
+    if score <= MAX_PLY - WIN_SCORE:
+        return score + ply
+    return score
+
+
+class Engine:
+    '''
+    Class -- Engine
+    Attributes:
+        max_depth -- an integer, the deepest iteration to search
+        time_limit -- a float, seconds per search, None for no limit
+        node_limit -- an integer, nodes per search, None for no limit
+        nodes -- an integer, nodes visited by the last search
+        depth -- an integer, the deepest iteration the last search completed
+        deadline -- a float, the time.perf_counter() value the search must stop at
+        table -- a TranspositionTable, kept from one search to the next
+        stop_event -- an Event, possibly shared with other processes, set to stop the running search, replaced by each search
+        killers -- a list of pairs of Move, per ply, the last non-capture moves that caused a cutoff
+        history -- a list of integers, per (from, to) pair, the depth-weighted cutoffs of non-capture moves
+        tablebase -- a Tablebase giving the exact result of endgames, None if unused
+        book -- an OpeningBook answering known openings without a search, None if unused
+        verbose -- a boolean, True to print the result of every choose_move
+    Methods:
+        choose_move, search, begin_search, search_move, search_root, negamax, check_budget, cancel
+    '''
+
+
+    def __init__(self, max_depth = DEFAULT_DEPTH, time_limit = DEFAULT_TIME, node_limit = None, table = None,
+                 tablebase = None, book = None, verbose = False):
+        '''
+        Constructor -- creates a new instance of Engine.
+        Parameters:
+            self -- the current Engine object
+            max_depth -- an integer, the deepest iteration to search
+            time_limit -- a float, seconds per search, None for no limit
+            node_limit -- an integer, nodes per search, None for no limit
+            table -- a TranspositionTable, None for a new one of the default capacity
+            tablebase -- a Tablebase, None to search endgames like any other position
+            book -- an OpeningBook, None to search every position
+            verbose -- a boolean, True to print the result of every choose_move
+        '''
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.nodes = 0
+        self.depth = 0
+        self.deadline = None
+        self.table = TranspositionTable() if table is None else table
+        self.stop_event = None
+        self.killers = [[None, None] for ply in range(MAX_PLY + 1)]
+        self.history = [0] * (NUM_DARK_SQUARES * NUM_DARK_SQUARES)
+        self.tablebase = tablebase
+        self.book = book
+        self.verbose = verbose
+
+
+    def choose_move(self, board, stop_event = None):
+        '''
+        Method -- choose_move
+            Picks the move to play in a position, from the book if it has the position. The
+            depth, nodes and table probes of the search are added to the metrics.
+        Parameters:
+            board -- a Bitboard, with the engine's side to move
+            stop_event -- an Event belonging to this move only, set to stop its search, None for a new one
+        Returns:
+            A Move, None if the player to move has lost.
+        '''
+        moves = board.generate_moves()
+        if len(moves) <= 1:
+            return moves[0] if moves else None
+        if self.book:
+            move = self.book.choose_move(board)
+            if move:
+                if self.verbose:
+                    print('engine: book move', move)
+                METRICS.inc('book_moves')
+                return move
+        table = self.table
+        hits, misses, collisions = table.hits, table.misses, table.collisions
+        line, score = self.search(board, stop_event)
+        METRICS.inc('engine_searches')
+        METRICS.inc('engine_depth', self.depth)
+        METRICS.inc('engine_nodes', self.nodes)
+        METRICS.inc('table_hits', table.hits - hits)
+        METRICS.inc('table_misses', table.misses - misses)
+        METRICS.inc('table_collisions', table.collisions - collisions)
+        if self.verbose:
+            print('engine: depth', self.depth, 'nodes', self.nodes, 'score', score, 'line', ' '.join(str(move) for move in line))
+            print('table: hits', table.hits, 'misses', table.misses, 'collisions', table.collisions,
+                  'filled', table.filled(), '/', table.capacity)
+        return line[0] if line else None
+
+
+    def search(self, board, stop_event = None):
+        '''
+        Method -- search
+            Searches a position with iterative deepening until the depth, time or node budget
+            runs out, or the stop event is set. The result of the deepest completed iteration is
+            kept. The budget is checked every CHECK_INTERVAL nodes, so a stop event set before the
+            search starts stops it at the first check, with the first move generated if no
+            iteration completed by then.
+        Parameters:
+            board -- a Bitboard
+            stop_event -- an Event belonging to this search only, None for a new one, set by cancel
+        Returns:
+            A tuple (line, score): the best line as a list of Move, and its score for the player to move.
+        '''
+        self.begin_search(stop_event)
+        moves = board.generate_moves()
+        if not moves:
+            return [], -WIN_SCORE
+        best_line, best_score = [moves[0]], 0
+        for depth in range(1, self.max_depth + 1):
+            try:
+                score, line = self.search_root(board, moves, depth)
+            except SearchAborted:
+                break
+            best_line, best_score = line, score
+            self.depth = depth
+            moves.remove(line[0])
+            moves.insert(0, line[0])
+            if abs(score) >= WIN_SCORE - MAX_PLY:
+                break
+        return best_line, best_score
+
+
+    def begin_search(self, stop_event = None):
+        '''
+        Method -- begin_search
+            Resets the counters and the budget, and ages the move ordering data, before a search.
+            The search stops on its own stop event only, so a cancel aimed at an earlier search,
+            even one arriving after it returned, never reaches this one.
+        Parameters:
+            stop_event -- an Event belonging to the search, None for a new one
+        Returns:
+            N/A, but starts the clock of the time limit.
+        '''
+        self.stop_event = threading.Event() if stop_event is None else stop_event
+        self.nodes = 0
+        self.depth = 0
+        self.deadline = None if self.time_limit is None else time.perf_counter() + self.time_limit
+        self.killers = [[None, None] for ply in range(MAX_PLY + 1)]
+        self.history = [score // 2 for score in self.history]
+
+
+    def search_move(self, board, move, depth, alpha = -WIN_SCORE - 1, beta = WIN_SCORE + 1, stop_event = None):
+        '''
+        Method -- search_move
+            Searches a single root move to a fixed depth within a window, deepening one ply at a
+            time to fill the table and the move ordering first. Used to split the root between processes.
+        Parameters:
+            board -- a Bitboard
+            move -- a Move of the player to move
+            depth -- an integer, the depth of the search, the move itself included
+            alpha -- an integer, the score the player to move is already sure of
+            beta -- an integer, the score the opponent is already sure of
+            stop_event -- an Event belonging to this search only, None for a new one
+        Returns:
+            A tuple (score, line): the score of the move for the player to move, and the line it starts.
+            A score of alpha or less only bounds the move from above, one of beta or more from below.
+            Raises SearchAborted when the budget runs out first.
+        '''
+        self.begin_search(stop_event)
+        child = board.apply_move(move)
+        for child_depth in range(depth):
+            score, line = self.negamax(child, child_depth, -beta, -alpha, 1)
+            self.depth = child_depth + 1
+        return -score, [move] + line
+
+
+    def search_root(self, board, moves, depth):
+        '''
+        Method -- search_root
+            Searches every root move to a fixed depth.
+        Parameters:
+            board -- a Bitboard
+            moves -- a list of Move, the root moves, best guess first
+            depth -- an integer, the depth of this iteration
+        Returns:
+            A tuple (score, line).
+        '''
+        alpha = -WIN_SCORE - 1
+        best_line = []
+        for move in moves:
+            score, line = self.negamax(board.apply_move(move), depth - 1, -WIN_SCORE - 1, -alpha, 1)
+            score = -score
+            if score > alpha or not best_line:
+                alpha = score
+                best_line = [move] + line
+        return alpha, best_line
+
+
+    def negamax(self, board, depth, alpha, beta, ply):
+        '''
+        Method -- negamax
+            Searches a position with alpha-beta pruning. Captures are mandatory, so positions
+            with a capture pending are searched past the depth limit instead of being evaluated.
+            Positions found in the table at a sufficient depth return their stored score. Moves
+            come from a MovePicker, so a cutoff skips generating the later stages. Endgames
+            covered by the tablebase return their exact result without searching.
+        Parameters:
+            board -- a Bitboard
+            depth -- an integer, the remaining depth
+            alpha -- an integer, the score the player to move is already sure of
+            beta -- an integer, the score the opponent is already sure of
+            ply -- an integer, the distance from the root
+        Returns:
+            A tuple (score, line).
+        '''
+        self.nodes += 1
+        if self.nodes % CHECK_INTERVAL == 0 or self.nodes == self.node_limit:
+            self.check_budget()
+        tablebase = self.tablebase
+        if tablebase and (board.black | board.red).bit_count() <= tablebase.max_pieces:
+            value = tablebase.probe(board)
+            if value is not None:
+                return tablebase_score(value, ply), []
+        if (depth <= 0 or ply >= MAX_PLY) and not board.has_capture():
+            return evaluate(board), []
+        entry = self.table.probe(board.key)
+        table_move = None
+        if entry:
+            entry_depth, score, bound, table_move = entry
+            if entry_depth >= depth:
+                score = score_from_table(score, ply)
+                if bound == EXACT or (bound == LOWER and score >= beta) or (bound == UPPER and score <= alpha):
+                    return score, [table_move] if table_move else []
+        original_alpha = alpha
+        best_line = []
+        searched = 0
+        killers = self.killers[ply]
+        for move in MovePicker(board, table_move, killers, self.history):
+            searched += 1
+            score, line = self.negamax(board.apply_move(move), depth - 1, -beta, -alpha, ply + 1)
+            score = -score
+            if score > alpha:
+                alpha = score
+                best_line = [move] + line
+                if alpha >= beta:
+                    if not move.captured:
+                        if move != killers[0]:
+                            killers[1] = killers[0]
+                            killers[0] = move
+                        if depth > 0:
+                            self.history[move.path[0] * NUM_DARK_SQUARES + move.path[-1]] += depth * depth
+                    break
+        if not searched:
+            return ply - WIN_SCORE, []
+        if alpha >= beta:
+            bound = LOWER
+        elif alpha > original_alpha:
+            bound = EXACT
+        else:
+            bound = UPPER
+        self.table.store(board.key, depth, score_to_table(alpha, ply), bound, best_line[0] if best_line else None)
+        return alpha, best_line
+
+
+    def check_budget(self):
+        '''
+        Method -- check_budget
+            Aborts the search when it is cancelled or out of time or nodes.
+        Parameters:
+            N/A
+        Returns:
+            N/A, but raises SearchAborted when the search must stop.
+        '''
+        if (self.stop_event is not None and self.stop_event.is_set()) or \
+           (self.deadline is not None and time.perf_counter() >= self.deadline) or \
+           (self.node_limit is not None and self.nodes >= self.node_limit):
+            raise SearchAborted()
+
+
+    def cancel(self):
+        '''
+        Method -- cancel
+            Asks a running search, possibly on another thread, to stop and return its best line so far.
+            The next search does not see it: to stop a search that may not have started yet,
+            pass it a stop event and set that instead.
+        Parameters:
+            N/A
+        Returns:
+            N/A, but sets the stop event of the running or last search.
+        '''
+        if self.stop_event is not None:
+            self.stop_event.set()
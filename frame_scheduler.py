@@ -0,0 +1,203 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To draw the UI in frames on a fixed tick, running animations and coalescing redraws between input events
+'''
+
+
+import time
+from metrics import METRICS
+
+
+DEFAULT_FPS = 60
+# Share of a frame the work of a tick may take before the remaining animations wait for the next one.
+BUDGET_SHARE = 0.5
+
+
+class FrameScheduler:
+    '''
+    Class -- FrameScheduler
+        Runs the UI work of the turtle window in frames, on the screen's timer, so that drawing
+        never runs inside a click handler for longer than it takes to queue it. Each tick:
+            1. calls every redraw requested since the last tick, once per key, however many
+               times it was requested, so a capture of three hops draws the pieces once;
+            2. advances every running animation by one step, until the frame-time budget is
+               spent, the animations left over going first on the next tick, at least one
+               advancing every tick;
+            3. updates the screen once, if anything was drawn.
+        An animation is a generator: each step draws one frame and yields, and returning ends
+        it. Ticks are only scheduled while there is work, and are spaced to keep the frame rate
+        fixed: each one aims at a deadline one interval after the last, so the time a tick took
+        and a timer firing late are taken off the wait for the next one. Each tick is
+        timed in METRICS as frame_seconds, and each overrun counted as frame_overruns.
+        A redraw or animation that raises is dropped, and the work still pending keeps its ticks.
+    Attributes:
+        screen -- a turtle screen, providing ontimer and update
+        interval -- an integer, the milliseconds between two ticks
+        due -- a float, the time.perf_counter() value the running tick was due at, None when idle
+        budget -- a float, the seconds of work a tick may do before deferring animations
+        redraws -- a dict mapping a key to the function redrawing it, pending for the next tick
+        animations -- a list of generators, the running animations
+        ticking -- a boolean, True while a tick is scheduled or running
+        frames -- an integer, the ticks run
+        overruns -- an integer, the ticks that spent the budget and deferred animations
+    Methods:
+        request_redraw, animate, after, wait, tick, wake, idle
+    '''
+
+
+    def __init__(self, screen, fps = DEFAULT_FPS, budget = None):
+        '''
+        Constructor -- creates a new instance of FrameScheduler, idle.
+        Parameters:
+            self -- the current FrameScheduler object
+            screen -- a turtle screen
+            fps -- an integer, the frames per second
+            budget -- a float, the seconds of work per tick, None for BUDGET_SHARE of a frame
+        '''
+        self.screen = screen
+        self.interval = max(1, round(1000 / fps))
+        self.due = None
+        self.budget = budget if budget is not None else BUDGET_SHARE / fps
+        self.redraws = {}
+        self.animations = []
+        self.ticking = False
+        self.frames = 0
+        self.overruns = 0
+
+
+    def request_redraw(self, key, function):
+        '''
+        Method -- request_redraw
+            Asks for a function to be called on the next tick. A later request with the same key
+            replaces an earlier one still pending.
+        Parameters:
+            key -- a hashable, what the function redraws
+            function -- a function of no argument
+        Returns:
+            N/A
+        '''
+        self.redraws[key] = function
+        self.wake()
+
+
+    def animate(self, animation):
+        '''
+        Method -- animate
+            Starts an animation on the next tick.
+        Parameters:
+            animation -- a generator, drawing one frame per step
+        Returns:
+            N/A
+        '''
+        self.animations.append(animation)
+        self.wake()
+
+
+    def after(self, seconds, function):
+        '''
+        Method -- after
+            Calls a function on the first tick at least some seconds from now.
+        Parameters:
+            seconds -- a float
+            function -- a function of no argument
+        Returns:
+            N/A
+        '''
+        def delayed():
+            yield from self.wait(seconds)
+            function()
+
+        self.animate(delayed())
+
+
+    def wait(self, seconds):
+        '''
+        Method -- wait
+            An animation doing nothing for some seconds, to yield from in other animations.
+        Parameters:
+            seconds -- a float
+        Returns:
+            A generator.
+        '''
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            yield
+
+
+    def tick(self):
+        '''
+        Method -- tick
+            Runs one frame, then schedules the next one if there is work left, even if a
+            redraw or an animation raised, the error going on to the caller.
+        Parameters:
+            N/A
+        Returns:
+            N/A
+        '''
+        start = time.perf_counter()
+        if self.due is None or start - self.due > self.interval / 1000:
+            self.due = start
+        self.ticking = True
+        self.frames += 1
+        redraws = self.redraws
+        self.redraws = {}
+        drawn = bool(redraws)
+        running = []
+        stepped = 0
+        try:
+            while redraws:
+                redraws.pop(next(iter(redraws)))()
+            running = self.animations
+            self.animations = []
+            for animation in running:
+                if stepped and time.perf_counter() - start > self.budget:
+                    self.overruns += 1
+                    METRICS.inc('frame_overruns')
+                    break
+                stepped += 1
+                try:
+                    next(animation)
+                    self.animations.append(animation)
+                except StopIteration:
+                    pass
+            if drawn or stepped:
+                self.screen.update()
+        finally:
+            redraws.update(self.redraws)
+            self.redraws = redraws
+            self.animations = running[stepped:] + self.animations
+            end = time.perf_counter()
+            METRICS.observe('frame_seconds', end - start)
+            if self.redraws or self.animations:
+                self.due += self.interval / 1000
+                self.screen.ontimer(self.tick, max(1, round((self.due - end) * 1000)))
+            else:
+                self.due = None
+                self.ticking = False
+
+
+    def wake(self):
+        '''
+        Method -- wake
+            Schedules a tick if none is.
+        Parameters:
+            N/A
+        Returns:
+            N/A
+        '''
+        if not self.ticking:
+            self.ticking = True
+            self.screen.ontimer(self.tick, self.interval)
+
+
+    def idle(self):
+        '''
+        Method -- idle
+            Tells whether all the work asked for is done.
+        Parameters:
+            N/A
+        Returns:
+            A boolean, True if no redraw or animation is pending.
+        '''
+        return not self.redraws and not self.animations
@@ -0,0 +1,140 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To represent the cells of the checkerboard as immutable, hashable values, one interned object per cell
+'''
+
+
+from immutable import Immutable
+from frozen_coordinate import FrozenCoordinate
+from tables import NUM_SQUARES, NO_SQUARE, coord_to_square
+
+
+class FrozenCell(Immutable):
+    '''
+    Class -- FrozenCell
+        The immutable counterpart of Cell. It only says where the cell is; what stands on it
+        and how it is drawn belong to the position and the display, so a single object per cell,
+        from CELLS, serves every position.
+    Attributes:
+        coord -- a FrozenCoordinate, the coordinate of this cell on the checkerboard
+        square -- an integer, the square index of a dark cell, NO_SQUARE for a light cell
+    Methods:
+        is_dark, is_adjacent, generate_cell_key
+    '''
+
+    __slots__ = ('coord', 'square')
+
+
+    def __init__(self, x, y):
+        '''
+        Constructor -- creates a new instance of FrozenCell. Use cell_at to get the interned one.
+        Parameters:
+            self -- the current FrozenCell object
+            x -- an integer, the column of the cell
+            y -- an integer, the row of the cell
+        '''
+        object.__setattr__(self, 'coord', FrozenCoordinate(x, y))
+        object.__setattr__(self, 'square', coord_to_square(x, y) if x % 2 != y % 2 else NO_SQUARE)
+
+
+    def __str__(self):
+        '''
+        Method -- __str__
+            Creates a string representation of the FrozenCell.
+        Parameter:
+            self -- The current FrozenCell object
+        Returns:
+            A string representation of the FrozenCell.
+        '''
+        return self.coord.__str__()
+
+
+    def __eq__(self, cell):
+        '''
+        Method -- __eq__
+            Checks if two objects are equal. A Cell with the same coordinate is equal too.
+        Parameters:
+            self -- The current FrozenCell object
+            cell -- An object to compare self to.
+        Returns:
+            A boolean, True if the two objects are equal, False otherwise.
+        '''
+        return self.coord == getattr(cell, 'coord', None)
+
+
+    def __hash__(self):
+        '''
+        Method -- __hash__
+            Hashes the FrozenCell, consistently with __eq__.
+        Parameter:
+            self -- The current FrozenCell object
+        Returns:
+            An integer, the hash of the coordinate.
+        '''
+        return hash(self.coord)
+
+
+    def is_dark(self):
+        '''
+        Method -- is_dark
+            Tells if pieces can stand on the cell.
+        Parameters:
+            N/A
+        Returns:
+            A boolean, True for the 32 dark cells.
+        '''
+        return self.square != NO_SQUARE
+
+
+    def is_adjacent(self, cell):
+        '''
+        Method -- is_adjacent
+            Tell if a input cell is among the 8 cells arount this cell.
+        Parameters:
+            cell -- a FrozenCell or a Cell
+        Returns:
+            A boolean, True if the input cell is adjacent to the cell.
+        '''
+        return abs(cell.coord.x - self.coord.x) <= 1 and \
+               abs(cell.coord.y - self.coord.y) <= 1
+
+
+    def generate_cell_key(self):
+        '''
+        Method -- generate_cell_key
+            Convert the coordinate of this cell to a tuple.
+        Parameters:
+            N/A
+        Returns:
+            A tuple(x, y), the same key as Cell.generate_cell_key.
+        '''
+        return (self.coord.x, self.coord.y)
+
+
+def build_cells():
+    '''
+    Function -- build_cells
+        Builds the interned cells of the 8x8 board.
+    Parameters:
+        N/A
+    Returns:
+        An 8x8 nested tuple of FrozenCell, indexed by column then row.
+    '''
+    return tuple(tuple(FrozenCell(x, y) for y in range(NUM_SQUARES)) for x in range(NUM_SQUARES))
+
+
+CELLS = build_cells()
+
+
+def cell_at(x, y):
+    '''
+    Function -- cell_at
+        Gets the interned cell at a coordinate.
+    Parameters:
+        x -- an integer, the column
+        y -- an integer, the row
+    Returns:
+        The FrozenCell from CELLS.
+    '''
+    return CELLS[x][y]
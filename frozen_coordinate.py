@@ -0,0 +1,84 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To represent an immutable, hashable two-dimensional coordinate
+'''
+
+
+from immutable import Immutable
+from coordinate import Coordinate
+
+
+class FrozenCoordinate(Immutable):
+    '''
+    Class -- FrozenCoordinate
+        The immutable counterpart of Coordinate, usable as a dict key or in a set.
+    Attributes:
+        x -- an integer or a float, the X coordinate
+        y -- an integer or a float, the Y coordinate
+    Methods:
+        thaw
+    '''
+
+    __slots__ = ('x', 'y')
+
+
+    def __init__(self, x = 0, y = 0):
+        '''
+        Constructor -- creates a new instance of FrozenCoordinate.
+        Parameters:
+            self -- the current FrozenCoordinate object
+            x -- an integer or a float, the X coordinate
+            y -- an integer or a float, the Y coordinate
+        '''
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+
+
+    def __str__(self):
+        '''
+        Method -- __str__
+            Creates a string representation of the FrozenCoordinate, the same as Coordinate's.
+        Parameter:
+            self -- The current FrozenCoordinate object
+        Returns:
+            A string representation of the FrozenCoordinate.
+        '''
+        return 'x: ' + str(self.x) + ' ' + 'y: ' + str(self.y)
+
+
+    def __eq__(self, coord):
+        '''
+        Method -- __eq__
+            Checks if two objects are equal. A Coordinate with the same x and y is equal too.
+        Parameters:
+            self -- The current FrozenCoordinate object
+            coord -- An object to compare self to.
+        Returns:
+            True if the two objects are equal, False otherwise.
+        '''
+        return self.x == getattr(coord, 'x', None) and self.y == getattr(coord, 'y', None)
+
+
+    def __hash__(self):
+        '''
+        Method -- __hash__
+            Hashes the FrozenCoordinate, consistently with __eq__.
+        Parameter:
+            self -- The current FrozenCoordinate object
+        Returns:
+            An integer, the hash of (x, y).
+        '''
+        return hash((self.x, self.y))
+
+
+    def thaw(self):
+        '''
+        Method -- thaw
+            Makes a mutable copy.
+        Parameters:
+            N/A
+        Returns:
+            A Coordinate with the same x and y.
+        '''
+        return Coordinate(self.x, self.y)
@@ -0,0 +1,107 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To represent the four kinds of checkers pieces as immutable, hashable values
+'''
+
+
+from immutable import Immutable
+
+
+NUM_PLAYERS = 2
+
+
+class FrozenPiece(Immutable):
+    '''
+    Class -- FrozenPiece
+        The immutable counterpart of Piece, without the rendering fields: the color, radius and
+        crown of a piece follow from its player and is_king, so the display looks them up.
+        Only four values exist, interned in PIECES.
+    Attributes:
+        player -- an integer, 0 for the human player, 1 for the computer player
+        is_king -- a boolean, True if the piece is a king piece
+    Methods:
+        crowned
+    '''
+
+    __slots__ = ('player', 'is_king')
+
+
+    def __init__(self, player, is_king = False):
+        '''
+        Constructor -- creates a new instance of FrozenPiece. Use piece_of to get the interned one.
+        Parameters:
+            self -- the current FrozenPiece object
+            player -- an integer, 0 or 1
+            is_king -- a boolean, True if this piece is a king piece
+        '''
+        object.__setattr__(self, 'player', player)
+        object.__setattr__(self, 'is_king', bool(is_king))
+
+
+    def __str__(self):
+        '''
+        Method -- __str__
+            Creates a string representation of the FrozenPiece, the same as Piece's.
+        Parameter:
+            self -- The current FrozenPiece object
+        Returns:
+            A string representation of the FrozenPiece.
+        '''
+        res = 'player: ' + str(self.player)
+        res += ', which is '
+        res += 'king.' if self.is_king else 'non-king.'
+        return res
+
+
+    def __eq__(self, piece):
+        '''
+        Method -- __eq__
+            Checks if two objects are equal. Unlike Piece, a king and a man of the same player differ.
+        Parameters:
+            self -- The current FrozenPiece object
+            piece -- An object to compare self to.
+        Returns:
+            A boolean, True if the two objects are equal, False otherwise.
+        '''
+        return isinstance(piece, FrozenPiece) and self.player == piece.player and self.is_king == piece.is_king
+
+
+    def __hash__(self):
+        '''
+        Method -- __hash__
+            Hashes the FrozenPiece, consistently with __eq__.
+        Parameter:
+            self -- The current FrozenPiece object
+        Returns:
+            An integer, the hash of (player, is_king).
+        '''
+        return hash((self.player, self.is_king))
+
+
+    def crowned(self):
+        '''
+        Method -- crowned
+            Gets the king of the same player, since a FrozenPiece cannot be crowned in place.
+        Parameters:
+            N/A
+        Returns:
+            The interned king FrozenPiece of the player.
+        '''
+        return PIECES[self.player][True]
+
+
+PIECES = tuple((FrozenPiece(player, False), FrozenPiece(player, True)) for player in range(NUM_PLAYERS))
+
+
+def piece_of(player, is_king = False):
+    '''
+    Function -- piece_of
+        Gets the interned piece of a player.
+    Parameters:
+        player -- an integer, 0 or 1
+        is_king -- a boolean, True for a king piece
+    Returns:
+        The FrozenPiece from PIECES.
+    '''
+    return PIECES[int(player)][bool(is_king)]
@@ -0,0 +1,66 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To build States and Displays that run without a window, for the tests and the benchmarks
+'''
+
+
+from display import Display
+from frame_scheduler import FrameScheduler
+from square_renderer import SquareRenderer
+from piece import Piece
+from state import State
+from stub_pen import StubPen
+from tables import NUM_DARK_SQUARES, square_to_coord
+
+
+PEN_NAMES = ('pen', 'pen_out', 'pen_header', 'pen_guide', 'pen_click', 'pen_brush', 'pen_brush_steps', 'pen_slide')
+
+
+def load_state(board):
+    '''
+    Function -- load_state
+        Builds a headless State holding a position.
+    Parameters:
+        board -- a Bitboard
+    Returns:
+        A State with its checkerboard rendered and its valid moves up to date.
+    '''
+    state = State()
+    state.render_board()
+    for square in range(NUM_DARK_SQUARES):
+        bit = 1 << square
+        if (board.black | board.red) & bit:
+            x, y = square_to_coord(square)
+            state.checkerboard[x][y].occupied = Piece(player = 0 if board.black & bit else 1,
+                                                      colors = state.piece_colors, radius = state.piece_radius,
+                                                      is_king = bool(board.kings & bit))
+    state.turn = board.turn
+    state.update_valid_moves()
+    return state
+
+
+def stub_display(state):
+    '''
+    Function -- stub_display
+        Builds a Display drawing with stub pens, without opening a window.
+    Parameters:
+        state -- a State, whose geometry the display uses
+    Returns:
+        A Display whose pens, square renderer pens and screen are StubPen objects. Its frame
+        scheduler never ticks on its own: call display.scheduler.tick() to draw a frame.
+    '''
+    display = Display.__new__(Display)
+    display.num_cells = state.num_cells
+    display.cell_size = state.cell_size
+    display.piece_radius = state.piece_radius
+    display.board_size = state.board_size
+    display.screen = StubPen()
+    for name in PEN_NAMES:
+        setattr(display, name, StubPen())
+    display.renderer = SquareRenderer(state.num_cells, state.cell_size, (- state.board_size / 2, - state.board_size / 2),
+                                      display.screen, StubPen)
+    display.scheduler = FrameScheduler(display.screen)
+    display.effects = []
+    display.checkerboard = None
+    return display
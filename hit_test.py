@@ -0,0 +1,66 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To map a point on the screen to the cells of a board by arithmetic, for clicks and overlays
+'''
+
+
+import math
+
+
+def grid_indices(value, start, size, count):
+    '''
+    Function -- grid_indices
+        Gets the cells along one axis of a grid containing a coordinate, bounds included the
+        way Cell.is_click_in includes them: a cell spans [start + size * i, start + size * i + size].
+        The division only gives a first guess, checked against the exact bounds on both sides
+        so that rounding never moves a point on an edge to the wrong cell.
+    Parameters:
+        value -- a float, the coordinate
+        start -- a float, where the first cell starts
+        size -- a float, the size of a cell
+        count -- an integer, the number of cells
+    Returns:
+        A list of integers in increasing order: one index, two on an edge shared by two cells,
+        none off the grid.
+    '''
+    index = math.floor((value - start) / size)
+    return [i for i in (index - 1, index, index + 1)
+            if 0 <= i < count and start + size * i <= value <= start + size * i + size]
+
+
+def cells_at(x, y, origin, cell_size, num_cells):
+    '''
+    Function -- cells_at
+        Gets the cells of a square board containing a point, in constant time whatever the size
+        of the board. Boards drawn at different origins on one screen are told apart by the origin.
+    Parameters:
+        x -- a float, the X coordinate of the point
+        y -- a float, the Y coordinate of the point
+        origin -- a tuple of floats, the bottom left corner of the board
+        cell_size -- a float, the edge length of each cell
+        num_cells -- an integer, the number of cells per row / column
+    Returns:
+        A list of tuples (col, row), column by column like a scan of the board: one cell, up to
+        four on the edges and corners cells share, none off the board.
+    '''
+    rows = grid_indices(y, origin[1], cell_size, num_cells)
+    return [(col, row) for col in grid_indices(x, origin[0], cell_size, num_cells) for row in rows]
+
+
+def cell_at(x, y, origin, cell_size, num_cells):
+    '''
+    Function -- cell_at
+        Gets the first cell of a board containing a point, for overlays such as hint arrows
+        that only need to know which cell a point falls on.
+    Parameters:
+        x -- a float, the X coordinate of the point
+        y -- a float, the Y coordinate of the point
+        origin -- a tuple of floats, the bottom left corner of the board
+        cell_size -- a float, the edge length of each cell
+        num_cells -- an integer, the number of cells per row / column
+    Returns:
+        A tuple (col, row), None off the board.
+    '''
+    cells = cells_at(x, y, origin, cell_size, num_cells)
+    return cells[0] if cells else None
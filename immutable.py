@@ -0,0 +1,46 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To share the refusal to change attributes between the immutable value classes
+'''
+
+
+class Immutable:
+    '''
+    Class -- Immutable
+        A base for the frozen value classes. Their constructors set the slots with
+        object.__setattr__, and every later change or deletion raises AttributeError.
+    Attributes:
+        N/A
+    Methods:
+        N/A
+    '''
+
+    __slots__ = ()
+
+
+    def __setattr__(self, name, value):
+        '''
+        Method -- __setattr__
+            Refuses to change the object.
+        Parameters:
+            self -- The current Immutable object
+            name -- a string, the attribute name
+            value -- the value to set
+        Returns:
+            N/A, but raises AttributeError.
+        '''
+        raise AttributeError(type(self).__name__ + ' is immutable')
+
+
+    def __delattr__(self, name):
+        '''
+        Method -- __delattr__
+            Refuses to delete an attribute.
+        Parameters:
+            self -- The current Immutable object
+            name -- a string, the attribute name
+        Returns:
+            N/A, but raises AttributeError.
+        '''
+        raise AttributeError(type(self).__name__ + ' is immutable')
@@ -5,11 +5,36 @@ Purpose: To implement the game of Checkers
 '''
 
 
+import os
+import sys
 from state import State
+from display import Display
+from engine import Engine, DEFAULT_TIME
+from parallel_engine import ParallelEngine
+from tablebase import Tablebase, DEFAULT_DIRECTORY
+from opening_book import OpeningBook, DEFAULT_PATH
+from metrics import METRICS, ENVIRONMENT_VARIABLE
 
 
 def main():
-    game = State()
+    player = sys.argv[1] if len(sys.argv) > 1 else '1'
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_TIME
+    if os.environ.get(ENVIRONMENT_VARIABLE):
+        METRICS.enable(os.environ[ENVIRONMENT_VARIABLE])
+    tablebase = Tablebase(DEFAULT_DIRECTORY) if os.path.isdir(DEFAULT_DIRECTORY) else None
+    book = OpeningBook(DEFAULT_PATH) if os.path.exists(DEFAULT_PATH) else None
+    if player == 'mcts':
+        # NumPy is only needed by this player, so the others run without it.
+        from mcts import Mcts
+        computer = Mcts(time_limit = seconds)
+    elif int(player) > 1:
+        computer = ParallelEngine(int(player), time_limit = seconds, tablebase = tablebase, book = book)
+        # Fork the workers now, from the only thread, rather than from the thread searching.
+        computer.get_pool()
+    else:
+        computer = Engine(time_limit = seconds, tablebase = tablebase, book = book)
+    game = State(computer = computer)
+    game.display = Display(game)
     game.run_checkers()
 
 
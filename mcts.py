@@ -0,0 +1,275 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To choose the computer player's moves with a Monte Carlo tree search over random playouts
+'''
+
+
+import threading
+import time
+import numpy as np
+from batch_board import from_bitboards, NO_WINNER
+from mcts_node import MctsNode
+from metrics import METRICS
+
+
+UCT = 'uct'
+PUCT = 'puct'
+SELECTIONS = (UCT, PUCT)
+UCT_EXPLORATION = 1.4
+PUCT_EXPLORATION = 1.5
+DEFAULT_PLAYOUTS = 2000
+DEFAULT_TIME = 1.0
+DEFAULT_BATCH = 32
+ROLLOUT_PLIES = 150
+DRAW_POINTS = 0.5
+
+
+class Mcts:
+    '''
+    Class -- Mcts
+        A drop-in replacement for Engine as State's computer player. Each round selects a batch
+        of leaves, adding a virtual loss along every selected path so the next selections spread
+        out, then plays the random playouts of the whole batch in lockstep on BatchBoards, whose
+        random hops are the policy of State.sample_piece and State.sample_cell. The subtree of
+        the position reached is kept for the next move.
+    Attributes:
+        selection -- a string, UCT or PUCT
+        exploration -- a float, the weight of the exploration term
+        playout_limit -- an integer, playouts per search, None for no limit
+        time_limit -- a float, seconds per search, None for no limit
+        batch -- an integer, the leaves selected before their playouts are played
+        rollout_plies -- an integer, the turns after which a playout is a draw
+        rng -- a numpy Generator, driving the playouts
+        root -- an MctsNode, the tree kept from the last search, None before the first one
+        playouts -- an integer, playouts of the last search
+        reused -- an integer, visits the last search inherited from the one before
+        elapsed -- a float, seconds the last search took
+        stop_event -- an Event belonging to the running or last search, set by cancel
+        verbose -- a boolean, True to print the result of every choose_move
+    Methods:
+        choose_move, search, find_root, select, play_out, back_up, playouts_per_second, cancel
+    '''
+
+
+    def __init__(self, playout_limit = DEFAULT_PLAYOUTS, time_limit = DEFAULT_TIME, selection = UCT, exploration = None,
+                 batch = DEFAULT_BATCH, seed = None, rollout_plies = ROLLOUT_PLIES, verbose = False):
+        '''
+        Constructor -- creates a new instance of Mcts.
+        Parameters:
+            self -- the current Mcts object
+            playout_limit -- an integer, playouts per search, None for no limit
+            time_limit -- a float, seconds per search, None for no limit
+            selection -- a string, UCT or PUCT
+            exploration -- a float, None for the default of the selection
+            batch -- an integer, the leaves selected before their playouts are played
+            seed -- an integer seeding the playouts, None for a random seed
+            rollout_plies -- an integer, the turns after which a playout is a draw
+            verbose -- a boolean, True to print the result of every choose_move
+        '''
+        if selection not in SELECTIONS:
+            raise ValueError('selection must be one of ' + ', '.join(SELECTIONS))
+        if playout_limit is None and time_limit is None:
+            raise ValueError('a playout or time limit is needed')
+        self.selection = selection
+        self.exploration = exploration if exploration is not None else \
+                           UCT_EXPLORATION if selection == UCT else PUCT_EXPLORATION
+        self.playout_limit = playout_limit
+        self.time_limit = time_limit
+        self.batch = batch
+        self.rollout_plies = rollout_plies
+        self.rng = np.random.default_rng(seed)
+        self.root = None
+        self.playouts = 0
+        self.reused = 0
+        self.elapsed = 0.0
+        self.stop_event = threading.Event()
+        self.verbose = verbose
+
+
+    def choose_move(self, board, stop_event = None):
+        '''
+        Method -- choose_move
+            Picks the move to play in a position. The playouts of the search, and those it
+            inherited, are added to the metrics.
+        Parameters:
+            board -- a Bitboard, with the player's side to move
+            stop_event -- an Event belonging to this move only, set to stop its search, None for a new one
+        Returns:
+            A Move, None if the player to move has lost.
+        '''
+        moves = board.generate_moves()
+        if len(moves) <= 1:
+            self.root = None
+            return moves[0] if moves else None
+        line, score = self.search(board, stop_event)
+        METRICS.inc('mcts_searches')
+        METRICS.inc('mcts_playouts', self.playouts)
+        METRICS.inc('mcts_reused', self.reused)
+        if self.verbose:
+            print('mcts: playouts', self.playouts, 'reused', self.reused, 'playouts/s', round(self.playouts_per_second()),
+                  'score', round(score, 3), 'line', ' '.join(str(move) for move in line))
+        return line[0] if line else None
+
+
+    def search(self, board, stop_event = None):
+        '''
+        Method -- search
+            Runs playouts until the playout or time budget runs out, or the stop event is set,
+            then keeps the subtree of the chosen move for the next search. A stop event set before
+            the search starts stops it before its first batch, or after it when the kept tree has
+            no visits to choose from.
+        Parameters:
+            board -- a Bitboard
+            stop_event -- an Event belonging to this search only, None for a new one, set by cancel
+        Returns:
+            A tuple (line, score): the most visited line as a list of Move, and the share of the
+            points the first move scored for the player to move.
+        '''
+        self.stop_event = threading.Event() if stop_event is None else stop_event
+        start = time.perf_counter()
+        deadline = None if self.time_limit is None else start + self.time_limit
+        self.playouts = 0
+        root = self.find_root(board)
+        self.reused = root.visits
+        if root.children is None:
+            root.expand()
+        while root.children:
+            if self.stop_event.is_set() and root.visits:
+                break
+            if self.playout_limit is not None and self.playouts >= self.playout_limit:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            size = self.batch if self.playout_limit is None else min(self.batch, self.playout_limit - self.playouts)
+            leaves = [self.select(root) for leaf in range(size)]
+            for leaf, winner in zip(leaves, self.play_out(leaves)):
+                self.back_up(leaf, winner)
+            self.playouts += size
+        self.elapsed = time.perf_counter() - start
+        line = []
+        node = root
+        while node.best_child() is not None and node.best_child().visits:
+            node = node.best_child()
+            line.append(node.move)
+        best = root.best_child()
+        score = best.mean_value(DRAW_POINTS) if best else 0.0
+        self.root = best
+        return line, score
+
+
+    def find_root(self, board):
+        '''
+        Method -- find_root
+            Gets the node of a position from the tree of the last search, which ended on the
+            engine's own move, so the position is one of its children when the opponent has
+            played one move since.
+        Parameters:
+            board -- a Bitboard
+        Returns:
+            An MctsNode without parent, a new one if the position is not in the tree.
+        '''
+        if self.root is not None and self.root.children:
+            for child in self.root.children:
+                if child.board.key == board.key and child.board == board:
+                    child.parent = None
+                    child.move = None
+                    return child
+        return MctsNode(board)
+
+
+    def select(self, root):
+        '''
+        Method -- select
+            Walks down from the root to a leaf by the best selection score, expanding the leaf
+            if it was already played out once, and adds a virtual loss on the way.
+        Parameters:
+            root -- an MctsNode, expanded
+        Returns:
+            An MctsNode, the leaf to play out from.
+        '''
+        node = root
+        node.virtual += 1
+        while True:
+            if node.children is None and node.visits:
+                node.expand()
+            if not node.children:
+                return node
+            parent_visits = node.visits + node.virtual
+            if self.selection == UCT:
+                node = max(node.children, key = lambda child: child.uct_score(parent_visits, self.exploration))
+            else:
+                node = max(node.children, key = lambda child: child.puct_score(parent_visits, self.exploration))
+            node.virtual += 1
+
+
+    def play_out(self, leaves):
+        '''
+        Method -- play_out
+            Plays a random game from every leaf at once. A leaf where the player to move has
+            no move needs no playout.
+        Parameters:
+            leaves -- a list of MctsNode
+        Returns:
+            A list of integers, the winner of every playout, NO_WINNER for a draw.
+        '''
+        res = [NO_WINNER] * len(leaves)
+        pending = []
+        for index, leaf in enumerate(leaves):
+            if leaf.children == []:
+                res[index] = 1 - leaf.board.turn
+            else:
+                pending.append(index)
+        if pending:
+            boards = from_bitboards([leaves[index].board for index in pending])
+            winners = boards.play_random(self.rng, self.rollout_plies)
+            for index, winner in zip(pending, winners.tolist()):
+                res[index] = winner
+        return res
+
+
+    def back_up(self, leaf, winner):
+        '''
+        Method -- back_up
+            Adds the result of a playout to every node from the leaf to the root, removing the
+            virtual loss added by select.
+        Parameters:
+            leaf -- an MctsNode
+            winner -- an integer, the winner of the playout, NO_WINNER for a draw
+        Returns:
+            N/A, but updates the statistics of the nodes.
+        '''
+        node = leaf
+        while node is not None:
+            node.visits += 1
+            node.virtual -= 1
+            if winner == NO_WINNER:
+                node.value += DRAW_POINTS
+            elif winner != node.board.turn:
+                node.value += 1
+            node = node.parent
+
+
+    def playouts_per_second(self):
+        '''
+        Method -- playouts_per_second
+            Gets the speed of the last search.
+        Parameters:
+            N/A
+        Returns:
+            A float, 0 before the first search.
+        '''
+        return self.playouts / self.elapsed if self.elapsed else 0.0
+
+
+    def cancel(self):
+        '''
+        Method -- cancel
+            Asks a running search, possibly on another thread, to stop after its current batch.
+            The next search does not see it, as with Engine.cancel.
+        Parameters:
+            N/A
+        Returns:
+            N/A
+        '''
+        self.stop_event.set()
@@ -0,0 +1,121 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To represent a position in the tree of a Monte Carlo tree search
+'''
+
+
+import math
+
+
+class MctsNode:
+    '''
+    Class -- MctsNode
+        A position of the search tree with the statistics of the playouts that went through it.
+        Values are counted for the player who moved into the node, so a parent picks the child
+        with the best value for itself.
+    Attributes:
+        board -- a Bitboard, the position
+        move -- a Move, the move from the parent, None for the root
+        parent -- an MctsNode, None for the root
+        children -- a list of MctsNode, None until the node is expanded, empty if the game is over
+        prior -- a float, the probability the parent gives to this move
+        visits -- an integer, the playouts through this node
+        value -- a float, the points those playouts scored, 1 for a win and 0.5 for a draw
+        virtual -- an integer, the playouts selected through this node and not backed up yet
+    Methods:
+        expand, mean_value, uct_score, puct_score, best_child
+    '''
+
+    __slots__ = ('board', 'move', 'parent', 'children', 'prior', 'visits', 'value', 'virtual')
+
+
+    def __init__(self, board, move = None, parent = None, prior = 1.0):
+        '''
+        Constructor -- creates a new instance of MctsNode.
+        Parameters:
+            self -- the current MctsNode object
+            board -- a Bitboard
+            move -- a Move, the move from the parent
+            parent -- an MctsNode
+            prior -- a float, the probability the parent gives to this move
+        '''
+        self.board = board
+        self.move = move
+        self.parent = parent
+        self.children = None
+        self.prior = prior
+        self.visits = 0
+        self.value = 0.0
+        self.virtual = 0
+
+
+    def expand(self):
+        '''
+        Method -- expand
+            Creates a child per legal move, every move equally likely.
+        Parameters:
+            N/A
+        Returns:
+            A list of MctsNode, empty if the player to move has lost.
+        '''
+        moves = self.board.generate_moves()
+        self.children = [MctsNode(self.board.apply_move(move), move, self, 1.0 / len(moves)) for move in moves]
+        return self.children
+
+
+    def mean_value(self, unvisited):
+        '''
+        Method -- mean_value
+            Gets the mean points of the playouts, pending ones counting as losses.
+        Parameters:
+            unvisited -- a float, the value of a node without any playout
+        Returns:
+            A float in [0, 1].
+        '''
+        visits = self.visits + self.virtual
+        return self.value / visits if visits else unvisited
+
+
+    def uct_score(self, parent_visits, exploration):
+        '''
+        Method -- uct_score
+            Scores the node for UCT selection. Nodes without any playout come first.
+        Parameters:
+            parent_visits -- an integer, the visits of the parent, pending ones included
+            exploration -- a float, the weight of the exploration term
+        Returns:
+            A float.
+        '''
+        visits = self.visits + self.virtual
+        if not visits:
+            return math.inf
+        return self.value / visits + exploration * math.sqrt(math.log(parent_visits) / visits)
+
+
+    def puct_score(self, parent_visits, exploration):
+        '''
+        Method -- puct_score
+            Scores the node for PUCT selection, exploring in proportion to the prior.
+        Parameters:
+            parent_visits -- an integer, the visits of the parent, pending ones included
+            exploration -- a float, the weight of the exploration term
+        Returns:
+            A float.
+        '''
+        visits = self.visits + self.virtual
+        return self.mean_value(0.5) + exploration * self.prior * math.sqrt(parent_visits) / (1 + visits)
+
+
+    def best_child(self):
+        '''
+        Method -- best_child
+            Gets the most visited child, the move to play.
+        Parameters:
+            N/A
+        Returns:
+            An MctsNode, None if the node has no children.
+        '''
+        if not self.children:
+            return None
+        return max(self.children, key = lambda child: child.visits)
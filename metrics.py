@@ -0,0 +1,259 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To count and time the phases of a turn at runtime, opt-in, exporting to JSON or Prometheus text
+'''
+
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+
+JSON = 'json'
+PROMETHEUS = 'prometheus'
+FORMATS = (JSON, PROMETHEUS)
+PREFIX = 'checkers_'
+# Set to a file path to turn the metrics on in main.py, written there at exit.
+ENVIRONMENT_VARIABLE = 'CHECKERS_METRICS'
+# Upper bounds of the histogram buckets, in seconds for timers.
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class MetricsRegistry:
+    '''
+    Class -- MetricsRegistry
+        Counters and histograms, off until enabled. While disabled, every recording method
+        returns after checking one attribute, so the instrumentation can stay in the hot paths.
+        Timers are histograms of seconds, named after the phase with a _seconds suffix.
+    Attributes:
+        enabled -- a boolean, True to record
+        buckets -- a tuple of floats, the upper bounds of the histogram buckets
+        counters -- a dict mapping a name to an integer
+        histograms -- a dict mapping a name to a list: the count of every bucket, then the +Inf
+                      bucket, the sum and the count of the values
+        path -- a string, the file written at exit, None for none
+        format -- a string, JSON or PROMETHEUS, the format of that file
+        lock -- a threading.Lock, so threads can record at once
+    Methods:
+        enable, disable, reset, inc, observe, start, stop, to_json, to_prometheus, write
+    '''
+
+
+    def __init__(self, buckets = DEFAULT_BUCKETS):
+        '''
+        Constructor -- creates a new instance of MetricsRegistry, disabled.
+        Parameters:
+            self -- the current MetricsRegistry object
+            buckets -- a sorted tuple of floats, the upper bounds of the histogram buckets
+        '''
+        self.enabled = False
+        self.buckets = tuple(buckets)
+        self.counters = {}
+        self.histograms = {}
+        self.path = None
+        self.format = JSON
+        self.lock = threading.Lock()
+
+
+    def enable(self, path = None, format = None):
+        '''
+        Method -- enable
+            Starts recording, and optionally writes the metrics to a file when the program exits.
+        Parameters:
+            path -- a string, the file to write at exit, None for none
+            format -- a string, JSON or PROMETHEUS, None to pick it from the extension, .prom for Prometheus
+        Returns:
+            N/A
+        '''
+        if format is None:
+            format = PROMETHEUS if path and path.endswith('.prom') else JSON
+        if format not in FORMATS:
+            raise ValueError('format must be one of ' + ', '.join(FORMATS))
+        if path and self.path is None:
+            atexit.register(lambda: self.path and self.write(self.path, self.format))
+        self.path = path
+        self.format = format
+        self.enabled = True
+
+
+    def disable(self):
+        '''
+        Method -- disable
+            Stops recording, keeping what was recorded.
+        Parameters:
+            N/A
+        Returns:
+            N/A
+        '''
+        self.enabled = False
+
+
+    def reset(self):
+        '''
+        Method -- reset
+            Forgets every metric.
+        Parameters:
+            N/A
+        Returns:
+            N/A
+        '''
+        with self.lock:
+            self.counters = {}
+            self.histograms = {}
+
+
+    def inc(self, name, amount = 1):
+        '''
+        Method -- inc
+            Adds to a counter.
+        Parameters:
+            name -- a string, the counter
+            amount -- an integer, what to add
+        Returns:
+            N/A
+        '''
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+
+    def observe(self, name, value):
+        '''
+        Method -- observe
+            Adds a value to a histogram.
+        Parameters:
+            name -- a string, the histogram
+            value -- a float
+        Returns:
+            N/A
+        '''
+        if not self.enabled:
+            return
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            index = 0
+            while index < len(self.buckets) and value > self.buckets[index]:
+                index += 1
+            histogram[index] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+
+
+    def start(self):
+        '''
+        Method -- start
+            Starts timing a phase.
+        Parameters:
+            N/A
+        Returns:
+            A float to pass to stop, None while disabled.
+        '''
+        return time.perf_counter() if self.enabled else None
+
+
+    def stop(self, name, start):
+        '''
+        Method -- stop
+            Records the time since start in the histogram of a phase.
+        Parameters:
+            name -- a string, the phase, recorded as name + '_seconds'
+            start -- a float returned by start, None to record nothing
+        Returns:
+            N/A
+        '''
+        if start is not None:
+            self.observe(name + '_seconds', time.perf_counter() - start)
+
+
+    def to_json(self):
+        '''
+        Method -- to_json
+            Exports the metrics as a JSON-ready dict.
+        Parameters:
+            N/A
+        Returns:
+            A dict with the keys counters and histograms, each histogram being a dict with the
+            keys buckets (bucket bound to count, not cumulative, with '+Inf'), sum and count.
+        '''
+        with self.lock:
+            histograms = {}
+            for name, histogram in self.histograms.items():
+                bounds = [str(bound) for bound in self.buckets] + ['+Inf']
+                histograms[name] = {'buckets': dict(zip(bounds, histogram[:-2])), 'sum': histogram[-2],
+                                    'count': histogram[-1]}
+            return {'counters': dict(self.counters), 'histograms': histograms}
+
+
+    def to_prometheus(self):
+        '''
+        Method -- to_prometheus
+            Exports the metrics in the Prometheus text format, names prefixed with PREFIX.
+        Parameters:
+            N/A
+        Returns:
+            A string.
+        '''
+        lines = []
+        with self.lock:
+            for name in sorted(self.counters):
+                lines.append('# TYPE ' + PREFIX + name + '_total counter')
+                lines.append(PREFIX + name + '_total ' + str(self.counters[name]))
+            for name in sorted(self.histograms):
+                histogram = self.histograms[name]
+                lines.append('# TYPE ' + PREFIX + name + ' histogram')
+                total = 0
+                for bound, count in zip([repr(bound) for bound in self.buckets] + ['+Inf'], histogram[:-2]):
+                    total += count
+                    lines.append(PREFIX + name + '_bucket{le="' + bound + '"} ' + str(total))
+                lines.append(PREFIX + name + '_sum ' + repr(histogram[-2]))
+                lines.append(PREFIX + name + '_count ' + str(histogram[-1]))
+        return '\n'.join(lines) + '\n'
+
+
+    def write(self, path, format = JSON):
+        '''
+        Method -- write
+            Writes the metrics to a file, written aside and renamed so a reader never sees half of it.
+        Parameters:
+            path -- a string, the file
+            format -- a string, JSON or PROMETHEUS
+        Returns:
+            N/A, but writes the file.
+        '''
+        text = json.dumps(self.to_json(), indent = 2) if format == JSON else self.to_prometheus()
+        with open(path + '.tmp', 'w') as file:
+            file.write(text)
+        os.replace(path + '.tmp', path)
+
+
+METRICS = MetricsRegistry()
+
+
+def timed(name):
+    '''
+    Function -- timed
+        Decorates a function to time every call in METRICS, as the phase name.
+    Parameters:
+        name -- a string, the phase
+    Returns:
+        A decorator.
+    '''
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not METRICS.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                METRICS.observe(name + '_seconds', time.perf_counter() - start)
+        return wrapper
+    return decorate
@@ -0,0 +1,120 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To represent a whole turn of a player, a single step or a complete capture sequence
+'''
+
+
+from tables import square_to_coord
+
+
+class Move:
+    '''
+    Class -- Move
+    Attributes:
+        path -- a tuple of integers, the squares the piece visits, starting square first
+        captured -- an integer, the mask of squares whose pieces are captured
+        crowned -- a boolean, True if a man is crowned during the move
+    Methods:
+        from_square, to_square, is_capture, coords
+    '''
+
+
+    def __init__(self, path = (), captured = 0, crowned = False):
+        '''
+        Constructor -- creates a new instance of Move.
+        Parameters:
+            self -- the current Move object
+            path -- a tuple of integers, the squares the piece visits
+            captured -- an integer, the mask of captured squares
+            crowned -- a boolean, True if a man is crowned during the move
+        '''
+        self.path = tuple(path)
+        self.captured = captured
+        self.crowned = crowned
+
+
+    def __str__(self):
+        '''
+        Method -- __str__
+            Creates a string representation of the Move, the cells it visits.
+        Parameter:
+            self -- The current Move object
+        Returns:
+            A string representation of the Move.
+        '''
+        separator = 'x' if self.captured else '-'
+        return separator.join(str(coord) for coord in self.coords())
+
+
+    def __eq__(self, move):
+        '''
+        Method -- __eq__
+            Checks if two objects are equal.
+        Parameters:
+            self -- The current Move object
+            move -- An object to compare self to.
+        Returns:
+            A boolean, True if the two objects are equal, False otherwise.
+        '''
+        return isinstance(move, Move) and self.path == move.path and self.captured == move.captured
+
+
+    def __hash__(self):
+        '''
+        Method -- __hash__
+            Hashes the Move, consistently with __eq__.
+        Parameter:
+            self -- The current Move object
+        Returns:
+            An integer, the hash of the path and the captured squares.
+        '''
+        return hash((self.path, self.captured))
+
+
+    def from_square(self):
+        '''
+        Method -- from_square
+            Gets the square the piece moves from.
+        Parameters:
+            N/A
+        Returns:
+            An integer, the starting square.
+        '''
+        return self.path[0]
+
+
+    def to_square(self):
+        '''
+        Method -- to_square
+            Gets the square the piece ends on.
+        Parameters:
+            N/A
+        Returns:
+            An integer, the final square.
+        '''
+        return self.path[-1]
+
+
+    def is_capture(self):
+        '''
+        Method -- is_capture
+            Tells if the move captures.
+        Parameters:
+            N/A
+        Returns:
+            A boolean, True if at least one piece is captured.
+        '''
+        return self.captured != 0
+
+
+    def coords(self):
+        '''
+        Method -- coords
+            Converts the path to cell coordinates.
+        Parameters:
+            N/A
+        Returns:
+            A list of tuple(x, y), the cells the piece visits.
+        '''
+        return [square_to_coord(square) for square in self.path]
@@ -0,0 +1,147 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To hand the search its moves one at a time, best guesses first, generating each stage only when needed
+'''
+
+
+from bitboard import PROMOTION_ROWS
+from move import Move
+from tables import NUM_DARK_SQUARES
+
+
+STAGE_TABLE = 0
+STAGE_CAPTURES = 1
+STAGE_KILLERS = 2
+STAGE_QUIETS = 3
+STAGE_DONE = 4
+
+
+class MovePicker:
+    '''
+    Class -- MovePicker
+        Yields the moves of a position in stages: the table move, then the captures, which are
+        mandatory and so the only other stage when there is one, then the killer moves, then the
+        remaining non-capture moves by history score. A stage is only generated once the search
+        has tried every move of the earlier stages without a cutoff.
+    Attributes:
+        board -- a Bitboard, the position to pick moves in
+        table_move -- a Move, the best move stored in the transposition table, None if unknown
+        killers -- a sequence of Move, non-capture moves that caused cutoffs at the same ply
+        history -- a list of integers, the cutoff score of every (from, to) pair, None for no ordering
+        stage -- an integer, the stage the last move came from
+    Methods:
+        moves, table_move_if_legal, ordered_quiet_moves
+    '''
+
+
+    def __init__(self, board, table_move = None, killers = (), history = None):
+        '''
+        Constructor -- creates a new instance of MovePicker.
+        Parameters:
+            self -- the current MovePicker object
+            board -- a Bitboard
+            table_move -- a Move from the transposition table, None if unknown
+            killers -- a sequence of Move, None entries are skipped
+            history -- a list of NUM_DARK_SQUARES * NUM_DARK_SQUARES integers, None for no ordering
+        '''
+        self.board = board
+        self.table_move = table_move
+        self.killers = killers
+        self.history = history
+        self.stage = STAGE_TABLE
+
+
+    def __iter__(self):
+        '''
+        Method -- __iter__
+            Iterates over the moves, see moves.
+        Parameters:
+            self -- the current MovePicker object
+        Returns:
+            A generator of Move.
+        '''
+        return self.moves()
+
+
+    def moves(self):
+        '''
+        Method -- moves
+            Yields every move of the position once, stage by stage.
+        Parameters:
+            N/A
+        Returns:
+            A generator of Move.
+        '''
+        board = self.board
+        capture = board.has_capture()
+        table_move = self.table_move_if_legal(capture)
+        self.stage = STAGE_TABLE
+        if table_move:
+            yield table_move
+        if capture:
+            self.stage = STAGE_CAPTURES
+            # A table move may only keep its first and last squares, so compare those and the captures.
+            tried = (table_move.path[0], table_move.path[-1], table_move.captured) if table_move else None
+            for move in board.capture_paths():
+                if (move.path[0], move.path[-1], move.captured) != tried:
+                    yield move
+            self.stage = STAGE_DONE
+            return
+        tried = [table_move] if table_move else []
+        self.stage = STAGE_KILLERS
+        for killer in self.killers:
+            if killer is None:
+                continue
+            move = board.quiet_move(killer.path[0], killer.path[-1])
+            if move and move not in tried:
+                tried.append(move)
+                yield move
+        self.stage = STAGE_QUIETS
+        promotion = PROMOTION_ROWS[board.turn]
+        kings = board.kings
+        for from_square, to_square in self.ordered_quiet_moves(tried):
+            yield Move((from_square, to_square), 0, not kings >> from_square & 1 and bool(promotion >> to_square & 1))
+        self.stage = STAGE_DONE
+
+
+    def table_move_if_legal(self, capture):
+        '''
+        Method -- table_move_if_legal
+            Checks the table move against the position, since an entry may belong to another
+            position with the same slot and key.
+        Parameters:
+            capture -- a boolean, True if the player to move has to capture
+        Returns:
+            A Move, None if there is no table move or it cannot be played here.
+        '''
+        move = self.table_move
+        if move is None or bool(move.captured) != capture:
+            return None
+        board = self.board
+        if not capture:
+            return board.quiet_move(move.path[0], move.path[-1])
+        own = board.red if board.turn else board.black
+        opponent = board.black if board.turn else board.red
+        landing = move.path[-1]
+        if not own >> move.path[0] & 1 or move.captured & ~opponent or \
+           (landing != move.path[0] and (board.black | board.red) >> landing & 1):
+            return None
+        return move
+
+
+    def ordered_quiet_moves(self, tried):
+        '''
+        Method -- ordered_quiet_moves
+            Generates the non-capture moves not tried yet, highest history score first.
+        Parameters:
+            tried -- a list of Move, the moves already yielded
+        Returns:
+            A list of tuples (from_square, to_square).
+        '''
+        skip = [(move.path[0], move.path[-1]) for move in tried]
+        pairs = [pair for pair in self.board.quiet_moves() if pair not in skip]
+        history = self.history
+        if history:
+            pairs.sort(key = lambda pair: history[pair[0] * NUM_DARK_SQUARES + pair[1]], reverse = True)
+        return pairs
@@ -0,0 +1,283 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To build an opening book from played games, and to look positions up in it with a binary search
+'''
+
+
+import argparse
+import json
+import mmap
+import os
+import random
+import struct
+from bitboard import Bitboard, INITIAL_BLACK, INITIAL_RED
+from engine import Engine
+
+
+DEFAULT_PATH = 'opening.book'
+DEFAULT_PLIES = 16
+DEFAULT_GAMES = 100
+DEFAULT_DEPTH = 4
+RANDOM_PLIES = 4
+MAX_GAME_PLIES = 200
+
+MAGIC = b'CKBK'
+HEADER = struct.Struct('<4sI')
+# key, from square, to square, captured squares, weight, plays, wins, draws
+RECORD = struct.Struct('<QBBIIIII')
+KEY = struct.Struct('<Q')
+
+
+def play_game(engine, rng, random_plies = RANDOM_PLIES, max_plies = MAX_GAME_PLIES):
+    '''
+    Function -- play_game
+        Plays a game of the engine against itself from the initial position. The first plies
+        are random, so that games differ.
+    Parameters:
+        engine -- an Engine, playing both sides
+        rng -- a random.Random, picking the random plies
+        random_plies -- an integer, the plies played at random
+        max_plies -- an integer, the plies after which the game is a draw
+    Returns:
+        A tuple (moves, winner): the list of Move played, and 0 or 1, None for a draw.
+    '''
+    board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+    moves = []
+    for ply in range(max_plies):
+        legal = board.generate_moves()
+        if not legal:
+            return moves, 1 - board.turn
+        if ply < random_plies:
+            move = rng.choice(legal)
+        else:
+            move = engine.search(board)[0][0]
+        moves.append(move)
+        board = board.apply_move(move)
+    return moves, None
+
+
+def self_play(games, depth = DEFAULT_DEPTH, seed = 0):
+    '''
+    Function -- self_play
+        Plays games of a fixed-depth engine against itself.
+    Parameters:
+        games -- an integer, the number of games
+        depth -- an integer, the depth the engine searches every move to
+        seed -- an integer, seeding the random plies
+    Returns:
+        A generator of tuples (moves, winner), as returned by play_game.
+    '''
+    rng = random.Random(seed)
+    engine = Engine(depth, None)
+    for game in range(games):
+        yield play_game(engine, rng)
+
+
+def read_games(path):
+    '''
+    Function -- read_games
+        Reads games from a JSON lines file, one game per line, such as
+        {"moves": ["(1, 2)-(2, 3)", "(4, 5)-(3, 4)"], "winner": 0}, moves written as str(Move)
+        and winner being 0, 1 or null for a draw.
+    Parameters:
+        path -- a string, the file to read
+    Returns:
+        A generator of tuples (moves, winner), as returned by play_game.
+    Raises:
+        ValueError if a move cannot be played in its position.
+    '''
+    with open(path) as file:
+        for line in file:
+            if not line.strip():
+                continue
+            game = json.loads(line)
+            board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+            moves = []
+            for text in game['moves']:
+                legal = {str(move): move for move in board.generate_moves()}
+                if text not in legal:
+                    raise ValueError('illegal move ' + text + ' in ' + path)
+                moves.append(legal[text])
+                board = board.apply_move(legal[text])
+            yield moves, game.get('winner')
+
+
+def collect(games, plies = DEFAULT_PLIES):
+    '''
+    Function -- collect
+        Counts, for every position of the first plies of the games, how often each move was
+        played and how the games went for the player who played it.
+    Parameters:
+        games -- an iterable of tuples (moves, winner)
+        plies -- an integer, the plies of each game to keep
+    Returns:
+        A dict mapping (key, from_square, to_square, captured) to a list [plays, wins, draws].
+    '''
+    res = {}
+    for moves, winner in games:
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        for move in moves[:plies]:
+            stats = res.setdefault((board.key, move.path[0], move.path[-1], move.captured), [0, 0, 0])
+            stats[0] += 1
+            if winner is None:
+                stats[2] += 1
+            elif winner == board.turn:
+                stats[1] += 1
+            board = board.apply_move(move)
+    return res
+
+
+def move_weight(wins, draws):
+    '''
+    Function -- move_weight
+        Weighs a book move by the points it scored, a win being worth two and a draw one,
+        plus one so that every move played has some weight.
+    Parameters:
+        wins -- an integer, the games the player of the move won
+        draws -- an integer, the games drawn
+    Returns:
+        A positive integer.
+    '''
+    return 2 * wins + draws + 1
+
+
+def write_book(path, stats):
+    '''
+    Function -- write_book
+        Writes a book: a header with the number of records, then fixed-size records sorted by
+        position key, so a lookup is a binary search. The file is written aside and renamed.
+    Parameters:
+        path -- a string, the file to write
+        stats -- a dict, as returned by collect
+    Returns:
+        An integer, the number of records written.
+    '''
+    with open(path + '.tmp', 'wb') as file:
+        file.write(HEADER.pack(MAGIC, len(stats)))
+        for (key, from_square, to_square, captured), (plays, wins, draws) in sorted(stats.items()):
+            file.write(RECORD.pack(key, from_square, to_square, captured, move_weight(wins, draws),
+                                   plays, wins, draws))
+    os.replace(path + '.tmp', path)
+    return len(stats)
+
+
+class OpeningBook:
+    '''
+    Class -- OpeningBook
+        Looks positions up in a book file, mapped into memory, with a binary search on the
+        sorted position keys. Book moves are checked against the position, so a key collision
+        never plays an illegal move.
+    Attributes:
+        path -- a string, the book file
+        count -- an integer, the number of records
+        hits -- an integer, lookups that found a book move
+        misses -- an integer, lookups that did not
+    Methods:
+        lookup, choose_move, close
+    '''
+
+
+    def __init__(self, path = DEFAULT_PATH):
+        '''
+        Constructor -- creates a new instance of OpeningBook.
+        Parameters:
+            self -- the current OpeningBook object
+            path -- a string, the book file
+        '''
+        self.path = path
+        self.file = open(path, 'rb')
+        self.mapping = mmap.mmap(self.file.fileno(), 0, access = mmap.ACCESS_READ)
+        magic, self.count = HEADER.unpack_from(self.mapping)
+        if magic != MAGIC or len(self.mapping) != HEADER.size + self.count * RECORD.size:
+            self.close()
+            raise ValueError('corrupt book ' + path)
+        self.hits = 0
+        self.misses = 0
+
+
+    def lookup(self, board):
+        '''
+        Method -- lookup
+            Gets the book moves of a position.
+        Parameters:
+            board -- a Bitboard
+        Returns:
+            A list of tuples (move, weight, plays, wins, draws), move being a legal Move, empty if
+            the position is not in the book.
+        '''
+        key = board.key
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if KEY.unpack_from(self.mapping, HEADER.size + middle * RECORD.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        res = []
+        legal = None
+        for index in range(low, self.count):
+            record_key, from_square, to_square, captured, weight, plays, wins, draws = \
+                RECORD.unpack_from(self.mapping, HEADER.size + index * RECORD.size)
+            if record_key != key:
+                break
+            if legal is None:
+                legal = {(move.path[0], move.path[-1], move.captured): move for move in board.generate_moves()}
+            move = legal.get((from_square, to_square, captured))
+            if move:
+                res.append((move, weight, plays, wins, draws))
+        return res
+
+
+    def choose_move(self, board, rng = None):
+        '''
+        Method -- choose_move
+            Picks a book move of a position.
+        Parameters:
+            board -- a Bitboard
+            rng -- a random.Random to pick moves in proportion to their weight, None for the heaviest
+        Returns:
+            A Move, None if the position is not in the book.
+        '''
+        entries = self.lookup(board)
+        if not entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if rng is None:
+            return max(entries, key = lambda entry: entry[1])[0]
+        return rng.choices([entry[0] for entry in entries], [entry[1] for entry in entries])[0]
+
+
+    def close(self):
+        '''
+        Method -- close
+            Unmaps the book. It cannot be used afterwards.
+        Parameters:
+            N/A
+        Returns:
+            N/A, but closes the file.
+        '''
+        self.mapping.close()
+        self.file.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Build a checkers opening book.')
+    parser.add_argument('--games', type = int, default = DEFAULT_GAMES, help = 'self-play games to play')
+    parser.add_argument('--depth', type = int, default = DEFAULT_DEPTH, help = 'the search depth of self-play')
+    parser.add_argument('--seed', type = int, default = 0, help = 'seeds the random opening plies')
+    parser.add_argument('--plies', type = int, default = DEFAULT_PLIES, help = 'the plies of each game to keep')
+    parser.add_argument('--import', dest = 'imported', action = 'append', default = [],
+                        help = 'a JSON lines file of games to add, may be repeated')
+    parser.add_argument('--output', default = DEFAULT_PATH, help = 'the book file to write')
+    args = parser.parse_args()
+    games = list(self_play(args.games, args.depth, args.seed))
+    for path in args.imported:
+        games.extend(read_games(path))
+    count = write_book(args.output, collect(games, args.plies))
+    print('games', len(games), 'records', count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,408 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To search for the computer player's moves on several CPU cores, splitting the root moves between processes
+'''
+
+
+import itertools
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from engine import Engine, SearchAborted, WIN_SCORE, MAX_PLY, DEFAULT_DEPTH, DEFAULT_TIME
+from transposition import TranspositionTable
+from shared_transposition import SharedTranspositionTable
+from metrics import METRICS
+
+
+WORKER_TABLE_CAPACITY = 1 << 16
+# Seconds between two looks at the cancel event while waiting for the workers.
+POLL_INTERVAL = 0.01
+# Workers are forked where the platform allows it, so they start fast and never re-run the main module.
+START_METHOD = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# Numbers every search of this process, so the processes searching for it can tell a new one.
+search_ids = itertools.count(1)
+
+worker_table = None
+worker_shared = False
+worker_stop_event = None
+worker_search = None
+worker_tablebase = None
+
+
+def init_worker(stop_event, table_name = None, table_capacity = None, tablebase_directory = None):
+    '''
+    Function -- init_worker
+        Sets up a worker process: its stop event, inherited from the parent, its table,
+        attached to the parent's shared table if there is one, and its own mappings of the
+        parent's tablebase if there is one.
+    Parameters:
+        stop_event -- a multiprocessing Event, set by the parent to stop every worker
+        table_name -- a string, the name of the shared table, None for a private table
+        table_capacity -- an integer, the number of slots of the shared table
+        tablebase_directory -- a string, the directory of the tablebase, None for none
+    Returns:
+        N/A, but sets the globals of the worker process.
+    '''
+    global worker_table, worker_shared, worker_stop_event, worker_tablebase
+    worker_stop_event = stop_event
+    if tablebase_directory is not None:
+        # tablebase builds its tables with START_METHOD from here, so it is imported only once both are loaded.
+        from tablebase import Tablebase
+        worker_tablebase = Tablebase(tablebase_directory)
+    worker_shared = table_name is not None
+    if worker_shared:
+        worker_table = SharedTranspositionTable(table_capacity, table_name)
+    else:
+        worker_table = TranspositionTable(WORKER_TABLE_CAPACITY)
+
+
+def search_root_move(board, move, depth, deadline, node_limit, stop_event = None, table = None,
+                     alpha = -WIN_SCORE - 1, beta = WIN_SCORE + 1, search = None, tablebase = None):
+    '''
+    Function -- search_root_move
+        Searches one root move to a fixed depth, in a worker process or in the calling one.
+        A private table is kept from one call to the next of the same search, so later
+        iterations and root moves start from the scores and best moves stored by the earlier
+        ones, and is emptied when a new search begins. With a shared table, every call starts
+        from what every process has stored.
+    Parameters:
+        board -- a Bitboard
+        move -- a Move of the player to move
+        depth -- an integer, the depth of the search, the move itself included
+        deadline -- a float, the time.monotonic() value to stop at, None for no limit
+        node_limit -- an integer, nodes for this move, None for no limit
+        stop_event -- an Event to stop at, None for the one of the worker process
+        table -- a SharedTranspositionTable to use in the calling process, None for the worker's table
+        alpha -- an integer, the score the player to move is already sure of
+        beta -- an integer, the score the opponent is already sure of
+        search -- an integer from search_ids, the search the call belongs to, None to empty a private table first
+        tablebase -- a Tablebase to use in the calling process, None for the worker's, if any
+    Returns:
+        A tuple (score, line, nodes), score and line being None if the search was stopped.
+        A score of alpha or less only bounds the move from above, one of beta or more from below.
+    '''
+    global worker_table, worker_search
+    if table is None:
+        if worker_table is None:
+            worker_table = TranspositionTable(WORKER_TABLE_CAPACITY)
+        table = worker_table
+        if not worker_shared and (search is None or search != worker_search):
+            table.clear()
+            worker_search = search
+    time_limit = None if deadline is None else max(0.0, deadline - time.monotonic())
+    engine = Engine(depth, time_limit, node_limit, table, worker_tablebase if tablebase is None else tablebase)
+    try:
+        score, line = engine.search_move(board, move, depth, alpha, beta,
+                                         worker_stop_event if stop_event is None else stop_event)
+    except SearchAborted:
+        return None, None, engine.nodes
+    return score, line, engine.nodes
+
+
+class ParallelEngine:
+    '''
+    Class -- ParallelEngine
+        A drop-in replacement for Engine as State's computer player. Each iteration of the
+        iterative deepening splits the root the young brothers wait way: the best move of the
+        previous iteration is searched alone with a full window, then the other root moves are
+        searched at once on a process pool with a null window around its score, to prove them
+        no better. The few that fail high are searched again one by one, in generation order,
+        with a window above the best score so far. Ties go to the move searched first. Each
+        process keeps its table through the iterations of a search and empties it for the next
+        one, so what a process stored depends on which moves it was handed, and the result may
+        differ with the number of workers. With a shared table the workers also reuse each
+        other's results.
+    Attributes:
+        workers -- an integer, the number of processes, 1 to search in the calling process
+        max_depth -- an integer, the deepest iteration to search
+        time_limit -- a float, seconds per search, None for no limit
+        node_limit -- an integer, nodes per root move search, None for no limit
+        nodes -- an integer, nodes visited by the last search, over every process
+        depth -- an integer, the deepest iteration the last search completed
+        elapsed -- a float, seconds the last search took
+        context -- a multiprocessing context, starting the worker processes with START_METHOD
+        cancel_event -- an Event belonging to the running or last search, set by cancel
+        search_id -- an integer from search_ids, numbering the running or last search
+        stop_event -- a multiprocessing Event, set to stop the workers once the cancel event is, cleared by each search
+        pool -- a ProcessPoolExecutor, created on the first parallel search, None before
+        shared_table -- a SharedTranspositionTable used by every worker, None for private tables
+        tablebase -- a Tablebase giving the exact result of endgames, each worker mapping its directory itself, None if unused
+        book -- an OpeningBook answering known openings without a search, None if unused
+        verbose -- a boolean, True to print the result of every choose_move
+    Methods:
+        choose_move, search, search_depth, search_moves, get_pool, cancel, close
+    '''
+
+
+    def __init__(self, workers = 1, max_depth = DEFAULT_DEPTH, time_limit = DEFAULT_TIME, node_limit = None,
+                 shared_capacity = None, tablebase = None, book = None, verbose = False):
+        '''
+        Constructor -- creates a new instance of ParallelEngine.
+        Parameters:
+            self -- the current ParallelEngine object
+            workers -- an integer, the number of processes, at least 1
+            max_depth -- an integer, the deepest iteration to search
+            time_limit -- a float, seconds per search, None for no limit
+            node_limit -- an integer, nodes per root move search, None for no limit
+            shared_capacity -- an integer, the slots of a table shared by every worker, None for private tables
+            tablebase -- a Tablebase, None to search endgames like any other position
+            book -- an OpeningBook, None to search every position
+            verbose -- a boolean, True to print the result of every choose_move
+        '''
+        if workers < 1:
+            raise ValueError('workers must be at least 1')
+        self.workers = workers
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.nodes = 0
+        self.depth = 0
+        self.elapsed = 0.0
+        self.context = multiprocessing.get_context(START_METHOD)
+        self.cancel_event = threading.Event()
+        self.search_id = None
+        self.stop_event = self.context.Event()
+        self.pool = None
+        self.shared_table = None if shared_capacity is None else SharedTranspositionTable(shared_capacity)
+        self.tablebase = tablebase
+        self.book = book
+        self.verbose = verbose
+
+
+    def choose_move(self, board, stop_event = None):
+        '''
+        Method -- choose_move
+            Picks the move to play in a position, from the book if it has the position. The
+            depth and nodes of the search, over every process, are added to the metrics.
+        Parameters:
+            board -- a Bitboard, with the engine's side to move
+            stop_event -- an Event belonging to this move only, set to stop its search, None for a new one
+        Returns:
+            A Move, None if the player to move has lost.
+        '''
+        moves = board.generate_moves()
+        if len(moves) <= 1:
+            return moves[0] if moves else None
+        if self.book:
+            move = self.book.choose_move(board)
+            if move:
+                if self.verbose:
+                    print('engine: book move', move)
+                METRICS.inc('book_moves')
+                return move
+        line, score = self.search(board, stop_event)
+        METRICS.inc('engine_searches')
+        METRICS.inc('engine_depth', self.depth)
+        METRICS.inc('engine_nodes', self.nodes)
+        if self.verbose:
+            print('engine: workers', self.workers, 'depth', self.depth, 'nodes', self.nodes, 'score', score,
+                  'line', ' '.join(str(move) for move in line))
+        return line[0] if line else None
+
+
+    def search(self, board, stop_event = None):
+        '''
+        Method -- search
+            Searches a position with iterative deepening until the depth, time or node budget
+            runs out, or the stop event is set. The result of the deepest completed iteration is
+            kept. Like Engine.search, a stop event set before the search starts stops it at the
+            first budget check, and a cancel aimed at an earlier search never reaches this one.
+        Parameters:
+            board -- a Bitboard
+            stop_event -- an Event belonging to this search only, None for a new one, set by cancel
+        Returns:
+            A tuple (line, score): the best line as a list of Move, and its score for the player to move.
+        '''
+        self.cancel_event = threading.Event() if stop_event is None else stop_event
+        self.stop_event.clear()
+        self.search_id = next(search_ids)
+        start = time.perf_counter()
+        deadline = None if self.time_limit is None else time.monotonic() + self.time_limit
+        self.nodes = 0
+        self.depth = 0
+        moves = board.generate_moves()
+        if not moves:
+            return [], -WIN_SCORE
+        best_line, best_score = [moves[0]], 0
+        for depth in range(1, self.max_depth + 1):
+            score, line = self.search_depth(board, moves, depth, deadline)
+            if score is None:
+                break
+            best_line, best_score = line, score
+            self.depth = depth
+            moves.remove(line[0])
+            moves.insert(0, line[0])
+            if abs(best_score) >= WIN_SCORE - MAX_PLY:
+                break
+        self.elapsed = time.perf_counter() - start
+        return best_line, best_score
+
+
+    def search_depth(self, board, moves, depth, deadline):
+        '''
+        Method -- search_depth
+            Searches the root moves to a fixed depth: the first one with a full window, then the
+            others with a null window around its score, then those that fail high again with a
+            window above the best score so far.
+        Parameters:
+            board -- a Bitboard
+            moves -- a list of Move, the root moves, best guess first
+            depth -- an integer, the depth of this iteration
+            deadline -- a float, the time.monotonic() value to stop at, None for no limit
+        Returns:
+            A tuple (score, line), both None if the budget ran out before the iteration completed.
+        '''
+        best_score, best_line = self.search_moves(board, moves[:1], depth, deadline)[0]
+        if best_score is None:
+            return None, None
+        scouts = self.search_moves(board, moves[1:], depth, deadline, best_score, best_score + 1)
+        if len(scouts) < len(moves) - 1:
+            return None, None
+        for move, (score, line) in zip(moves[1:], scouts):
+            if score is None:
+                return None, None
+            if score <= best_score:
+                continue
+            score, line = self.search_moves(board, [move], depth, deadline, best_score)[0]
+            if score is None:
+                return None, None
+            if score > best_score:
+                best_score, best_line = score, line
+        return best_score, best_line
+
+
+    def search_moves(self, board, moves, depth, deadline, alpha = -WIN_SCORE - 1, beta = WIN_SCORE + 1):
+        '''
+        Method -- search_moves
+            Searches root moves within the same window, on the pool when there are several
+            workers and moves, and adds their nodes to the count.
+        Parameters:
+            board -- a Bitboard
+            moves -- a list of Move, the root moves
+            depth -- an integer, the depth of this iteration
+            deadline -- a float, the time.monotonic() value to stop at, None for no limit
+            alpha -- an integer, the score the player to move is already sure of
+            beta -- an integer, the score the opponent is already sure of
+        Returns:
+            A list of tuples (score, line), in the order of moves. Searching in the calling
+            process stops at the first move that runs out of budget, so the list may be shorter.
+        '''
+        if self.workers == 1 or len(moves) == 1:
+            results = []
+            for move in moves:
+                results.append(search_root_move(board, move, depth, deadline, self.node_limit, self.cancel_event,
+                                                self.shared_table, alpha, beta, self.search_id, self.tablebase))
+                if results[-1][0] is None:
+                    break
+        else:
+            pool = self.get_pool()
+            futures = [pool.submit(search_root_move, board, move, depth, deadline, self.node_limit,
+                                   alpha = alpha, beta = beta, search = self.search_id) for move in moves]
+            while wait(futures, timeout = POLL_INTERVAL).not_done:
+                if self.cancel_event.is_set():
+                    self.stop_event.set()
+            results = [future.result() for future in futures]
+        self.nodes += sum(nodes for score, line, nodes in results)
+        return [(score, line) for score, line, nodes in results]
+
+
+    def get_pool(self):
+        '''
+        Method -- get_pool
+            Gets the process pool, starting it and its processes on first use. Forking while
+            other threads run can copy a lock one of them holds, so with a GUI call it from the
+            main thread before the game starts, not first from the thread searching.
+        Parameters:
+            N/A
+        Returns:
+            A ProcessPoolExecutor with one process per worker.
+        '''
+        if self.pool is None:
+            initargs = (self.stop_event,
+                        None if self.shared_table is None else self.shared_table.name,
+                        None if self.shared_table is None else self.shared_table.capacity,
+                        None if self.tablebase is None else self.tablebase.directory)
+            self.pool = ProcessPoolExecutor(max_workers = self.workers, mp_context = self.context,
+                                            initializer = init_worker, initargs = initargs)
+            self.pool.submit(time.sleep, 0).result()
+        return self.pool
+
+
+    def cancel(self):
+        '''
+        Method -- cancel
+            Asks a running search, possibly on another thread, to stop and return its best line so far.
+            The next search does not see it, as with Engine.cancel.
+        Parameters:
+            N/A
+        Returns:
+            N/A, but sets the cancel event of the running or last search, which stops every worker.
+        '''
+        self.cancel_event.set()
+
+
+    def close(self):
+        '''
+        Method -- close
+            Shuts the process pool down and frees the shared table.
+        Parameters:
+            N/A
+        Returns:
+            N/A, but stops the worker processes.
+        '''
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+        if self.shared_table is not None:
+            self.shared_table.close()
+            self.shared_table.unlink()
+            self.shared_table = None
+
+
+def measure_speedup(board, depth, worker_counts):
+    '''
+    Function -- measure_speedup
+        Searches a position to a fixed depth with the serial Engine, then with each number of
+        workers, and compares every time with the one of the serial Engine.
+    Parameters:
+        board -- a Bitboard
+        depth -- an integer, the depth to search
+        worker_counts -- a list of integers, the numbers of workers to try
+    Returns:
+        A list of dicts with the keys workers, seconds, nodes, speedup, efficiency and move,
+        the first one for the serial Engine, with 0 workers, then one per number of workers.
+    '''
+    engine = Engine(depth, None)
+    start = time.perf_counter()
+    line, score = engine.search(board)
+    serial = time.perf_counter() - start
+    res = [{'workers': 0, 'seconds': serial, 'nodes': engine.nodes, 'speedup': 1.0, 'efficiency': 1.0,
+            'move': str(line[0])}]
+    for workers in worker_counts:
+        engine = ParallelEngine(workers, depth, None)
+        if workers > 1:
+            engine.get_pool()
+        line, score = engine.search(board)
+        engine.close()
+        speedup = serial / engine.elapsed
+        res.append({'workers': workers, 'seconds': engine.elapsed, 'nodes': engine.nodes, 'speedup': speedup,
+                    'efficiency': speedup / workers, 'move': str(line[0])})
+    return res
+
+
+def print_speedup(results):
+    '''
+    Function -- print_speedup
+        Prints the results of measure_speedup as a table.
+    Parameters:
+        results -- a list of dicts, as returned by measure_speedup
+    Returns:
+        N/A, but prints one line for the serial Engine, then one per number of workers.
+    '''
+    print('workers  seconds     nodes  speedup  efficiency  move')
+    for row in results:
+        print('%7s  %7.2f  %8d  %7.2f  %10.2f  %s' % (row['workers'] or 'serial', row['seconds'], row['nodes'],
+                                                     row['speedup'], row['efficiency'], row['move']))
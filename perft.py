@@ -0,0 +1,262 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To count the move paths from a position, checking and timing the move generators
+'''
+
+
+import argparse
+import time
+from bitboard import Bitboard, INITIAL_BLACK, INITIAL_RED, BLACK, RED
+from move import Move
+from tables import NUM_DARK_SQUARES, coord_to_square
+from transposition import TranspositionTable, EXACT
+
+
+PIECE_CHARS = '.bBrR'
+TURN_CHARS = 'br'
+DEFAULT_DEPTH = 6
+PERFT_TABLE_CAPACITY = 1 << 20
+
+
+def parse_position(text):
+    '''
+    Function -- parse_position
+        Reads a position written as the player to move, a colon and the 32 dark squares from
+        square 0 up: '.' for an empty square, 'b' or 'r' for a man, 'B' or 'R' for a king.
+        The initial position is 'b:bbbbbbbbbbbb........rrrrrrrrrrrr'.
+    Parameters:
+        text -- a string
+    Returns:
+        A Bitboard.
+    Raises:
+        ValueError if the text is malformed.
+    '''
+    turn, separator, squares = text.strip().partition(':')
+    if turn not in TURN_CHARS or len(squares) != NUM_DARK_SQUARES or any(char not in PIECE_CHARS for char in squares):
+        raise ValueError('bad position ' + text)
+    board = Bitboard(turn = TURN_CHARS.index(turn))
+    for square, char in enumerate(squares):
+        if char != '.':
+            board.put(square, BLACK if char in 'bB' else RED, char.isupper())
+    return board
+
+
+def format_position(board):
+    '''
+    Function -- format_position
+        Writes a position the way parse_position reads it.
+    Parameters:
+        board -- a Bitboard
+    Returns:
+        A string.
+    '''
+    squares = ''
+    for square in range(NUM_DARK_SQUARES):
+        bit = 1 << square
+        if board.black & bit:
+            squares += 'B' if board.kings & bit else 'b'
+        elif board.red & bit:
+            squares += 'R' if board.kings & bit else 'r'
+        else:
+            squares += '.'
+    return TURN_CHARS[board.turn] + ':' + squares
+
+
+def perft(board, depth):
+    '''
+    Function -- perft
+        Counts the move paths of a number of whole turns from a position.
+    Parameters:
+        board -- a Bitboard
+        depth -- an integer, the number of turns
+    Returns:
+        An integer, the number of leaf positions, counted once per path.
+    '''
+    if depth == 0:
+        return 1
+    moves = board.generate_moves()
+    if depth == 1:
+        return len(moves)
+    return sum(perft(board.apply_move(move), depth - 1) for move in moves)
+
+
+def hashed_perft(board, depth, table):
+    '''
+    Function -- hashed_perft
+        Counts like perft, caching the count of every subtree by its Zobrist key and depth,
+        so that a position reached by several paths is only counted once.
+    Parameters:
+        board -- a Bitboard
+        depth -- an integer, the number of turns
+        table -- a TranspositionTable, holding counts in place of scores
+    Returns:
+        An integer, the same as perft.
+    '''
+    if depth == 0:
+        return 1
+    if depth == 1:
+        return len(board.generate_moves())
+    entry = table.probe(board.key)
+    if entry and entry[0] == depth:
+        return entry[1]
+    res = sum(hashed_perft(board.apply_move(move), depth - 1, table) for move in board.generate_moves())
+    table.store(board.key, depth, res, EXACT, None)
+    return res
+
+
+def divide(board, depth, table = None):
+    '''
+    Function -- divide
+        Splits the count of perft between the moves of the position, to find which move a
+        wrong count comes from.
+    Parameters:
+        board -- a Bitboard
+        depth -- an integer, the number of turns, at least 1
+        table -- a TranspositionTable to count with hashed_perft, None for perft
+    Returns:
+        A list of tuples (move, count), in generation order.
+    '''
+    res = []
+    for move in board.generate_moves():
+        child = board.apply_move(move)
+        res.append((move, perft(child, depth - 1) if table is None else hashed_perft(child, depth - 1, table)))
+    return res
+
+
+def state_moves(state):
+    '''
+    Function -- state_moves
+        Generates the whole-turn moves of a State with its own cell-by-cell rules,
+        search_next_moves to start and search_next_jumps to go on capturing, as a reference
+        for Bitboard.generate_moves. Moves are deduplicated the way Bitboard.capture_paths does.
+    Parameters:
+        state -- a State with a rendered checkerboard
+    Returns:
+        A list of Move.
+    '''
+    starts = []
+    for x in range(state.num_cells):
+        for y in range(state.num_cells):
+            cell = state.checkerboard[x][y]
+            if cell.occupied and cell.occupied.player == state.turn:
+                starts.append((cell, state.search_next_moves(cell)))
+    capture = any(not cell.is_adjacent(to_cell) for cell, targets in starts for to_cell in targets)
+    res = []
+    seen = set()
+    for cell, targets in starts:
+        for to_cell in targets:
+            if capture == cell.is_adjacent(to_cell):
+                continue
+            if not capture:
+                crowned = not cell.occupied.is_king and to_cell.coord.y == (state.num_cells - 1) * (1 - state.turn)
+                res.append(Move((cell_square(cell), cell_square(to_cell)), 0, crowned))
+                continue
+            for move in state_jumps(state, cell, to_cell, [cell_square(cell)], 0, cell.occupied.is_king):
+                key = (move.path[0], move.path[-1], move.captured, move.crowned)
+                if key not in seen:
+                    seen.add(key)
+                    res.append(move)
+    return res
+
+
+def state_jumps(state, from_cell, to_cell, path, captured, was_king):
+    '''
+    Function -- state_jumps
+        Plays one jump on the checkerboard of a State, then every way to go on capturing,
+        and takes the jump back.
+    Parameters:
+        state -- a State
+        from_cell -- a cell, where the jumping piece stands
+        to_cell -- a cell, where it lands
+        path -- a list of integers, the squares visited so far
+        captured -- an integer, the mask of the pieces captured so far
+        was_king -- a boolean, True if the piece was a king when the turn started
+    Returns:
+        A list of Move, the complete capture sequences through this jump.
+    '''
+    piece = from_cell.occupied
+    is_king = piece.is_king
+    over = state.checkerboard[(from_cell.coord.x + to_cell.coord.x) // 2][(from_cell.coord.y + to_cell.coord.y) // 2]
+    over_piece = over.occupied
+    key = state.key
+    state.move_piece(from_cell, to_cell)
+    over.occupied = 0
+    path = path + [cell_square(to_cell)]
+    captured |= 1 << cell_square(over)
+    res = []
+    for next_cell in state.search_next_jumps(to_cell):
+        res.extend(state_jumps(state, to_cell, next_cell, path, captured, was_king))
+    if not res:
+        res.append(Move(tuple(path), captured, piece.is_king and not was_king))
+    over.occupied = over_piece
+    to_cell.occupied = 0
+    from_cell.occupied = piece
+    if piece.is_king and not is_king:
+        piece.uncrown()
+    state.key = key
+    return res
+
+
+def cell_square(cell):
+    '''
+    Function -- cell_square
+        Gets the square index of a cell.
+    Parameters:
+        cell -- a cell
+    Returns:
+        An integer in [0, 32).
+    '''
+    return coord_to_square(cell.coord.x, cell.coord.y)
+
+
+def state_perft(state, depth):
+    '''
+    Function -- state_perft
+        Counts like perft on a State, with state_moves, make_move and unmake_move.
+    Parameters:
+        state -- a State with a rendered checkerboard
+        depth -- an integer, the number of turns
+    Returns:
+        An integer.
+    '''
+    if depth == 0:
+        return 1
+    res = 0
+    for move in state_moves(state):
+        record = state.make_move(move)
+        res += state_perft(state, depth - 1)
+        state.unmake_move(record)
+    return res
+
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Count the move paths from a checkers position.')
+    parser.add_argument('depth', type = int, nargs = '?', default = DEFAULT_DEPTH, help = 'the number of turns')
+    parser.add_argument('--position', default = None, help = 'the position, such as ' +
+                        format_position(Bitboard(INITIAL_BLACK, INITIAL_RED)) + ', the initial one by default')
+    parser.add_argument('--divide', action = 'store_true', help = 'print the count of every move')
+    parser.add_argument('--hashed', action = 'store_true', help = 'cache subtree counts by Zobrist key')
+    parser.add_argument('--capacity', type = int, default = PERFT_TABLE_CAPACITY, help = 'slots of the hashed perft cache')
+    args = parser.parse_args()
+    board = Bitboard(INITIAL_BLACK, INITIAL_RED) if args.position is None else parse_position(args.position)
+    table = TranspositionTable(args.capacity) if args.hashed else None
+    start = time.perf_counter()
+    if args.divide:
+        total = 0
+        for move, count in divide(board, args.depth, table):
+            print(move, count)
+            total += count
+    elif table is None:
+        total = perft(board, args.depth)
+    else:
+        total = hashed_perft(board, args.depth, table)
+    seconds = time.perf_counter() - start
+    print('depth', args.depth, 'nodes', total, 'seconds', round(seconds, 3),
+          'nodes/s', round(total / seconds) if seconds else 0)
+    if table is not None:
+        print('cache: hits', table.hits, 'misses', table.misses, 'filled', table.filled(), '/', table.capacity)
+
+
+if __name__ == "__main__":
+    main()
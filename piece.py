@@ -3,7 +3,8 @@ Created by: Shiyao Wang
 Time: Nov 11, 2020
 Purpose: To represent a piece in the game of Checker
 '''
-import turtle
+
+from frozen_piece import piece_of
 
 DEFAULT_PIECE_COLOR = 'gray'
 CROWN_COLOR = 'gold'
@@ -25,9 +26,11 @@ class Piece:
         crown_size -- size of the crown, visible if the piec is a king piece
         crown_color -- a string, the color of the crown
     Methods:
-        crown, render_piece, render_circle, render_crown
+        crown, uncrown, freeze, render_piece, render_circle, render_crown
     '''
 
+    __slots__ = ('player', 'color', 'radius', 'is_king', 'crown_size', 'crown_color')
+
 
     def __init__(self = -1, player = -1, colors = [DEFAULT_PIECE_COLOR, DEFAULT_PIECE_COLOR], radius = -1, is_king = False):
         '''
@@ -85,6 +88,30 @@ class Piece:
             N/A. Marks the attribute is_king True.
         '''
         self.is_king = True
+
+
+    def uncrown(self):
+        '''
+        Function -- uncrown
+            Mark the piece as a non-king piece again, when the move that crowned it is taken back.
+        Parameters:
+            N/A
+        Returns:
+            N/A. Marks the attribute is_king False.
+        '''
+        self.is_king = False
+
+
+    def freeze(self):
+        '''
+        Function -- freeze
+            Gets the immutable, hashable counterpart of this piece, without the rendering fields.
+        Parameters:
+            N/A
+        Returns:
+            The interned FrozenPiece with the same player and is_king.
+        '''
+        return piece_of(self.player, self.is_king)
     
 
     def render_piece(self, pen):
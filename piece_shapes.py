@@ -0,0 +1,99 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To register the pieces as turtle shapes once, so a piece is shown by giving a turtle its shape
+'''
+
+
+import math
+import turtle
+from piece import CROWN_COLOR, CROWN_ROTATE, CROWN_SHIFT, OCT_ANGLE, NUM_EDGE_OCTAGRAM
+
+
+CIRCLE_STEPS = 36
+SHAPE_PREFIX = 'checkers_piece'
+
+
+def circle_points(radius, steps = CIRCLE_STEPS):
+    '''
+    Function -- circle_points
+        Gets the outline Piece.render_circle draws: a circle started at its bottom, counterclockwise.
+    Parameters:
+        radius -- an integer, the radius of the piece
+        steps -- an integer, the number of edges
+    Returns:
+        A list of tuples (x, y), offsets from where the turtle stands.
+    '''
+    return [(radius * math.sin(2 * math.pi * step / steps), radius - radius * math.cos(2 * math.pi * step / steps))
+            for step in range(steps)]
+
+
+def crown_points(radius):
+    '''
+    Function -- crown_points
+        Gets the octagram Piece.render_crown draws after Piece.render_piece turns and shifts the turtle.
+    Parameters:
+        radius -- an integer, the radius of the piece, also the edge of the octagram
+    Returns:
+        A list of tuples (x, y), offsets from where the turtle stands.
+    '''
+    heading = math.radians(CROWN_ROTATE)
+    x, y = CROWN_SHIFT * math.cos(heading), CROWN_SHIFT * math.sin(heading)
+    res = []
+    for edge in range(NUM_EDGE_OCTAGRAM):
+        res.append((x, y))
+        x, y = x + radius * math.cos(heading), y + radius * math.sin(heading)
+        heading -= math.radians(OCT_ANGLE)
+    return res
+
+
+def to_shape(points):
+    '''
+    Function -- to_shape
+        Converts screen offsets to the coordinates of a turtle shape, which turtle draws turned
+        a quarter turn clockwise for a turtle heading east.
+    Parameters:
+        points -- a list of tuples (x, y)
+    Returns:
+        A tuple of tuples (x, y).
+    '''
+    return tuple((- y, x) for x, y in points)
+
+
+def shape_name(player, is_king):
+    '''
+    Function -- shape_name
+        Gets the registered name of the shape of a piece.
+    Parameters:
+        player -- an integer, the player of the piece
+        is_king -- a boolean, True for a king
+    Returns:
+        A string.
+    '''
+    return SHAPE_PREFIX + '_' + str(int(player)) + ('_king' if is_king else '_man')
+
+
+def register_piece_shapes(screen, colors, radius):
+    '''
+    Function -- register_piece_shapes
+        Registers a compound shape for the man and the king of every player: a filled circle,
+        under a filled octagram for a king, as Piece.render_piece draws them.
+    Parameters:
+        screen -- a turtle screen
+        colors -- a list of strings, the piece color of every player
+        radius -- an integer, the radius of the pieces
+    Returns:
+        A list of strings, the names registered.
+    '''
+    circle = to_shape(circle_points(radius))
+    crown = to_shape(crown_points(radius))
+    res = []
+    for player, color in enumerate(colors):
+        for is_king in (False, True):
+            shape = turtle.Shape('compound')
+            shape.addcomponent(circle, color, color)
+            if is_king:
+                shape.addcomponent(crown, CROWN_COLOR, CROWN_COLOR)
+            screen.register_shape(shape_name(player, is_king), shape)
+            res.append(shape_name(player, is_king))
+    return res
@@ -0,0 +1,260 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To share one transposition table between search processes through shared memory
+'''
+
+
+from multiprocessing import shared_memory
+from move import Move
+from transposition import DEFAULT_CAPACITY
+
+
+WORDS_PER_ENTRY = 3
+WORD_BYTES = 8
+ENTRY_BYTES = WORDS_PER_ENTRY * WORD_BYTES
+WORD_MASK = (1 << 64) - 1
+
+# Fields of the data word, from the lowest bit.
+SCORE_BITS = 18
+DEPTH_BITS = 8
+BOUND_BITS = 2
+SQUARE_BITS = 5
+SCORE_OFFSET = 1 << (SCORE_BITS - 1)
+DEPTH_OFFSET = 1 << (DEPTH_BITS - 1)
+DEPTH_SHIFT = SCORE_BITS
+BOUND_SHIFT = DEPTH_SHIFT + DEPTH_BITS
+FROM_SHIFT = BOUND_SHIFT + BOUND_BITS
+TO_SHIFT = FROM_SHIFT + SQUARE_BITS
+HAS_MOVE_BIT = 1 << (TO_SHIFT + SQUARE_BITS)
+CROWNED_BIT = HAS_MOVE_BIT << 1
+VALID_BIT = CROWNED_BIT << 1
+
+
+def pack(depth, score, bound, move):
+    '''
+    Function -- pack
+        Packs an entry into its data word and its move word.
+    Parameters:
+        depth -- an integer, clamped to [-128, 128)
+        score -- an integer in [-131072, 131072)
+        bound -- an integer, EXACT, LOWER or UPPER
+        move -- a Move, None if unknown
+    Returns:
+        A tuple of two integers (data, captured), each fitting in 64 bits.
+    '''
+    depth = max(-DEPTH_OFFSET, min(DEPTH_OFFSET - 1, depth))
+    data = VALID_BIT | (score + SCORE_OFFSET) | (depth + DEPTH_OFFSET) << DEPTH_SHIFT | bound << BOUND_SHIFT
+    if move is None:
+        return data, 0
+    data |= HAS_MOVE_BIT | move.path[0] << FROM_SHIFT | move.path[-1] << TO_SHIFT
+    if move.crowned:
+        data |= CROWNED_BIT
+    return data, move.captured
+
+
+def unpack(data, captured):
+    '''
+    Function -- unpack
+        Unpacks the words written by pack.
+    Parameters:
+        data -- an integer, the data word
+        captured -- an integer, the move word
+    Returns:
+        A tuple (depth, score, bound, move). The move only has its first and last squares,
+        which together with the captured squares and the crowning is all Bitboard.apply_move needs.
+    '''
+    score = (data & ((1 << SCORE_BITS) - 1)) - SCORE_OFFSET
+    depth = (data >> DEPTH_SHIFT & ((1 << DEPTH_BITS) - 1)) - DEPTH_OFFSET
+    bound = data >> BOUND_SHIFT & ((1 << BOUND_BITS) - 1)
+    move = None
+    if data & HAS_MOVE_BIT:
+        square_mask = (1 << SQUARE_BITS) - 1
+        move = Move((data >> FROM_SHIFT & square_mask, data >> TO_SHIFT & square_mask), captured, bool(data & CROWNED_BIT))
+    return depth, score, bound, move
+
+
+class SharedTranspositionTable:
+    '''
+    Class -- SharedTranspositionTable
+        A TranspositionTable whose slots live in a shared memory block, so every process that
+        attaches to it by name reads and writes the same entries. A slot is three 64-bit words:
+        a check word, the data word and the move word. Writers do not lock; the check word is
+        the key XORed with the two others, so an entry torn by two processes writing at once
+        fails to verify and reads as a miss. Replacement is depth-preferred, as in TranspositionTable.
+    Attributes:
+        capacity -- an integer, the number of slots, a power of two
+        mask -- an integer, capacity - 1, picking the slot from the low bits of a key
+        name -- a string, the name of the shared memory block
+        memory -- a SharedMemory, the block holding the slots
+        words -- a memoryview of the block as unsigned 64-bit words
+        owner -- a boolean, True for the process that created the block and has to unlink it
+        hits -- an integer, probes of this process that found their position
+        misses -- an integer, probes of this process that did not
+        collisions -- an integer, probes of this process that found another position in the slot
+        stores -- an integer, entries this process wrote
+        rejected -- an integer, stores dropped to keep a deeper entry of another position
+    Methods:
+        slot, probe, store, clear, filled, hit_rate, close, unlink
+    '''
+
+
+    def __init__(self, capacity = DEFAULT_CAPACITY, name = None):
+        '''
+        Constructor -- creates a new instance of SharedTranspositionTable.
+        Parameters:
+            self -- the current SharedTranspositionTable object
+            capacity -- an integer, the number of slots, rounded down to a power of two
+            name -- a string, the block to attach to, None to create a new block
+        '''
+        if capacity < 1:
+            raise ValueError('capacity must be positive')
+        self.capacity = 1 << (capacity.bit_length() - 1)
+        self.mask = self.capacity - 1
+        self.owner = name is None
+        if self.owner:
+            self.memory = shared_memory.SharedMemory(create = True, size = self.capacity * ENTRY_BYTES)
+        else:
+            self.memory = shared_memory.SharedMemory(name = name)
+        self.name = self.memory.name
+        self.words = self.memory.buf[:self.capacity * ENTRY_BYTES].cast('Q')
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.stores = 0
+        self.rejected = 0
+
+
+    def slot(self, key):
+        '''
+        Method -- slot
+            Gets the slot a position goes to.
+        Parameters:
+            key -- an integer, the Zobrist key of the position
+        Returns:
+            An integer in [0, capacity).
+        '''
+        return key & self.mask
+
+
+    def probe(self, key):
+        '''
+        Method -- probe
+            Looks a position up.
+        Parameters:
+            key -- an integer, the Zobrist key of the position
+        Returns:
+            A tuple (depth, score, bound, move), None if the position is not in the table.
+        '''
+        words = self.words
+        index = (key & self.mask) * WORDS_PER_ENTRY
+        check = words[index]
+        data = words[index + 1]
+        captured = words[index + 2]
+        if data & VALID_BIT and check ^ data ^ captured == key:
+            self.hits += 1
+            return unpack(data, captured)
+        self.misses += 1
+        if data:
+            self.collisions += 1
+        return None
+
+
+    def store(self, key, depth, score, bound, move):
+        '''
+        Method -- store
+            Writes the result of a search, unless the slot holds a deeper search of another position.
+        Parameters:
+            key -- an integer, the Zobrist key of the position
+            depth -- an integer, the depth the position was searched to
+            score -- an integer, the score found
+            bound -- an integer, EXACT, LOWER or UPPER
+            move -- a Move, the best move found, None if unknown
+        Returns:
+            A boolean, True if the entry was written.
+        '''
+        words = self.words
+        index = (key & self.mask) * WORDS_PER_ENTRY
+        old_data = words[index + 1]
+        old_captured = words[index + 2]
+        same = old_data & VALID_BIT and words[index] ^ old_data ^ old_captured == key
+        if old_data & VALID_BIT and not same and \
+           depth < (old_data >> DEPTH_SHIFT & ((1 << DEPTH_BITS) - 1)) - DEPTH_OFFSET:
+            self.rejected += 1
+            return False
+        if same and move is None and old_data & HAS_MOVE_BIT:
+            move = unpack(old_data, old_captured)[3]
+        data, captured = pack(depth, score, bound, move)
+        words[index + 1] = data
+        words[index + 2] = captured
+        words[index] = (key ^ data ^ captured) & WORD_MASK
+        self.stores += 1
+        return True
+
+
+    def clear(self):
+        '''
+        Method -- clear
+            Empties every slot, for every attached process, and resets this process's counters.
+        Parameters:
+            N/A
+        Returns:
+            N/A, but empties the table.
+        '''
+        self.memory.buf[:self.capacity * ENTRY_BYTES] = bytes(self.capacity * ENTRY_BYTES)
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.stores = 0
+        self.rejected = 0
+
+
+    def filled(self):
+        '''
+        Method -- filled
+            Counts the slots in use, to size the table against the memory budget.
+        Parameters:
+            N/A
+        Returns:
+            An integer, the number of slots holding an entry.
+        '''
+        words = self.words
+        return sum(1 for index in range(1, self.capacity * WORDS_PER_ENTRY, WORDS_PER_ENTRY) if words[index])
+
+
+    def hit_rate(self):
+        '''
+        Method -- hit_rate
+            Gets the share of this process's probes that found their position.
+        Parameters:
+            N/A
+        Returns:
+            A float in [0, 1], 0 when nothing was probed yet.
+        '''
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+
+    def close(self):
+        '''
+        Method -- close
+            Detaches this process from the block. The table cannot be used afterwards.
+        Parameters:
+            N/A
+        Returns:
+            N/A, but releases the mapping.
+        '''
+        self.words.release()
+        self.memory.close()
+
+
+    def unlink(self):
+        '''
+        Method -- unlink
+            Frees the block once every process has closed it. Only the creating process should call this.
+        Parameters:
+            N/A
+        Returns:
+            N/A, but destroys the block.
+        '''
+        self.memory.unlink()
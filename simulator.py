@@ -0,0 +1,229 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To play many headless games between configurable players on a process pool, streaming the results as JSON lines
+'''
+
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from bitboard import Bitboard, INITIAL_BLACK, INITIAL_RED, BLACK, RED
+from engine import Engine
+from parallel_engine import START_METHOD, WORKER_TABLE_CAPACITY
+from transposition import TranspositionTable
+
+
+DEFAULT_GAMES = 100
+DEFAULT_PLAYER = 'random'
+MAX_GAME_PLIES = 200
+CHUNK_SIZE = 16
+REPORT_INTERVAL = 1000
+
+# Players built in each process, reused by every game it plays.
+players = {}
+
+
+def random_player(argument):
+    '''
+    Function -- random_player
+        Builds a player picking uniformly among the legal moves, like State without an engine.
+    Parameters:
+        argument -- a string, unused
+    Returns:
+        A function (board, moves, rng) -> Move.
+    '''
+    return lambda board, moves, rng: rng.choice(moves)
+
+
+def engine_player(argument):
+    '''
+    Function -- engine_player
+        Builds a player searching to a fixed depth, without a time limit, so that a game only
+        depends on its seed and not on the speed of the machine. Every move starts from an
+        empty table and fresh move ordering, like a root move of ParallelEngine, so it does not
+        depend on the games the process played before either. A forced move is played without
+        a search.
+    Parameters:
+        argument -- a string, the depth, 4 if empty
+    Returns:
+        A function (board, moves, rng) -> Move.
+    '''
+    depth = int(argument or 4)
+    table = TranspositionTable(WORKER_TABLE_CAPACITY)
+
+    def choose(board, moves, rng):
+        if len(moves) == 1:
+            return moves[0]
+        table.clear()
+        return Engine(depth, None, table = table).search(board)[0][0]
+
+    return choose
+
+
+def mcts_player(argument):
+    '''
+    Function -- mcts_player
+        Builds a player running a fixed number of Monte Carlo playouts, without a time limit.
+        The playouts of every move are seeded from the game's generator. NumPy is only
+        imported here, so the other players run without it.
+    Parameters:
+        argument -- a string, the playouts per move, DEFAULT_PLAYOUTS if empty
+    Returns:
+        A function (board, moves, rng) -> Move.
+    '''
+    import numpy as np
+    from mcts import Mcts, DEFAULT_PLAYOUTS
+    mcts = Mcts(int(argument or DEFAULT_PLAYOUTS), None)
+
+    def choose(board, moves, rng):
+        mcts.rng = np.random.default_rng(rng.getrandbits(64))
+        return mcts.search(board)[0][0]
+
+    return choose
+
+
+PLAYERS = {'random': random_player, 'engine': engine_player, 'mcts': mcts_player}
+
+
+def get_player(spec):
+    '''
+    Function -- get_player
+        Gets the player of a spec, such as 'random' or 'engine:6', building it on first use in this process.
+    Parameters:
+        spec -- a string, a name of PLAYERS, optionally followed by ':' and an argument
+    Returns:
+        A function (board, moves, rng) -> Move, moves being the legal moves, never empty.
+    Raises:
+        ValueError if the name is not in PLAYERS.
+    '''
+    if spec not in players:
+        name, separator, argument = spec.partition(':')
+        if name not in PLAYERS:
+            raise ValueError('unknown player ' + name + ', expected one of ' + ', '.join(sorted(PLAYERS)))
+        players[spec] = PLAYERS[name](argument)
+    return players[spec]
+
+
+def play_game(game, black, red, seed, max_plies = MAX_GAME_PLIES):
+    '''
+    Function -- play_game
+        Plays one game from the initial position. Every random choice comes from a generator
+        seeded with the seed, so a game can be replayed alone.
+    Parameters:
+        game -- an integer, the number of the game
+        black -- a string, the spec of the player moving first
+        red -- a string, the spec of the other player
+        seed -- an integer, the seed of the game
+        max_plies -- an integer, the plies after which the game is a draw
+    Returns:
+        A dict with the keys game, seed, black, red, winner (0, 1 or None for a draw), plies,
+        captures (per player), seconds and move_seconds (the mean time per move, per player).
+    '''
+    rng = random.Random(seed)
+    choosers = (get_player(black), get_player(red))
+    board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+    captures = [0, 0]
+    move_seconds = [0.0, 0.0]
+    moves = [0, 0]
+    winner = None
+    start = time.perf_counter()
+    for ply in range(max_plies):
+        legal = board.generate_moves()
+        if not legal:
+            winner = 1 - board.turn
+            break
+        player = board.turn
+        move_start = time.perf_counter()
+        move = choosers[player](board, legal, rng)
+        move_seconds[player] += time.perf_counter() - move_start
+        moves[player] += 1
+        captures[player] += move.captured.bit_count()
+        board = board.apply_move(move)
+    else:
+        ply = max_plies
+    return {'game': game, 'seed': seed, 'black': black, 'red': red, 'winner': winner, 'plies': ply,
+            'captures': captures, 'seconds': time.perf_counter() - start,
+            'move_seconds': [move_seconds[player] / moves[player] if moves[player] else 0.0 for player in (BLACK, RED)]}
+
+
+def play_task(task):
+    '''
+    Function -- play_task
+        Unpacks a task for the pool and plays it.
+    Parameters:
+        task -- a tuple of the arguments of play_game
+    Returns:
+        The dict returned by play_game.
+    '''
+    return play_game(*task)
+
+
+def simulate(games, black = DEFAULT_PLAYER, red = DEFAULT_PLAYER, seed = 0, workers = 1, max_plies = MAX_GAME_PLIES,
+             swap = False):
+    '''
+    Function -- simulate
+        Plays games, on a process pool when there are several workers. Game i is seeded with
+        seed + i, so results do not depend on the number of workers. Tasks are handed to the
+        pool lazily and results come back as games finish, so memory does not grow with the
+        number of games.
+    Parameters:
+        games -- an integer, the number of games
+        black -- a string, the spec of the first player
+        red -- a string, the spec of the second player
+        seed -- an integer, the seed of the first game
+        workers -- an integer, the number of processes, 1 to play in the calling process
+        max_plies -- an integer, the plies after which a game is a draw
+        swap -- a boolean, True to swap the players' colors every other game
+    Returns:
+        A generator of the dicts returned by play_game, in the order games finish.
+    '''
+    tasks = ((game, red, black, seed + game, max_plies) if swap and game % 2 else (game, black, red, seed + game, max_plies)
+             for game in range(games))
+    if workers == 1:
+        for task in tasks:
+            yield play_task(task)
+        return
+    with multiprocessing.get_context(START_METHOD).Pool(workers) as pool:
+        yield from pool.imap_unordered(play_task, tasks, CHUNK_SIZE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Play headless checkers games and write the results as JSON lines.')
+    parser.add_argument('--games', type = int, default = DEFAULT_GAMES, help = 'the number of games')
+    parser.add_argument('--black', default = DEFAULT_PLAYER, help = 'the first player: ' + ', '.join(sorted(PLAYERS)) +
+                        ', with an optional :argument such as engine:6')
+    parser.add_argument('--red', default = DEFAULT_PLAYER, help = 'the second player')
+    parser.add_argument('--seed', type = int, default = 0, help = 'the seed of the first game')
+    parser.add_argument('--workers', type = int, default = os.cpu_count() or 1, help = 'the number of processes')
+    parser.add_argument('--max-plies', type = int, default = MAX_GAME_PLIES, help = 'plies before a game is a draw')
+    parser.add_argument('--swap', action = 'store_true', help = 'swap colors every other game')
+    parser.add_argument('--output', default = '-', help = 'the JSON lines file to write, - for standard output')
+    args = parser.parse_args()
+    for spec in (args.black, args.red):
+        get_player(spec)
+    output = sys.stdout if args.output == '-' else open(args.output, 'w')
+    wins = {}
+    start = time.perf_counter()
+    count = 0
+    for result in simulate(args.games, args.black, args.red, args.seed, args.workers, args.max_plies, args.swap):
+        output.write(json.dumps(result) + '\n')
+        winner = 'draw' if result['winner'] is None else result[('black', 'red')[result['winner']]]
+        wins[winner] = wins.get(winner, 0) + 1
+        count += 1
+        if count % REPORT_INTERVAL == 0:
+            output.flush()
+            print('games', count, 'games/s', round(count / (time.perf_counter() - start), 1), file = sys.stderr)
+    if output is not sys.stdout:
+        output.close()
+    seconds = time.perf_counter() - start
+    print('games', count, 'seconds', round(seconds, 2), 'games/s', round(count / seconds, 1) if seconds else 0.0,
+          'results', wins, file = sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
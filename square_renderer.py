@@ -0,0 +1,164 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To redraw only the squares of the checkerboard whose piece changed since the last frame
+'''
+
+
+import turtle
+from piece_shapes import shape_name
+
+
+# Stands in the drawn dict for a square hidden by hold, whatever is on it.
+HELD = 'held'
+
+
+class SquareRenderer:
+    '''
+    Class -- SquareRenderer
+        Shows the pieces of a checkerboard with one turtle per dark square, wearing the shape
+        of the piece registered by piece_shapes.register_piece_shapes, or hidden on an empty
+        square. Every frame compares the board with what was shown last, changes the shape or
+        visibility of the changed squares only, then updates the screen once, so the cost of a
+        frame follows the number of squares a move touched rather than the size of the board.
+        Several renderers with different origins can show several boards on one screen.
+        A square can be held hidden while an animation shows its piece somewhere else.
+    Attributes:
+        num_cells -- an integer, the number of cells per row / column
+        cell_size -- an integer, the edge length of each cell
+        origin -- a tuple of floats, the bottom left corner of the board on the screen
+        screen -- a turtle screen, updated once per frame
+        make_pen -- a function of no argument returning a new turtle
+        pens -- a dict mapping the (x, y) of a dark square to its turtle, made on first use
+        drawn -- a dict mapping the (x, y) of a dark square to the FrozenPiece drawn there, None for an empty one
+        held -- a dict mapping the (x, y) of a held square to the number of holds on it
+        redrawn -- an integer, the squares changed by the last frame
+    Methods:
+        render, invalidate, hold, release, position, pen_at
+    '''
+
+
+    def __init__(self, num_cells, cell_size, origin, screen, make_pen = turtle.Turtle):
+        '''
+        Constructor -- creates a new instance of SquareRenderer, with nothing drawn yet.
+        Parameters:
+            self -- the current SquareRenderer object
+            num_cells -- an integer, the number of cells per row / column
+            cell_size -- an integer, the edge length of each cell
+            origin -- a tuple of floats, the bottom left corner of the board on the screen
+            screen -- a turtle screen
+            make_pen -- a function of no argument returning a new turtle
+        '''
+        self.num_cells = num_cells
+        self.cell_size = cell_size
+        self.origin = origin
+        self.screen = screen
+        self.make_pen = make_pen
+        self.pens = {}
+        self.drawn = {}
+        self.held = {}
+        self.redrawn = 0
+
+
+    def render(self, checkerboard, update = True):
+        '''
+        Method -- render
+            Draws one frame: reshapes the squares whose piece differs from the last frame.
+        Parameters:
+            checkerboard -- a 2D list of cells to draw the pieces of
+            update -- a boolean, False to leave updating the screen to the caller
+        Returns:
+            An integer, the squares changed.
+        '''
+        self.redrawn = 0
+        for col in range(self.num_cells):
+            for row in range(self.num_cells):
+                if col % 2 != row % 2:
+                    piece = checkerboard[col][row].occupied
+                    frozen = HELD if (col, row) in self.held else piece.freeze() if piece else None
+                    if (col, row) in self.drawn and self.drawn[(col, row)] == frozen:
+                        continue
+                    pen = self.pen_at(col, row)
+                    if piece and frozen is not HELD:
+                        pen.shape(shape_name(piece.player, piece.is_king))
+                        pen.showturtle()
+                    else:
+                        pen.hideturtle()
+                    self.drawn[(col, row)] = frozen
+                    self.redrawn += 1
+        if self.redrawn and update:
+            self.screen.update()
+        return self.redrawn
+
+
+    def invalidate(self):
+        '''
+        Method -- invalidate
+            Forgets what was drawn, so the next frame redraws every square.
+        Parameters:
+            N/A
+        Returns:
+            N/A
+        '''
+        self.drawn.clear()
+
+
+    def hold(self, col, row):
+        '''
+        Method -- hold
+            Hides a square from the next frame on, until it is released as many times as held.
+        Parameters:
+            col -- an integer, the column of the square
+            row -- an integer, the row of the square
+        Returns:
+            N/A
+        '''
+        self.held[(col, row)] = self.held.get((col, row), 0) + 1
+
+
+    def release(self, col, row):
+        '''
+        Method -- release
+            Takes back one hold of a square, showing its piece again from the next frame after the last one.
+        Parameters:
+            col -- an integer, the column of the square
+            row -- an integer, the row of the square
+        Returns:
+            N/A
+        '''
+        self.held[(col, row)] -= 1
+        if not self.held[(col, row)]:
+            del self.held[(col, row)]
+            self.drawn.pop((col, row), None)
+
+
+    def position(self, col, row):
+        '''
+        Method -- position
+            Gets where the turtle of a square stands, where a piece's circle starts.
+        Parameters:
+            col -- an integer, the column of the square
+            row -- an integer, the row of the square
+        Returns:
+            A tuple of floats (x, y).
+        '''
+        return self.origin[0] + self.cell_size * (col + 0.5), self.origin[1] + self.cell_size * row
+
+
+    def pen_at(self, col, row):
+        '''
+        Method -- pen_at
+            Gets the turtle of a square, making it hidden the first time, where a piece's circle starts.
+        Parameters:
+            col -- an integer, the column of the square
+            row -- an integer, the row of the square
+        Returns:
+            A turtle.
+        '''
+        pen = self.pens.get((col, row))
+        if pen is None:
+            pen = self.pens[(col, row)] = self.make_pen()
+            pen.hideturtle()
+            pen.penup()
+            pen.setposition(self.position(col, row))
+        return pen
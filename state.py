@@ -5,47 +5,34 @@ Purpose: To maintain the states of the game
 '''
 
 
-import turtle
 import random
 from piece import Piece
 from cell import Cell
 from coordinate import Coordinate
+from bitboard import from_checkerboard
+from tables import CELL_STEPS, LANDINGS, NEARBY_CELLS, NO_SQUARE, NUM_DARK_SQUARES, piece_kind, coord_to_square, square_to_coord
+from zobrist import TURN_KEY, piece_key, hash_checkerboard
+from undo_record import UndoRecord
+from metrics import METRICS, timed
+from computer_worker import ComputerWorker
+from hit_test import cells_at
 
 
 NUM_SQUARES = 8
 NUM_PIECES = 12
 SQUARE = 50
 PIECE_RADIUS = 24
-RIGHT_ANGLE = 90
-NUM_EDGE_SQUARE = 4
-OUT_TIME = 30
 PIECE_COLORS = ('black', 'dark red')
 CELL_COLORS = ('light gray', 'white')
-LINE_COLOR = 'black'
 BOARD_COLOR = 'white'
-BRUSH_COLOR = 'dark blue'
-OUT_COLORS = ['red', 'green', 'blue', 'magenta', 'yellow', 'cyan']
-
-FONT = 'Arial'
-FONT_SIZE = 18
-FONT_SIZE_BRUSH = 40
-FONT_TYPE_HEADER = 'bold'
-FONT_TYPE_TEXT = 'normal'
 
 HUMAN = 0
 COMPUTER = 1
 PLAYERS = ['human', 'computer']
-PLAYER_PROMPT = ['your', 'my']
-GAME_OVER = ['lose', 'win']
 
 TAKING_PIECE = 0
 TAKING_CELL = 1
 
-X_TO_SEARCH = 0
-Y_TO_SEARCH = 1
-
-AUTO_DELAY = 500
-
 
 class State:
     '''
@@ -67,24 +54,33 @@ class State:
         piece_or_cell -- whether a click handler is handling a piece to move or a cell to move to
         is_capture -- capture marker for the current move, a boolean, 0 for non-capture move, 1 for capture move
         move_count -- an integer, counting steps taken in the game
-        screen -- a turtle screen to draw the UI
-        pen -- a turtle pen to render the checkeerboard
-        pen_circle -- a turtle pen to draw circles as pieces
-        pen_out -- a turtle pen for visual effects of capture moves
-        pen_header -- a turtle pen for game information updates
-        pen_click -- a turtle pen for click error prompts
-        pen_brush -- a turtle pen for welcome page and winner prompts
-        pen_brush_steps -- a turtle pen for steps updating
+        bitboard -- a Bitboard, the position the valid moves were last generated from
+        pieces -- a pair of sets, tuple(x, y) of the cells holding each player's pieces
+        piece_steps -- a dict, non-capture moves(cells) of every piece that has one, keyed like valid_moves
+        piece_jumps -- a dict, jumps(cells) of every piece that can capture, keyed like valid_moves
+        capturers -- a pair of integers, the number of pieces of each player that can capture
+        dirty -- a set, tuple(x, y) of the cells changed since the valid moves were last refreshed
+        index_stale -- a boolean, True when pieces, piece_steps and piece_jumps must be rebuilt from scratch
+        key -- an integer, the Zobrist key of the position, updated as pieces move, crown and get captured
+        computer -- an Engine choosing the computer player's moves, None to sample them at random
+        planned_cells -- a list of cells the computer player's piece still has to visit this turn
+        display -- a Display rendering the game, None when running headless
+        worker -- a ComputerWorker searching the computer player's move off the UI thread, None when none is
 
     Methods:
         click_handler
         run_checkers
         switch_player_to_computer
+        play_computer_move
+        cancel_thinking
         update_state
         auto_play
         update_valid_moves
-        update_valid_moves_to_jump
+        refresh_valid_moves
+        index_cell
+        update_valid_moves_to_jumps
         sample_piece
+        plan_move
         sample_cell
         add_jumps_only
         search_jump
@@ -95,13 +91,16 @@ class State:
         take_cell
         valid_piece_to_move
         move_piece
+        generate_moves
+        play_move
+        make_move
+        unmake_move
+        snapshot
         capture_and_continue
         burst_cell_in_between
         print_valid_moves
-        print_welcome
+        clear_click
         print_win
-        print_cell_coord
-        print_click
         print_invalid_piece
         print_invalid_move
         print_turn
@@ -109,21 +108,15 @@ class State:
         render_board
         init_pieces
         render_pieces
-        tint_out
-        tint_red
-        tint_green
-        tint_blue
-        tint_magenta
-        tint_yellow
-        tint_cyan
-        tint
     '''
 
-    def __init__(self):
+    def __init__(self, display = None, computer = None):
         '''
         Constructor -- creates a new instance of State.
         Parameters:
             self -- the current State object
+            display -- a Display to render the game, None to run headless
+            computer -- an Engine for the computer player, None for random moves
         '''
         self.num_cells = NUM_SQUARES
         self.cell_size = SQUARE
@@ -140,31 +133,21 @@ class State:
         self.piece_or_cell = TAKING_PIECE
         self.is_capture = False
         self.move_count = 1
-
-        turtle.setup(self.window_size, self.window_size + self.cell_size)
-        turtle.screensize(self.board_size, self.board_size)
-        turtle.bgcolor(BOARD_COLOR)
-        turtle.tracer(0, 0)
-
-        self.screen = turtle.Screen()
-        self.pen = turtle.Turtle()
-        self.pen.hideturtle()
-        self.pen_circle = turtle.Turtle()
-        self.pen_circle.hideturtle()
-        self.pen_out = turtle.Turtle()
-        self.pen_out.hideturtle()
-        self.pen_header = turtle.Turtle()
-        self.pen_header.hideturtle()
-        self.pen_guide = turtle.Turtle()
-        self.pen_guide.hideturtle()
-        self.pen_click = turtle.Turtle()
-        self.pen_click.hideturtle()
-        self.pen_brush = turtle.Turtle()
-        self.pen_brush.hideturtle()
-        self.pen_brush_steps = turtle.Turtle()
-        self.pen_brush_steps.hideturtle()
-
-
+        self.bitboard = None
+        self.pieces = [set(), set()]
+        self.piece_steps = {}
+        self.piece_jumps = {}
+        self.capturers = [0, 0]
+        self.dirty = set()
+        self.index_stale = True
+        self.key = 0
+        self.display = display
+        self.computer = computer
+        self.planned_cells = []
+        self.worker = None
+
+
+    @timed('click')
     def click_handler(self, x, y):
         '''
         Method -- click_handler
@@ -176,6 +159,9 @@ class State:
             N/A. Click handlers are a special type of Method automatically called by Turtle. 
             You will not have access to anything returned by this Method.
         '''
+        METRICS.inc('clicks')
+        if self.worker:
+            return
         if self.piece_or_cell == TAKING_PIECE:
             self.cell_focused = self.take_piece(x, y)
             if self.cell_focused:
@@ -209,8 +195,8 @@ class State:
         self.init_pieces()
         self.update_valid_moves()
         self.print_turn()
-        self.screen.onclick(self.click_handler) 
-        turtle.done()
+        if self.display:
+            self.display.run(self.click_handler, self.cancel_thinking)
 
 
     def switch_player_to_computer(self):
@@ -220,15 +206,55 @@ class State:
         Parameters:
             N/A
         Returns:
-            N/A, but updates the game state and calls the auto-player.
+            N/A, but updates the game state and calls the auto-player. With both a display and
+            an engine, the engine searches on a ComputerWorker and play_computer_move plays the
+            move once the display sees the search is over.
         '''
         self.update_state()
+        if not self.valid_moves:
+            return
+        if self.display and self.computer:
+            self.worker = ComputerWorker(self.computer)
+            self.worker.start(from_checkerboard(self.checkerboard, self.turn))
+            self.display.think(self.worker, self.play_computer_move)
+            return
         self.cell_focused = self.sample_piece()
         to_cell = self.sample_cell()
         self.auto_play(to_cell)
         self.update_state()
 
 
+    def play_computer_move(self, move):
+        '''
+        Method -- play_computer_move
+            Plays the move a ComputerWorker found, and gives the turn back to the human player.
+        Parameters:
+            move -- a Move of the computer player, None to play a random legal move instead
+        Returns:
+            N/A, but plays the move and updates the game state.
+        '''
+        self.worker = None
+        if move is None:
+            move = random.choice(from_checkerboard(self.checkerboard, self.turn).generate_moves())
+        self.cell_focused = self.plan_move(move)
+        to_cell = self.sample_cell()
+        self.auto_play(to_cell)
+        self.update_state()
+
+
+    def cancel_thinking(self):
+        '''
+        Method -- cancel_thinking
+            Asks the engine searching on a ComputerWorker to play its best move so far.
+        Parameters:
+            N/A
+        Returns:
+            N/A
+        '''
+        if self.worker:
+            self.worker.cancel()
+
+
     def update_state(self):
         '''
         Method -- update_state
@@ -239,9 +265,11 @@ class State:
             N/A, but refreshes the game state.
         '''
         self.turn = not self.turn
+        self.key ^= TURN_KEY
         self.piece_or_cell = TAKING_PIECE
         self.is_capture = False
-        self.update_valid_moves()
+        self.refresh_valid_moves()
+        METRICS.inc('turns')
         if self.valid_moves:
             self.move_count += 1
             self.print_turn()
@@ -268,38 +296,103 @@ class State:
                 to_cell = self.sample_cell()
                 self.auto_play(to_cell)
         else:
-            self.screen.ontimer(self.render_pieces(), AUTO_DELAY)
+            self.render_pieces()
 
 
+    @timed('move_generation')
     def update_valid_moves(self):
         '''
         Method -- update_valid_moves
-            Updates the valid_moves dictionary before any move required by the player.
+            Updates the valid_moves dictionary before any move required by the player,
+            generating them from the whole checkerboard.
         Parameters:
             N/A
         Returns:
             N/A, but updates the valid_moves dictionary.
         '''
         self.valid_moves.clear()
-        for col in range(self.num_cells):
-            for row in range(self.num_cells):
-                if col % 2 != row % 2:
-                    try:
-                        if self.checkerboard[col][row].occupied.player == self.turn:
-                            moves = self.search_next_moves(self.checkerboard[col][row])
-                            if moves:
-                                if not self.is_capture:
-                                    if self.checkerboard[col][row].all_adjacent(moves):
-                                        self.valid_moves[self.checkerboard[col][row].generate_cell_key()] = moves
-                                    else:
-                                        self.is_capture = True
-                                        self.valid_moves.clear()
-                                        self.add_jumps_only(self.checkerboard[col][row], moves)
-                                else:
-                                    self.add_jumps_only(self.checkerboard[col][row], moves)
-                    except AttributeError:
-                        NotImplemented
+        self.bitboard = from_checkerboard(self.checkerboard, self.turn)
+        self.key = self.bitboard.key
+        self.is_capture = self.bitboard.has_capture()
+        moves = self.bitboard.valid_moves()
+        for key in sorted(moves.keys()):
+            self.valid_moves[key] = [self.checkerboard[x][y] for x, y in sorted(moves[key])]
+        self.index_stale = True
         self.print_valid_moves()
+
+
+    @timed('move_generation')
+    def refresh_valid_moves(self):
+        '''
+        Method -- refresh_valid_moves
+            Updates the valid_moves dictionary after a move, recomputing only the pieces
+            around the cells changed since the last refresh.
+        Parameters:
+            N/A
+        Returns:
+            N/A, but updates the valid_moves dictionary.
+        '''
+        if self.index_stale:
+            self.index_stale = False
+            self.pieces = [set(), set()]
+            self.piece_steps.clear()
+            self.piece_jumps.clear()
+            self.capturers = [0, 0]
+            self.key = hash_checkerboard(self.checkerboard, self.turn)
+            for col in range(self.num_cells):
+                for row in range(self.num_cells):
+                    if col % 2 != row % 2:
+                        self.index_cell(self.checkerboard[col][row])
+        else:
+            nearby = set()
+            for x, y in self.dirty:
+                nearby.update(NEARBY_CELLS[x][y])
+            for x, y in nearby:
+                self.index_cell(self.checkerboard[x][y])
+        self.dirty.clear()
+
+        self.valid_moves.clear()
+        self.is_capture = self.capturers[self.turn] > 0
+        moves = self.piece_jumps if self.is_capture else self.piece_steps
+        for key in sorted(self.pieces[self.turn]):
+            if key in moves:
+                self.valid_moves[key] = moves[key]
+        self.print_valid_moves()
+
+
+    def index_cell(self, cell):
+        '''
+        Method -- index_cell
+            Recomputes the entries of a cell in pieces, piece_steps, piece_jumps and capturers.
+        Parameters:
+            cell -- a cell
+        Returns:
+            N/A, but updates the piece index of the cell.
+        '''
+        key = cell.generate_cell_key()
+        for player in (HUMAN, COMPUTER):
+            if key in self.pieces[player]:
+                self.pieces[player].discard(key)
+                if self.piece_jumps.pop(key, None):
+                    self.capturers[player] -= 1
+        self.piece_steps.pop(key, None)
+        piece = cell.occupied
+        if not piece:
+            return
+        self.pieces[piece.player].add(key)
+        steps = []
+        jumps = []
+        for x, y, x_jump, y_jump in CELL_STEPS[piece_kind(piece.player, piece.is_king)][cell.coord.x][cell.coord.y]:
+            over = self.checkerboard[x][y].occupied
+            if not over:
+                steps.append(self.checkerboard[x][y])
+            elif x_jump != NO_SQUARE and over.player != piece.player and not self.checkerboard[x_jump][y_jump].occupied:
+                jumps.append(self.checkerboard[x_jump][y_jump])
+        if steps:
+            self.piece_steps[key] = steps
+        if jumps:
+            self.piece_jumps[key] = jumps
+            self.capturers[piece.player] += 1
  
 
     def update_valid_moves_to_jumps(self, cell, valid_jumps):
@@ -319,12 +412,18 @@ class State:
     def sample_piece(self):
         '''
         Method -- sample_piece
-            Samples a cell with a piece that is valid to move.
+            Samples a cell with a piece that is valid to move. With an engine attached as
+            the computer player, asks it for a whole move and plans the cells to visit.
         Parameters:
             N/A
         Returns:
             A cell, with a piece for the player to move.
         '''
+        if self.computer:
+            start = METRICS.start()
+            move = self.computer.choose_move(from_checkerboard(self.checkerboard, self.turn))
+            METRICS.stop('ai_think', start)
+            return self.plan_move(move)
         sampled_key = random.choice(list(self.valid_moves.keys()))
         x = sampled_key[0]   
         y = sampled_key[1] 
@@ -332,15 +431,31 @@ class State:
         return self.checkerboard[x][y]
 
 
+    def plan_move(self, move):
+        '''
+        Method -- plan_move
+            Plans the cells a move of the computer player visits, for sample_cell to follow.
+        Parameters:
+            move -- a Move of the player to move
+        Returns:
+            A cell, the one the move starts from.
+        '''
+        self.planned_cells = [self.checkerboard[x][y] for x, y in move.coords()]
+        print('planned move: ', move)
+        return self.planned_cells.pop(0)
+
+
     def sample_cell(self):
         '''
         Method -- sample_piece
-            Samples a cell for a selected piece to move to.
+            Samples a cell for a selected piece to move to, the next planned cell if the engine planned a move.
         Parameters:
             N/A
         Returns:
             A cell, with no piece occupied.
         '''
+        if self.planned_cells:
+            return self.planned_cells.pop(0)
         key = self.cell_focused.generate_cell_key()
         res = random.choice(self.valid_moves[key])
         print('sampled_cell: ', res)
@@ -377,17 +492,13 @@ class State:
         Returns:
             N/A, but updates valid jumps from cell by one if possible.
         '''
-        try:
-            if self.checkerboard[x][y].occupied.player != cell.occupied.player:
-                x_jump = x + (x - cell.coord.x)
-                y_jump = y + (y - cell.coord.y)
-                if x_jump >= 0 and x_jump <= self.num_cells - 1 and y_jump >= 0 and y_jump <= self.num_cells - 1:
-                    if not self.checkerboard[x_jump][y_jump].occupied:
-                        jumps.append(self.checkerboard[x_jump][y_jump])
-        except AttributeError:
-            NotImplemented
-        except IndexError:
-            NotImplemented
+        landing = LANDINGS.get((cell.coord.x, cell.coord.y, x, y))
+        if landing:
+            piece = self.checkerboard[x][y].occupied
+            if piece and piece.player != cell.occupied.player:
+                to_cell = self.checkerboard[landing[0]][landing[1]]
+                if not to_cell.occupied:
+                    jumps.append(to_cell)
 
 
     def search_next_moves(self, cell):
@@ -400,14 +511,13 @@ class State:
             A list of cells that the piece from the cell can move to, either jump or adjacent.
         '''
         res = []
-        coords = cell.get_coords_to_search()
-        for x in coords[X_TO_SEARCH]:
-            for y in coords[Y_TO_SEARCH]:
-                if x >= 0 and x <= self.num_cells - 1 and y >= 0 and y <= self.num_cells - 1:
-                    if not self.checkerboard[x][y].occupied:
-                        res.append(self.checkerboard[x][y])
-                    else:
-                        self.search_jump(x, y, cell, res)
+        piece = cell.occupied
+        for x, y, x_jump, y_jump in CELL_STEPS[piece_kind(piece.player, piece.is_king)][cell.coord.x][cell.coord.y]:
+            over = self.checkerboard[x][y].occupied
+            if not over:
+                res.append(self.checkerboard[x][y])
+            elif x_jump != NO_SQUARE and over.player != piece.player and not self.checkerboard[x_jump][y_jump].occupied:
+                res.append(self.checkerboard[x_jump][y_jump])
         return res
 
     
@@ -421,28 +531,29 @@ class State:
             A list of cells that the piece from the cell can jump to.
         '''
         res = []
-        coords = cell.get_coords_to_search()
-        for x in coords[X_TO_SEARCH]:
-            for y in coords[Y_TO_SEARCH]:
-                self.search_jump(x, y, cell, res)
+        piece = cell.occupied
+        for x, y, x_jump, y_jump in CELL_STEPS[piece_kind(piece.player, piece.is_king)][cell.coord.x][cell.coord.y]:
+            over = self.checkerboard[x][y].occupied
+            if x_jump != NO_SQUARE and over and over.player != piece.player and not self.checkerboard[x_jump][y_jump].occupied:
+                res.append(self.checkerboard[x_jump][y_jump])
         return res
 
 
     def locate_click(self, x, y):
         '''
         Method -- locate_click
-            Gets the cell given the click coordinate on the board.
+            Gets the cell given the click coordinate on the board, by arithmetic on the
+            coordinate, with the edges counted in the cells like Cell.is_click_in counts them.
         Parameters:
             x -- an integer, the X coordinate from the caller
             y -- an integer, the Y coordinate from the caller
         Returns:
-            A cell that contains the clicked point, 0 if not a cell.
+            A dark cell that contains the clicked point, 0 if not a cell.
         '''
-        for col in range(self.num_cells):
-            for row in range(self.num_cells):
-                if row % 2 != col % 2:
-                    if self.checkerboard[col][row].is_click_in(x, y):
-                        return self.checkerboard[col][row]
+        corner = - self.board_size / 2
+        for col, row in cells_at(x, y, (corner, corner), self.cell_size, self.num_cells):
+            if row % 2 != col % 2:
+                return self.checkerboard[col][row]
         return 0
 
 
@@ -460,7 +571,7 @@ class State:
         cell = self.locate_click(x, y)
         try:
             if cell in self.valid_moves.get(key, []):
-                self.pen_click.clear()
+                self.clear_click()
                 print('take cell: x y:', cell.coord.x, cell.coord.y)
                 return cell
         except AttributeError:
@@ -482,7 +593,7 @@ class State:
         cell = self.locate_click(x, y)
         try:
             if self.valid_piece_to_move(cell):
-                self.pen_click.clear()
+                self.clear_click()
                 print('take piece: x y: ', cell.coord.x, cell.coord.y)
                 return cell
         except AttributeError:
@@ -512,12 +623,145 @@ class State:
             from_cell -- a cell, that the piece comes from
             to_cell -- a cell, that the piece moves to
         Returns:
-            N/A, but updates the occupied state in both cells
+            N/A, but updates the occupied state in both cells and the key, and has the display slide the piece
+        '''
+        piece = from_cell.occupied
+        to_cell.occupied = piece
+        from_cell.occupied = 0
+        self.dirty.add(from_cell.generate_cell_key())
+        self.dirty.add(to_cell.generate_cell_key())
+        to_square = coord_to_square(to_cell.coord.x, to_cell.coord.y)
+        self.key ^= piece_key(piece.player, piece.is_king, coord_to_square(from_cell.coord.x, from_cell.coord.y)) ^ \
+                    piece_key(piece.player, piece.is_king, to_square)
+        crowned = to_cell.coord.y == ( self.num_cells - 1 ) * ( 1 - self.turn ) and not piece.is_king
+        if self.display:
+            self.display.slide(from_cell.coord.x, from_cell.coord.y, to_cell.coord.x, to_cell.coord.y, piece.player, piece.is_king)
+            if crowned:
+                self.display.crown(to_cell.coord.x, to_cell.coord.y)
+        if crowned:
+            piece.crown()
+            self.key ^= piece_key(piece.player, False, to_square) ^ piece_key(piece.player, True, to_square)
+
+
+    def generate_moves(self):
+        '''
+        Method -- generate_moves
+            Gets every whole-turn move of the player to move, complete capture sequences included.
+        Parameters:
+            N/A
+        Returns:
+            A list of Move.
+        '''
+        return from_checkerboard(self.checkerboard, self.turn).generate_moves()
+
+
+    def play_move(self, move):
+        '''
+        Method -- play_move
+            Plays a whole turn in a single call, every hop of a capture sequence included.
+        Parameters:
+            move -- a Move of the player to move
+        Returns:
+            N/A, but moves the piece, removes the captured pieces and focuses the final cell.
+        '''
+        coords = move.coords()
+        self.cell_focused = self.checkerboard[coords[0][0]][coords[0][1]]
+        for x, y in coords[1:]:
+            cell = self.checkerboard[x][y]
+            self.move_piece(self.cell_focused, cell)
+            if move.captured:
+                self.capture_and_continue(cell)
+            else:
+                self.cell_focused = cell
+
+
+    def make_move(self, move):
+        '''
+        Method -- make_move
+            Plays a whole turn without rendering, for searching ahead: moves the piece, crowns it,
+            removes the captured pieces and passes the turn. Nothing is copied, so the work is
+            proportional to the number of captures.
+        Parameters:
+            move -- a Move of the player to move
+        Returns:
+            An UndoRecord, to pass to unmake_move.
         '''
-        to_cell.occupied = from_cell.occupied
+        x, y = square_to_coord(move.path[0])
+        from_cell = self.checkerboard[x][y]
+        x, y = square_to_coord(move.path[-1])
+        to_cell = self.checkerboard[x][y]
+        piece = from_cell.occupied
+        record = UndoRecord(move, from_cell, to_cell, piece, False, [], self.turn, self.move_count,
+                            self.key, self.is_capture, self.cell_focused)
+        key = self.key ^ TURN_KEY ^ piece_key(piece.player, piece.is_king, move.path[0])
         from_cell.occupied = 0
-        if to_cell.coord.y == ( self.num_cells - 1 ) * ( 1 - self.turn ):
-            to_cell.occupied.crown()
+        to_cell.occupied = piece
+        if move.crowned and not piece.is_king:
+            piece.crown()
+            record.crowned = True
+        key ^= piece_key(piece.player, piece.is_king, move.path[-1])
+        self.dirty.add((from_cell.coord.x, from_cell.coord.y))
+        self.dirty.add((to_cell.coord.x, to_cell.coord.y))
+        captured = move.captured
+        while captured:
+            low = captured & -captured
+            captured ^= low
+            square = low.bit_length() - 1
+            x, y = square_to_coord(square)
+            cell = self.checkerboard[x][y]
+            record.captured.append((cell, cell.occupied))
+            key ^= piece_key(cell.occupied.player, cell.occupied.is_king, square)
+            cell.occupied = 0
+            self.dirty.add((x, y))
+        self.key = key
+        self.turn = not self.turn
+        self.move_count += 1
+        self.is_capture = False
+        self.cell_focused = to_cell
+        return record
+
+
+    def unmake_move(self, record):
+        '''
+        Method -- unmake_move
+            Takes back a move made by make_move, the last one not taken back yet.
+        Parameters:
+            record -- an UndoRecord returned by make_move
+        Returns:
+            N/A, but restores the pieces, crowning, turn, move counter and key exactly.
+        '''
+        for cell, piece in record.captured:
+            cell.occupied = piece
+            self.dirty.add((cell.coord.x, cell.coord.y))
+        if record.crowned:
+            record.piece.uncrown()
+        record.to_cell.occupied = 0
+        record.from_cell.occupied = record.piece
+        self.dirty.add((record.from_cell.coord.x, record.from_cell.coord.y))
+        self.dirty.add((record.to_cell.coord.x, record.to_cell.coord.y))
+        self.turn = record.turn
+        self.move_count = record.move_count
+        self.key = record.key
+        self.is_capture = record.is_capture
+        self.cell_focused = record.cell_focused
+
+
+    def snapshot(self):
+        '''
+        Method -- snapshot
+            Captures the position as an immutable, hashable value. The pieces are the interned
+            FrozenPiece objects, so a snapshot only costs a tuple of 32 references plus the turn.
+        Parameters:
+            N/A
+        Returns:
+            A tuple (pieces, turn): pieces is a tuple of 32 FrozenPiece or None, indexed by square.
+        '''
+        pieces = []
+        for square in range(NUM_DARK_SQUARES):
+            x, y = square_to_coord(square)
+            piece = self.checkerboard[x][y].occupied
+            pieces.append(piece.freeze() if piece else None)
+        return tuple(pieces), int(self.turn)
 
 
     def capture_and_continue(self, cell):
@@ -529,8 +773,9 @@ class State:
         Returns:
             N/A, but render a visual effect and updates the focused cell.
         '''
+        METRICS.inc('captures')
         self.burst_cell_in_between(self.cell_focused, cell)
-        self.screen.ontimer(self.render_pieces(), AUTO_DELAY)
+        self.render_pieces()
         self.cell_focused = cell
 
 
@@ -546,9 +791,13 @@ class State:
         '''
         x = int(( first_cell.coord.x + second_cell.coord.x ) / 2)
         y = int(( first_cell.coord.y + second_cell.coord.y ) / 2)
-        self.pen_out.setposition(- self.board_size / 2 + self.cell_size * (x + 0.5), - self.board_size / 2 + self.cell_size * y)
-        self.tint_out()
+        if self.display:
+            self.display.burst(x, y)
+        piece = self.checkerboard[x][y].occupied
+        if piece:
+            self.key ^= piece_key(piece.player, piece.is_king, coord_to_square(x, y))
         self.checkerboard[x][y].occupied = 0
+        self.dirty.add((x, y))
 
 
     def print_valid_moves(self):
@@ -575,19 +824,17 @@ class State:
             print(key, ':', out_dict[key])
 
 
-    def print_welcome(self):
+    def clear_click(self):
         '''
-        Method -- print_welcome
-            Prints the welcome page to the UI when the game starts.
+        Method -- clear_click
+            Clears the click error prompt from the UI.
         Parameters:
             N/A
         Returns:
-            N/A, but prints the welcome page to the UI.
+            N/A, but clears the prompt if a display is attached.
         '''
-        self.pen_brush.write("Welcome to the game!", align = 'center', font = (FONT, FONT_SIZE_BRUSH, FONT_TYPE_TEXT))
-        self.screen.ontimer(self.pen_brush.clear(), AUTO_DELAY)
-        self.pen_brush.write("This is Mr.Robot playing!", align = 'center', font = (FONT, FONT_SIZE_BRUSH, FONT_TYPE_TEXT))
-        self.screen.ontimer(self.pen_brush.clear(), AUTO_DELAY)
+        if self.display:
+            self.display.clear_click()
 
 
     def print_win(self):
@@ -599,42 +846,8 @@ class State:
         Returns:
             N/A, but prints the winner prompts to the UI.
         '''
-        if self.turn == HUMAN:
-            out_str = 'Ahhh!  '
-        else:
-            out_str = 'Congrats! '
-        out_str += 'You ' + GAME_OVER[self.turn] + '!'
-        self.pen_brush.write(out_str, align = 'center', font = (FONT, FONT_SIZE_BRUSH, FONT_TYPE_TEXT))
-        out_steps = 'After ' + str(self.move_count) + ' steps.'
-        self.pen_brush_steps.write(out_steps, align = 'center', font = (FONT, FONT_SIZE_BRUSH, FONT_TYPE_TEXT))
-
-
-    def print_cell_coord(self, col, row):
-        '''
-        Method -- print_cell_coord
-            Prints the coordinate of a cell on the checkerboard to the UI.
-        Parameters:
-            col -- an integer, column number of the cell
-            row -- an integer, row number of the cell
-        Returns:
-            N/A, but prints the coordinate of a cell on the checkerboard to the UI.
-        '''
-        self.pen_click.clear()
-        self.pen_click.write('Cell ' + str(col) +  ' ' + str(row) + ' ' + 'on the board.', font = (FONT, FONT_SIZE, FONT_TYPE_TEXT))
-
-
-    def print_click(self, x, y):
-        '''
-        Method -- print_click
-            Prints the coordinate of the clicked cell to the UI.
-        Parameters:
-            x -- an integer, the X coordinate from the caller
-            y -- an integer, the Y coordinate from the caller
-        Returns:
-            N/A, but prints the coordinate of the clicked cell to the UI.
-        '''
-        self.pen_click.clear()
-        self.pen_click.write('Clicked at ' + str(x) + str(y), font = (FONT, FONT_SIZE, FONT_TYPE_TEXT))
+        if self.display:
+            self.display.print_win(self.turn, self.move_count)
 
 
     def print_invalid_piece(self):
@@ -646,8 +859,8 @@ class State:
         Returns:
             N/A, but prompts a notice to the UI that the piece is invalid.
         '''
-        self.pen_click.clear()
-        self.pen_click.write('Not a valid ' + str(self.piece_colors[self.turn]) + ' piece. Try again.', font = (FONT, FONT_SIZE, FONT_TYPE_TEXT))
+        if self.display:
+            self.display.print_invalid_piece(self.piece_colors[self.turn])
 
 
     def print_invalid_move(self):
@@ -659,8 +872,8 @@ class State:
         Returns:
             N/A, but prompts a notice to the UI that the cell is invalid.
         '''
-        self.pen_click.clear()
-        self.pen_click.write('Not a valid move. Try diagnally. Capture if possible.', font = (FONT, FONT_SIZE, FONT_TYPE_TEXT))
+        if self.display:
+            self.display.print_invalid_move()
 
 
     def print_turn(self): 
@@ -672,11 +885,8 @@ class State:
         Returns:
             N/A, but prints whose turn it is.
         '''
-        self.pen_header.clear()
-        self.pen_header.write('Checkers!   Move: ' + str(self.move_count) + "   It's " + PLAYER_PROMPT[self.turn] + ' turn. ', font = (FONT, FONT_SIZE, FONT_TYPE_HEADER))
-        self.pen_guide.clear()
-        if self.turn == HUMAN:
-            self.pen_guide.write('Move a ' + self.piece_colors[self.turn] + ' piece by clicking it and a cell.', font = (FONT, FONT_SIZE, FONT_TYPE_TEXT))
+        if self.display:
+            self.display.print_turn(self.turn, self.move_count, self.piece_colors[self.turn])
 
 
     def print_capture(self):
@@ -688,55 +898,31 @@ class State:
         Returns:
             N/A, but prompts a notice to the UI that the player should keep capturing.
         '''
-        self.pen_guide.clear()
-        self.pen_guide.color('dark red')
-        self.pen_guide.write('Keep capturing with this piece by clicking a cell!', font = (FONT, FONT_SIZE, FONT_TYPE_TEXT))
-        self.pen_guide.color('black')
+        if self.display:
+            self.display.print_capture()
 
 
+    @timed('render')
     def render_board(self):
         '''
         Method -- render_board
-            Draw the checkerboard with white and gray cells at the beginning of the game.
+            Builds the checkerboard with white and gray cells at the beginning of the game,
+            and draws it if a display is attached.
         Parameters:
-            pen -- an instance of Turtle
-            board_size -- the length of the edge of the checkerboard
-            window_size -- the length of the edge of the window
+            N/A
         Returns:
-            N/A. Draws checkerboard with white and gray cells.
+            N/A. Fills the checkerboard with cells.
         '''
-        self.pen.penup()
-        self.pen.color(LINE_COLOR, BOARD_COLOR)
-
         corner = - self.board_size / 2
-        self.pen.setposition(corner, corner)
-        self.pen_header.setposition(- self.board_size / 2, self.board_size / 2 + self.cell_size / 2)
-        self.pen_guide.setposition(- self.board_size / 2, self.board_size / 2)
-        self.pen_click.setposition(- self.board_size / 2, - self.board_size / 2 - self.cell_size / 2)
-        
-        self.pen_brush.up()
-        self.pen_brush.setposition(0, 0)
-        self.pen_brush.color(BRUSH_COLOR)
-
-        self.pen_brush_steps.up()
-        self.pen_brush_steps.setposition(0, - self.cell_size)
-        self.pen_brush_steps.color(BRUSH_COLOR)
-
-        self.print_welcome()
-
-        large_cell = Cell(edge = self.board_size)
-        large_cell.render_cell(self.pen)
-
         for col in range(self.num_cells):
             for row in range(self.num_cells):
                 bottom_left = Coordinate(corner + self.cell_size * col, corner + self.cell_size * row)
                 coord = Coordinate(col, row)
-                if col % 2 != row % 2:
-                    self.checkerboard[col][row] = Cell(coord, bottom_left, self.cell_size, self.cell_colors[0])
-                    self.pen.setposition(bottom_left.x, bottom_left.y)
-                    self.checkerboard[col][row].render_cell(self.pen)
-                else:
-                    self.checkerboard[col][row] = Cell(coord, bottom_left, self.cell_size, self.cell_colors[0])
+                self.checkerboard[col][row] = Cell(coord, bottom_left, self.cell_size, self.cell_colors[0])
+        self.key = hash_checkerboard(self.checkerboard, self.turn)
+        self.index_stale = True
+        if self.display:
+            self.display.render_board(self.checkerboard)
 
 
     def init_pieces(self):
@@ -746,178 +932,31 @@ class State:
         Parameters:
             N/A
         Returns:
-            N/A. Draws pieces initiated in the cells.
+            N/A. Places the pieces in the cells.
         '''
-        corner = - self.board_size / 2
-        self.pen_circle.penup()
-        self.pen_circle.color(LINE_COLOR)
         for col in range(self.num_cells):
             for row in range(self.num_cells):
                 if col % 2 != row % 2:
-                    self.pen_circle.setposition(corner + self.cell_size * (col + 1 / 2), corner + self.cell_size * row)
                     if row < self.num_cells / 2 - 1:
                         piece = Piece(player = HUMAN, colors = self.piece_colors, radius = self.piece_radius, is_king = False)
                         self.checkerboard[col][row].occupied = piece
-                        piece.render_piece(self.pen_circle)
                     elif row > self.num_cells / 2:
                         piece = Piece(player = COMPUTER, colors = self.piece_colors, radius = self.piece_radius, is_king = False)
                         self.checkerboard[col][row].occupied = piece
-                        piece.render_piece(self.pen_circle)
+        self.key = hash_checkerboard(self.checkerboard, self.turn)
+        self.index_stale = True
+        self.render_pieces()
 
 
     def render_pieces(self):
         '''
         Method -- render_pieces
-            Iterates through all cells on the board and render the piece if there is one.
+            Asks the display, if one is attached, to draw the pieces on its next frame, where
+            the drawing is timed as frame_seconds.
         Parameters:
             N/A
         Returns:
             N/A. Draws pieces after a screen update.
         '''
-        corner = - self.board_size / 2
-        self.pen_circle.clear()
-        for col in range(self.num_cells):
-            for row in range(self.num_cells):
-                if col % 2 != row % 2:
-                    try:
-                        self.pen_circle.setposition(corner + self.cell_size * (col + 0.5), corner + self.cell_size * row)
-                        self.checkerboard[col][row].occupied.render_piece(self.pen_circle)
-                    except AttributeError:
-                        not NotImplemented
-
-
-    def tint_out_recursive(self):
-        '''
-        Method -- tint_out_recursive
-            Renders a color flashing effect to a cell on the checkerboard.
-        Parameters:
-            N/A
-        Returns:
-            N/A, but renders a visual effect.
-        
-        It seems turtle doesn't display the colors if the flashing color 
-        method is written in a recursive form.
-        Everything inside a single loop are skipped, only the ultimate result 
-        is displayed when tracer(0, 0) is on. 
-        Therefore, we have to create serial methods with distinct names.
-        '''
-        self.pen.clear()
-        if len(OUT_COLORS) == 0:
-            self.screen.ontimer(self.pen_out.clear(), OUT_TIME)
-        else:
-            self.pen.clear()
-            self.pen.color(self.out_colors.pop())
-            self.pen.begin_fill()
-            self.pen.down()
-            self.pen.circle(self.piece_radius)
-            self.pen.end_fill()
-            self.pen.up()
-            self.screen.ontimer(self.tint_out_recursive, OUT_TIME)
-
-
-    def tint_out(self):
-        '''
-        Method -- tint_out
-            Call serial flashing color methods after some time.
-        Parameters:
-            N/A
-        Returns:
-            N/A. Calls a flashing color(red) method after some time.
-        '''
-        self.screen.ontimer(self.tint_red, OUT_TIME)
-
-
-    def tint_red(self):
-        '''
-        Method -- tint_red
-            Flashes red and call the next flashing color(green).
-        Parameters:
-            N/A
-        Returns:
-            N/A. Calls a flashing color(green) method after some time.
-        '''
-        self.tint('red')
-        self.screen.ontimer(self.tint_green, OUT_TIME)
-
-
-    def tint_green(self):
-        '''
-        Method -- tint_green
-            Flashes green and call the next flashing color(blue).
-        Parameters:
-            N/A
-        Returns:
-            N/A. Calls a flashing color(blue) method after some time.
-        '''
-        self.tint('green')
-        self.screen.ontimer(self.tint_blue, OUT_TIME)
-
-
-    def tint_blue(self):
-        '''
-        Method -- tint_blue
-            Flashes blue and call the next flashing color(magenta).
-        Parameters:
-            N/A
-        Returns:
-            N/A. Calls a flashing color(magenta) method after some time.
-        '''
-        self.tint('blue')
-        self.screen.ontimer(self.tint_magenta, OUT_TIME)
-
-
-    def tint_magenta(self):
-        '''
-        Method -- tint_magenta
-            Flashes magenta and call the next flashing color(yellow).
-        Parameters:
-            N/A
-        Returns:
-            N/A. Calls a flashing color(yellow) method after some time.
-        '''
-        self.tint('magenta')
-        self.screen.ontimer(self.tint_yellow, OUT_TIME)
-
-
-    def tint_yellow(self):
-        '''
-        Method -- tint_yellow
-            Flashes yellow and call the next flashing color(cyan).
-        Parameters:
-            N/A
-        Returns:
-            N/A. Calls a flashing color(cyan) method after some time.
-        '''
-        self.tint('yellow')
-        self.screen.ontimer(self.tint_cyan, OUT_TIME)
-    
-
-    def tint_cyan(self):
-        '''
-        Method -- tint_cyan
-            Flashes cyan and delete this piece from the board after some time.
-        Parameters:
-            N/A
-        Returns:
-            N/A. Calls the clear method to the pen after some time.
-        '''
-        self.tint('cyan')
-        self.screen.ontimer(self.pen_out.clear(), OUT_TIME)
-
-
-    def tint(self, color):
-        '''
-        Method -- tint
-            Perform a color flashing across the board.
-        Parameters:
-            color -- a string, the color to flash.
-        Returns:
-            N/A. Performs a color flashing across the board.
-        '''
-        self.pen_out.clear()
-        self.pen_out.color(color)
-        self.pen_out.begin_fill()
-        self.pen_out.down()
-        self.pen_out.circle(self.piece_radius)
-        self.pen_out.end_fill()
-        self.pen_out.up()
\ No newline at end of file
+        if self.display:
+            self.display.render_pieces(self.checkerboard)
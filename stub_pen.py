@@ -0,0 +1,70 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To stand in for a turtle pen without a window, counting the drawing calls
+'''
+
+
+class StubPen:
+    '''
+    Class -- StubPen
+        Accepts every call a turtle.Turtle accepts and does nothing but count it, so rendering
+        code can be timed and checked headless.
+    Attributes:
+        calls -- a dict mapping a method name to the number of calls
+    Methods:
+        total, reset, and any turtle method
+    '''
+
+
+    def __init__(self):
+        '''
+        Constructor -- creates a new instance of StubPen.
+        Parameters:
+            self -- the current StubPen object
+        '''
+        self.calls = {}
+
+
+    def __getattr__(self, name):
+        '''
+        Method -- __getattr__
+            Gets a method that counts its calls, for any name not defined on the class.
+        Parameters:
+            self -- the current StubPen object
+            name -- a string, the method name
+        Returns:
+            A function taking any arguments and returning None.
+        '''
+        if name.startswith('__'):
+            raise AttributeError(name)
+        calls = self.calls
+
+        def record(*args, **kwargs):
+            calls[name] = calls.get(name, 0) + 1
+
+        return record
+
+
+    def total(self):
+        '''
+        Method -- total
+            Counts every call so far.
+        Parameters:
+            N/A
+        Returns:
+            An integer.
+        '''
+        return sum(self.calls.values())
+
+
+    def reset(self):
+        '''
+        Method -- reset
+            Forgets the calls so far.
+        Parameters:
+            N/A
+        Returns:
+            N/A
+        '''
+        self.calls.clear()
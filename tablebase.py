@@ -0,0 +1,494 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To build endgame tablebases by retrograde analysis, and to probe them through mmap while playing
+'''
+
+
+import argparse
+import heapq
+import itertools
+import mmap
+import multiprocessing
+import os
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from bitboard import Bitboard, BLACK, RED, PROMOTION_ROWS
+from tables import NUM_DARK_SQUARES
+from parallel_engine import START_METHOD
+
+
+DEFAULT_DIRECTORY = 'tablebases'
+DEFAULT_PIECES = 4
+DEFAULT_MAX_OPEN = 16
+MAX_PIECES = 6
+
+MAGIC = b'CKT2'
+HEADER = struct.Struct('<4s4BI')
+VALUE_BYTES = 2
+
+# Values stored per position, from the point of view of the player to move:
+# 0 for a draw, d > 0 for a win in d plies, -(d + 1) for a loss in d plies.
+DRAW = 0
+
+WIN_EVENT = 0
+LOSS_EVENT = 1
+
+
+def build_binomials():
+    '''
+    Function -- build_binomials
+        Builds the binomial coefficients used to rank sets of squares.
+    Parameters:
+        N/A
+    Returns:
+        A list of 33 lists, BINOMIALS[n][k] being n choose k for k up to MAX_PIECES.
+    '''
+    res = []
+    for n in range(NUM_DARK_SQUARES + 1):
+        res.append([0] * (MAX_PIECES + 1))
+        res[n][0] = 1
+        for k in range(1, MAX_PIECES + 1):
+            res[n][k] = res[n - 1][k - 1] + res[n - 1][k] if n else 0
+    return res
+
+
+BINOMIALS = build_binomials()
+ALL_SQUARES = (1 << NUM_DARK_SQUARES) - 1
+# Men never stand on the row they would be crowned on.
+MAN_MASKS = tuple(ALL_SQUARES & ~PROMOTION_ROWS[player] for player in (BLACK, RED))
+MAN_SQUARES = tuple(tuple(square for square in range(NUM_DARK_SQUARES) if MAN_MASKS[player] >> square & 1)
+                    for player in (BLACK, RED))
+NUM_MAN_SQUARES = len(MAN_SQUARES[BLACK])
+
+
+def signature_of(board):
+    '''
+    Function -- signature_of
+        Gets the material signature of a position, which picks its table.
+    Parameters:
+        board -- a Bitboard
+    Returns:
+        A tuple of four integers: black men, black kings, red men, red kings.
+    '''
+    return ((board.black & ~board.kings).bit_count(), (board.black & board.kings).bit_count(),
+            (board.red & ~board.kings).bit_count(), (board.red & board.kings).bit_count())
+
+
+def signature_name(signature):
+    '''
+    Function -- signature_name
+        Gets the file name of the table of a signature.
+    Parameters:
+        signature -- a tuple of four integers
+    Returns:
+        A string such as '1011.tb', for one black man, no black king, one red man and one red king.
+    '''
+    return ''.join(str(count) for count in signature) + '.tb'
+
+
+def table_size(signature):
+    '''
+    Function -- table_size
+        Gets the number of entries of the table of a signature, both players to move. The men
+        of each player take their 28 legal squares, and the kings the squares the men left.
+    Parameters:
+        signature -- a tuple of four integers
+    Returns:
+        An integer.
+    '''
+    black_men, black_kings, red_men, red_kings = signature
+    free = NUM_DARK_SQUARES - black_men - red_men
+    return 2 * BINOMIALS[NUM_MAN_SQUARES][black_men] * BINOMIALS[NUM_MAN_SQUARES][red_men] * \
+           BINOMIALS[free][black_kings] * BINOMIALS[free - black_kings][red_kings]
+
+
+def rank(mask, free = ALL_SQUARES):
+    '''
+    Function -- rank
+        Ranks a set of squares among the sets of the same size taken from the free squares, in
+        the combinatorial number system, each square counting as its position among the free ones.
+    Parameters:
+        mask -- an integer, the mask of the squares, all of them free
+        free -- an integer, the mask of the free squares
+    Returns:
+        An integer in [0, free squares choose size).
+    '''
+    res = 0
+    count = 0
+    while mask:
+        low = mask & -mask
+        mask ^= low
+        count += 1
+        res += BINOMIALS[(free & (low - 1)).bit_count()][count]
+    return res
+
+
+def index_of(board, signature):
+    '''
+    Function -- index_of
+        Gets the entry of a position in the table of its signature: the black men ranked on
+        their legal squares, the red men on theirs without the black men, then the black kings
+        on the squares left by the men and the red kings on the squares left after them.
+    Parameters:
+        board -- a Bitboard
+        signature -- a tuple of four integers, the signature of the board
+    Returns:
+        An integer in [0, table_size(signature)).
+    '''
+    black_men, black_kings, red_men, red_kings = signature
+    black_man_mask = board.black & ~board.kings
+    red_man_mask = board.red & ~board.kings
+    black_king_mask = board.black & board.kings
+    free = ALL_SQUARES & ~(black_man_mask | red_man_mask)
+    res = rank(black_man_mask, MAN_MASKS[BLACK])
+    res = res * BINOMIALS[NUM_MAN_SQUARES][red_men] + rank(red_man_mask, MAN_MASKS[RED] & ~black_man_mask)
+    res = res * BINOMIALS[NUM_DARK_SQUARES - black_men - red_men][black_kings] + rank(black_king_mask, free)
+    free &= ~black_king_mask
+    res = res * BINOMIALS[NUM_DARK_SQUARES - black_men - red_men - black_kings][red_kings] + \
+          rank(board.red & board.kings, free)
+    return res * 2 + board.turn
+
+
+def squares_mask(squares):
+    '''
+    Function -- squares_mask
+        Converts squares to a mask.
+    Parameters:
+        squares -- an iterable of integers
+    Returns:
+        An integer, the mask with the squares set.
+    '''
+    res = 0
+    for square in squares:
+        res |= 1 << square
+    return res
+
+
+def enumerate_positions(signature):
+    '''
+    Function -- enumerate_positions
+        Lists every legal placement of the pieces of a signature, for both players to move.
+    Parameters:
+        signature -- a tuple of four integers
+    Returns:
+        A generator of Bitboard.
+    '''
+    black_men, black_kings, red_men, red_kings = signature
+    for black_man_squares in itertools.combinations(MAN_SQUARES[BLACK], black_men):
+        used = squares_mask(black_man_squares)
+        for black_king_squares in itertools.combinations([square for square in range(NUM_DARK_SQUARES) if not used >> square & 1], black_kings):
+            black_king_mask = squares_mask(black_king_squares)
+            black = used | black_king_mask
+            for red_man_squares in itertools.combinations([square for square in MAN_SQUARES[RED] if not black >> square & 1], red_men):
+                red_man_mask = squares_mask(red_man_squares)
+                occupied = black | red_man_mask
+                for red_king_squares in itertools.combinations([square for square in range(NUM_DARK_SQUARES) if not occupied >> square & 1], red_kings):
+                    red_king_mask = squares_mask(red_king_squares)
+                    for turn in (BLACK, RED):
+                        yield Bitboard(black, red_man_mask | red_king_mask, black_king_mask | red_king_mask, turn)
+
+
+def signatures(max_pieces):
+    '''
+    Function -- signatures
+        Lists the signatures of every table up to a number of pieces, in the order they can be
+        built in: a capture leads to fewer pieces and a crowning to fewer men, so every table
+        only depends on tables of an earlier level.
+    Parameters:
+        max_pieces -- an integer, the most pieces on the board
+    Returns:
+        A list of lists of signatures, one list per level; the tables of a level are independent.
+    '''
+    levels = {}
+    for total in range(2, max_pieces + 1):
+        for black_men, black_kings, red_men, red_kings in itertools.product(range(total + 1), repeat = 4):
+            if black_men + black_kings + red_men + red_kings == total and black_men + black_kings and red_men + red_kings:
+                levels.setdefault((total, black_men + red_men), []).append((black_men, black_kings, red_men, red_kings))
+    return [levels[level] for level in sorted(levels)]
+
+
+def build_predecessors(children, parents, size):
+    '''
+    Function -- build_predecessors
+        Groups the moves staying in a table by the position they reach, as flat arrays.
+    Parameters:
+        children -- an array of integers, the entry each move reaches
+        parents -- an array of integers, the entry each move starts from
+        size -- an integer, the number of entries of the table
+    Returns:
+        A tuple (starts, predecessors) of arrays: the entries reaching entry i are
+        predecessors[starts[i]:starts[i + 1]].
+    '''
+    starts = array('I', bytes(4 * (size + 1)))
+    for child in children:
+        starts[child + 1] += 1
+    for index in range(size):
+        starts[index + 1] += starts[index]
+    cursors = array('I', starts)
+    predecessors = array('I', bytes(4 * len(parents)))
+    for child, parent in zip(children, parents):
+        predecessors[cursors[child]] = parent
+        cursors[child] += 1
+    return starts, predecessors
+
+
+def build_table(signature, directory):
+    '''
+    Function -- build_table
+        Solves every position of a signature and writes its table. Positions are resolved in
+        order of distance with a heap: a position wins as soon as one move reaches a lost
+        position, and loses once every move reaches a won one, as late as possible. What is
+        left unresolved is a draw. Moves leaving the signature are looked up in the tables
+        already built. The bookkeeping lives in flat arrays indexed like the table.
+    Parameters:
+        signature -- a tuple of four integers
+        directory -- a string, the directory of the tables
+    Returns:
+        A tuple (signature, positions, wins, losses), counted over legal positions.
+    '''
+    size = table_size(signature)
+    prober = Tablebase(directory)
+    heap = []
+    remaining = array('H', bytes(2 * size))
+    longest_win = array('H', bytes(2 * size))
+    children = array('I')
+    parents = array('I')
+    positions = 0
+    for board in enumerate_positions(signature):
+        positions += 1
+        index = index_of(board, signature)
+        moves = board.generate_moves()
+        if not moves:
+            heap.append((0, LOSS_EVENT, index))
+            continue
+        remaining[index] = len(moves)
+        for move in moves:
+            child = board.apply_move(move)
+            child_signature = signature_of(child)
+            if child_signature == signature:
+                children.append(index_of(child, signature))
+                parents.append(index)
+                continue
+            value = prober.probe(child)
+            if value < 0:
+                heap.append((-value, WIN_EVENT, index))
+            elif value > 0:
+                remaining[index] -= 1
+                longest_win[index] = max(longest_win[index], value)
+        if not remaining[index]:
+            heap.append((longest_win[index] + 1, LOSS_EVENT, index))
+    prober.close()
+    starts, predecessors = build_predecessors(children, parents, size)
+    del children, parents
+
+    heapq.heapify(heap)
+    values = array('h', bytes(size * VALUE_BYTES))
+    solved = bytearray(size)
+    wins = 0
+    losses = 0
+    while heap:
+        distance, event, index = heapq.heappop(heap)
+        if solved[index]:
+            continue
+        solved[index] = 1
+        if event == WIN_EVENT:
+            values[index] = distance
+            wins += 1
+        else:
+            values[index] = -distance - 1
+            losses += 1
+        for predecessor in predecessors[starts[index]:starts[index + 1]]:
+            if solved[predecessor]:
+                continue
+            if event == LOSS_EVENT:
+                heapq.heappush(heap, (distance + 1, WIN_EVENT, predecessor))
+            else:
+                remaining[predecessor] -= 1
+                longest_win[predecessor] = max(longest_win[predecessor], distance)
+                if not remaining[predecessor]:
+                    heapq.heappush(heap, (longest_win[predecessor] + 1, LOSS_EVENT, predecessor))
+    write_table(directory, signature, values)
+    return signature, positions, wins, losses
+
+
+def write_table(directory, signature, values):
+    '''
+    Function -- write_table
+        Writes a table: a header with the signature and the number of entries, then one
+        little-endian 16-bit value per entry. The file is written aside and renamed, so a
+        prober never sees a partial table.
+    Parameters:
+        directory -- a string, the directory of the tables
+        signature -- a tuple of four integers
+        values -- an array of 16-bit integers
+    Returns:
+        N/A, but writes the file.
+    '''
+    path = os.path.join(directory, signature_name(signature))
+    if sys.byteorder == 'big':
+        values = array('h', values)
+        values.byteswap()
+    with open(path + '.tmp', 'wb') as file:
+        file.write(HEADER.pack(MAGIC, *signature, len(values)))
+        values.tofile(file)
+    os.replace(path + '.tmp', path)
+
+
+def build_all(directory = DEFAULT_DIRECTORY, max_pieces = DEFAULT_PIECES, workers = 1, rebuild = False):
+    '''
+    Function -- build_all
+        Builds every table up to a number of pieces, level by level, the tables of a level in parallel.
+    Parameters:
+        directory -- a string, the directory of the tables, created if needed
+        max_pieces -- an integer, the most pieces on the board, at most MAX_PIECES
+        workers -- an integer, the number of processes
+        rebuild -- a boolean, True to build the tables already in the directory again
+    Returns:
+        A list of the tuples returned by build_table, for the tables built.
+    '''
+    if not 2 <= max_pieces <= MAX_PIECES:
+        raise ValueError('max_pieces must be between 2 and ' + str(MAX_PIECES))
+    os.makedirs(directory, exist_ok = True)
+    res = []
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers = workers, mp_context = multiprocessing.get_context(START_METHOD))
+    try:
+        for level in signatures(max_pieces):
+            todo = [signature for signature in level
+                    if rebuild or not os.path.exists(os.path.join(directory, signature_name(signature)))]
+            if pool:
+                res.extend(pool.map(build_table, todo, [directory] * len(todo)))
+            else:
+                res.extend(build_table(signature, directory) for signature in todo)
+    finally:
+        if pool:
+            pool.shutdown()
+    return res
+
+
+class Tablebase:
+    '''
+    Class -- Tablebase
+        Probes the tables of a directory. Tables are mapped into memory when first needed and
+        kept in a least recently used cache of open mappings, so a probe is an index computation
+        and a read from memory, with no disk read once the pages are cached.
+    Attributes:
+        directory -- a string, the directory of the tables
+        max_open -- an integer, the most tables kept mapped at once
+        available -- a set of signatures, the tables in the directory
+        max_pieces -- an integer, the most pieces of an available table, 0 if there is none
+        open_tables -- an OrderedDict mapping a signature to its (file, mmap, memoryview), least recent first
+        hits -- an integer, probes answered
+        misses -- an integer, probes of positions without a table
+    Methods:
+        probe, table, close
+    '''
+
+
+    def __init__(self, directory = DEFAULT_DIRECTORY, max_open = DEFAULT_MAX_OPEN):
+        '''
+        Constructor -- creates a new instance of Tablebase.
+        Parameters:
+            self -- the current Tablebase object
+            directory -- a string, the directory of the tables
+            max_open -- an integer, the most tables kept mapped at once
+        '''
+        self.directory = directory
+        self.max_open = max_open
+        self.available = set()
+        if os.path.isdir(directory):
+            for name in os.listdir(directory):
+                if name.endswith('.tb') and len(name) == 7 and name[:4].isdigit():
+                    self.available.add(tuple(int(digit) for digit in name[:4]))
+        self.max_pieces = max((sum(signature) for signature in self.available), default = 0)
+        self.open_tables = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+
+    def probe(self, board):
+        '''
+        Method -- probe
+            Looks a position up.
+        Parameters:
+            board -- a Bitboard
+        Returns:
+            An integer from the point of view of the player to move: 0 for a draw, d > 0 for a win
+            in d plies, -(d + 1) for a loss in d plies. None if no table covers the position.
+        '''
+        if not (board.red if board.turn else board.black):
+            return -1
+        signature = signature_of(board)
+        if signature not in self.available:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self.table(signature)[index_of(board, signature)]
+
+
+    def table(self, signature):
+        '''
+        Method -- table
+            Gets the values of a table, mapping it if needed and closing the least recently used one
+            when too many are open.
+        Parameters:
+            signature -- a tuple of four integers, an available table
+        Returns:
+            A memoryview of 16-bit integers, indexed like index_of.
+        '''
+        entry = self.open_tables.get(signature)
+        if entry:
+            self.open_tables.move_to_end(signature)
+            return entry[2]
+        file = open(os.path.join(self.directory, signature_name(signature)), 'rb')
+        mapping = mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ)
+        magic, black_men, black_kings, red_men, red_kings, count = HEADER.unpack_from(mapping)
+        if magic != MAGIC or (black_men, black_kings, red_men, red_kings) != signature or count != table_size(signature):
+            mapping.close()
+            file.close()
+            raise ValueError('corrupt table ' + signature_name(signature))
+        values = memoryview(mapping)[HEADER.size:].cast('h')
+        self.open_tables[signature] = (file, mapping, values)
+        while len(self.open_tables) > self.max_open:
+            file, mapping, old_values = self.open_tables.popitem(last = False)[1]
+            old_values.release()
+            mapping.close()
+            file.close()
+        return values
+
+
+    def close(self):
+        '''
+        Method -- close
+            Unmaps every open table.
+        Parameters:
+            N/A
+        Returns:
+            N/A, but closes the files.
+        '''
+        while self.open_tables:
+            file, mapping, values = self.open_tables.popitem()[1]
+            values.release()
+            mapping.close()
+            file.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Build checkers endgame tablebases.')
+    parser.add_argument('--pieces', type = int, default = DEFAULT_PIECES, help = 'the most pieces on the board')
+    parser.add_argument('--workers', type = int, default = os.cpu_count() or 1, help = 'the number of processes')
+    parser.add_argument('--directory', default = DEFAULT_DIRECTORY, help = 'where to write the tables')
+    parser.add_argument('--rebuild', action = 'store_true', help = 'build existing tables again')
+    args = parser.parse_args()
+    for signature, positions, wins, losses in build_all(args.directory, args.pieces, args.workers, args.rebuild):
+        print(signature_name(signature), 'positions', positions, 'wins', wins, 'losses', losses,
+              'draws', positions - wins - losses)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To precompute the neighbours and jumps of every square once, at import
+'''
+
+
+NUM_SQUARES = 8
+NUM_DARK_SQUARES = 32
+SQUARES_PER_ROW = 4
+
+UP_LEFT = 0
+UP_RIGHT = 1
+DOWN_LEFT = 2
+DOWN_RIGHT = 3
+ALL_DIRECTIONS = (UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT)
+OPPOSITE = (DOWN_RIGHT, DOWN_LEFT, UP_RIGHT, UP_LEFT)
+DIRECTION_DELTAS = ((-1, 1), (1, 1), (-1, -1), (1, -1))
+
+BLACK_MAN = 0
+RED_MAN = 1
+KING = 2
+# Directions of each kind of piece, in the order State has always searched them:
+# the left column before the right one, the lower row before the upper one.
+KIND_DIRECTIONS = ((UP_LEFT, UP_RIGHT), (DOWN_LEFT, DOWN_RIGHT), (DOWN_LEFT, UP_LEFT, DOWN_RIGHT, UP_RIGHT))
+NO_SQUARE = -1
+
+
+def coord_to_square(x, y):
+    '''
+    Function -- coord_to_square
+        Converts the coordinate of a dark cell to its square index.
+    Parameters:
+        x -- an integer, the column of the cell
+        y -- an integer, the row of the cell
+    Returns:
+        An integer in [0, 32), the square index of the cell.
+    '''
+    return y * SQUARES_PER_ROW + x // 2
+
+
+def square_to_coord(square):
+    '''
+    Function -- square_to_coord
+        Converts a square index to the coordinate of its dark cell.
+    Parameters:
+        square -- an integer in [0, 32)
+    Returns:
+        A tuple of two integers, the column and the row of the cell.
+    '''
+    y = square // SQUARES_PER_ROW
+    x = 2 * (square % SQUARES_PER_ROW) + 1 - y % 2
+    return (x, y)
+
+
+def on_board(x, y):
+    '''
+    Function -- on_board
+        Tells if a coordinate lies on the checkerboard.
+    Parameters:
+        x -- an integer, the column
+        y -- an integer, the row
+    Returns:
+        A boolean, True if the coordinate is on the checkerboard.
+    '''
+    return 0 <= x < NUM_SQUARES and 0 <= y < NUM_SQUARES
+
+
+def piece_kind(player, is_king):
+    '''
+    Function -- piece_kind
+        Gets the kind of a piece, which decides the directions it moves in.
+    Parameters:
+        player -- an integer, 0 for black, 1 for red
+        is_king -- a boolean, True for a king piece
+    Returns:
+        An integer, BLACK_MAN, RED_MAN or KING.
+    '''
+    return KING if is_king else player
+
+
+def build_targets(num_steps):
+    '''
+    Function -- build_targets
+        Builds, for each direction, the square reached from every square after a number of steps.
+    Parameters:
+        num_steps -- an integer, 1 for neighbours, 2 for jump landings
+    Returns:
+        A tuple of four tuples of 32 integers, NO_SQUARE where the target leaves the board.
+    '''
+    targets = []
+    for dx, dy in DIRECTION_DELTAS:
+        row = []
+        for square in range(NUM_DARK_SQUARES):
+            x, y = square_to_coord(square)
+            x += dx * num_steps
+            y += dy * num_steps
+            row.append(coord_to_square(x, y) if on_board(x, y) else NO_SQUARE)
+        targets.append(tuple(row))
+    return tuple(targets)
+
+
+NEIGHBOR = build_targets(1)
+LANDING = build_targets(2)
+
+
+def build_square_steps():
+    '''
+    Function -- build_square_steps
+        Builds, for each kind of piece and each square, the (neighbour, landing) pairs it may step or jump through.
+    Parameters:
+        N/A
+    Returns:
+        A tuple of three tuples of 32 tuples of (neighbour, landing) pairs,
+        landing being NO_SQUARE when a jump would leave the board.
+    '''
+    res = []
+    for directions in KIND_DIRECTIONS:
+        kind_steps = []
+        for square in range(NUM_DARK_SQUARES):
+            kind_steps.append(tuple((NEIGHBOR[direction][square], LANDING[direction][square])
+                                    for direction in directions if NEIGHBOR[direction][square] != NO_SQUARE))
+        res.append(tuple(kind_steps))
+    return tuple(res)
+
+
+def build_cell_steps():
+    '''
+    Function -- build_cell_steps
+        Builds the coordinate form of the square steps, for every cell of the 8x8 board.
+    Parameters:
+        N/A
+    Returns:
+        A tuple of three 8x8 nested tuples, indexed by kind, column and row, of
+        (x, y, x_jump, y_jump) tuples, x_jump being NO_SQUARE when a jump would leave the board.
+    '''
+    res = []
+    for directions in KIND_DIRECTIONS:
+        columns = []
+        for x in range(NUM_SQUARES):
+            rows = []
+            for y in range(NUM_SQUARES):
+                steps = []
+                for direction in directions:
+                    dx, dy = DIRECTION_DELTAS[direction]
+                    if on_board(x + dx, y + dy):
+                        if on_board(x + 2 * dx, y + 2 * dy):
+                            steps.append((x + dx, y + dy, x + 2 * dx, y + 2 * dy))
+                        else:
+                            steps.append((x + dx, y + dy, NO_SQUARE, NO_SQUARE))
+                rows.append(tuple(steps))
+            columns.append(tuple(rows))
+        res.append(tuple(columns))
+    return tuple(res)
+
+
+def build_landings():
+    '''
+    Function -- build_landings
+        Builds the landing cell of every jump that stays on the board.
+    Parameters:
+        N/A
+    Returns:
+        A dict with tuple(x, y, x_over, y_over) as the key and tuple(x_jump, y_jump) as the value.
+    '''
+    res = {}
+    for x in range(NUM_SQUARES):
+        for y in range(NUM_SQUARES):
+            for dx, dy in DIRECTION_DELTAS:
+                if on_board(x + 2 * dx, y + 2 * dy):
+                    res[(x, y, x + dx, y + dy)] = (x + 2 * dx, y + 2 * dy)
+    return res
+
+
+def build_search_coords():
+    '''
+    Function -- build_search_coords
+        Builds the x and y coordinates Cell.get_coords_to_search returns, for every kind and cell.
+    Parameters:
+        N/A
+    Returns:
+        A tuple of three 8x8 nested lists of two-element lists of lists of integers.
+    '''
+    res = []
+    for kind in (BLACK_MAN, RED_MAN, KING):
+        columns = []
+        for x in range(NUM_SQUARES):
+            rows = []
+            for y in range(NUM_SQUARES):
+                if kind == KING:
+                    y_to_search = [y - 1, y + 1]
+                else:
+                    y_to_search = [y + ( -1 ) ** kind]
+                rows.append([[x - 1, x + 1], y_to_search])
+            columns.append(rows)
+        res.append(columns)
+    return tuple(res)
+
+
+def build_nearby_cells():
+    '''
+    Function -- build_nearby_cells
+        Builds, for every cell, the cells whose moves change when that cell changes:
+        the cell itself and the cells one or two steps away along a diagonal.
+    Parameters:
+        N/A
+    Returns:
+        An 8x8 nested tuple, indexed by column and row, of tuples of (x, y) coordinates.
+    '''
+    columns = []
+    for x in range(NUM_SQUARES):
+        rows = []
+        for y in range(NUM_SQUARES):
+            cells = [(x, y)]
+            for dx, dy in DIRECTION_DELTAS:
+                for distance in (1, 2):
+                    if on_board(x + dx * distance, y + dy * distance):
+                        cells.append((x + dx * distance, y + dy * distance))
+            rows.append(tuple(cells))
+        columns.append(tuple(rows))
+    return tuple(columns)
+
+
+SQUARE_STEPS = build_square_steps()
+CELL_STEPS = build_cell_steps()
+LANDINGS = build_landings()
+SEARCH_COORDS = build_search_coords()
+NEARBY_CELLS = build_nearby_cells()
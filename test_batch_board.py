@@ -0,0 +1,116 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the class BatchBoards against Bitboard
+'''
+
+from batch_board import BatchBoards, from_bitboards, NO_WINNER
+from bitboard import Bitboard, coord_to_square, INITIAL_BLACK, INITIAL_RED, BLACK, RED
+from tables import NEIGHBOR, LANDING, NUM_DARK_SQUARES
+import numpy as np
+import unittest
+
+
+def hops(masks, targets):
+    return sorted((square, targets[direction][square]) for direction in range(4)
+                  for square in range(NUM_DARK_SQUARES) if int(masks[direction]) >> square & 1)
+
+
+class BatchBoardsTest(unittest.TestCase):
+
+
+    def test_initial(self):
+        boards = BatchBoards(3)
+        self.assertEqual(len(boards), 3)
+        self.assertEqual(boards.bitboard(2), Bitboard(INITIAL_BLACK, INITIAL_RED))
+        self.assertEqual(list(boards.move_counts()), [7, 7, 7])
+        self.assertFalse(boards.capture_flags().any())
+
+
+    def test_moves_match_bitboard(self):
+        boards = BatchBoards(64)
+        rng = np.random.default_rng(1)
+        for hop in range(120):
+            masks, captures = boards.move_masks()
+            for index in range(len(boards)):
+                if boards.forced[index] or boards.winner[index] != NO_WINNER:
+                    continue
+                board = boards.bitboard(index)
+                self.assertEqual(bool(captures[index]), board.has_capture())
+                if captures[index]:
+                    self.assertEqual(hops(masks[index], LANDING), sorted(board.jumps()))
+                else:
+                    self.assertEqual(hops(masks[index], NEIGHBOR), sorted(board.quiet_moves()))
+            boards.step(rng)
+
+
+    def test_turns_match_bitboard(self):
+        boards = BatchBoards(64)
+        rng = np.random.default_rng(2)
+        starts = [boards.bitboard(index) for index in range(len(boards))]
+        for hop in range(300):
+            plies = boards.plies.copy()
+            boards.step(rng)
+            for index in np.nonzero(boards.plies != plies)[0]:
+                board = boards.bitboard(index)
+                children = [starts[index].apply_move(move) for move in starts[index].generate_moves()]
+                self.assertIn(board, children)
+                starts[index] = board
+
+
+    def test_crowned_capture_continues(self):
+        board = Bitboard()
+        board.put(coord_to_square(2, 5), BLACK)
+        board.put(coord_to_square(3, 6), RED)
+        board.put(coord_to_square(5, 6), RED)
+        boards = from_bitboards([board])
+        boards.step(np.random.default_rng(0))
+        self.assertEqual(boards.turn[0], BLACK)
+        self.assertEqual(int(boards.forced[0]), 1 << coord_to_square(4, 7))
+        self.assertTrue(int(boards.kings[0]) >> coord_to_square(4, 7) & 1)
+        boards.step(np.random.default_rng(0))
+        self.assertEqual(boards.turn[0], RED)
+        self.assertEqual(boards.bitboard(0), board.apply_move(board.generate_moves()[0]))
+        boards.step(np.random.default_rng(0))
+        self.assertEqual(boards.winner[0], BLACK)
+
+
+    def test_partial_step_keeps_capture(self):
+        board = Bitboard()
+        board.put(coord_to_square(0, 1), BLACK)
+        board.put(coord_to_square(1, 2), RED)
+        board.put(coord_to_square(3, 4), RED)
+        boards = from_bitboards([board, board])
+        boards.step(np.random.default_rng(0))
+        landed = 1 << coord_to_square(2, 3)
+        self.assertEqual([int(forced) for forced in boards.forced], [landed, landed])
+        before = boards.bitboard(0)
+        boards.step(np.random.default_rng(0), np.array([False, True]))
+        self.assertEqual([int(forced) for forced in boards.forced], [landed, 0])
+        self.assertEqual(list(boards.turn), [BLACK, RED])
+        self.assertEqual(boards.bitboard(0), before)
+        boards.step(np.random.default_rng(0), np.array([True, False]))
+        self.assertEqual(list(boards.forced), [0, 0])
+        self.assertEqual(boards.bitboard(0), boards.bitboard(1))
+        self.assertEqual(boards.bitboard(0), board.apply_move(board.generate_moves()[0]))
+
+
+    def test_play_random(self):
+        boards = BatchBoards(32)
+        winners = boards.play_random(np.random.default_rng(3), 200)
+        self.assertTrue(set(winners.tolist()) <= {BLACK, RED, NO_WINNER})
+        for index in range(len(boards)):
+            if winners[index] == NO_WINNER:
+                self.assertEqual(boards.plies[index], 200)
+            else:
+                self.assertFalse(boards.bitboard(index).generate_moves())
+                self.assertEqual(boards.turn[index], 1 - winners[index])
+        again = BatchBoards(32)
+        self.assertEqual(again.play_random(np.random.default_rng(3), 200).tolist(), winners.tolist())
+
+
+def main():
+    unittest.main()
+
+
+main()
@@ -0,0 +1,88 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the benchmark suite
+'''
+
+from benchmark import build_corpus, read_corpus, write_corpus, run_benchmarks, compare, confirm, same_runner, BENCHMARKS
+from headless import load_state
+from bitboard import from_checkerboard
+import os
+import tempfile
+import unittest
+
+
+class BenchmarkTest(unittest.TestCase):
+
+
+    def test_corpus(self):
+        corpus = build_corpus(6, 1)
+        self.assertEqual(len(corpus), 6)
+        self.assertEqual(build_corpus(6, 1), corpus)
+        self.assertTrue(all(board.generate_moves() for board in corpus))
+        path = os.path.join(tempfile.mkdtemp(), 'corpus.txt')
+        write_corpus(corpus, path)
+        self.assertEqual(read_corpus(path), corpus)
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+
+    def test_benchmarks_restore_states(self):
+        corpus = build_corpus(4, 3)
+        states = [load_state(board) for board in corpus]
+        for name, function in BENCHMARKS.items():
+            if name != 'update_valid_moves':
+                self.assertGreater(function(states), 0)
+        for state, board in zip(states, corpus):
+            self.assertEqual(from_checkerboard(state.checkerboard, state.turn), board)
+            self.assertEqual(state.key, board.key)
+
+
+    def test_run_and_compare(self):
+        current = run_benchmarks(build_corpus(2), ['search_jump'], repeat = 1)
+        self.assertEqual(list(current['results']), ['search_jump', 'calibration'])
+        self.assertGreater(current['results']['search_jump']['us_per_op'], 0)
+        slow = {'results': {'search_jump': {'us_per_op': current['results']['search_jump']['us_per_op'] / 2, 'ops': 1}}}
+        name, us, old, ratio, regressed = compare(current, slow)[0]
+        self.assertAlmostEqual(ratio, 2.0)
+        self.assertTrue(regressed)
+        self.assertFalse(compare(current, current)[0][4])
+        self.assertIsNone(compare(current, {'results': {}})[0][2])
+        self.assertFalse(compare(current, slow, tolerance = 1.5)[0][4])
+
+
+    def test_tolerances(self):
+        current = {'results': {'headless_games': {'us_per_op': 1.4, 'ops': 1}, 'search_jump': {'us_per_op': 1.3, 'ops': 1}}}
+        baseline = {'results': {'headless_games': {'us_per_op': 1.0, 'ops': 1}, 'search_jump': {'us_per_op': 1.0, 'ops': 1}}}
+        self.assertEqual([row[4] for row in compare(current, baseline)], [False, True])
+        current['results']['calibration'] = {'us_per_op': 2.0, 'ops': 1}
+        baseline['results']['calibration'] = {'us_per_op': 1.0, 'ops': 1}
+        rows = compare(current, baseline)
+        self.assertEqual([row[4] for row in rows], [False, False, False])
+        self.assertAlmostEqual(rows[1][3], 0.65)
+        self.assertEqual(rows[2][3], 2.0)
+
+
+    def test_confirm(self):
+        corpus = build_corpus(2)
+        current = run_benchmarks(corpus, ['search_jump', 'locate_click'], repeat = 1)
+        us = current['results']['search_jump']['us_per_op']
+        baseline = {'results': {'search_jump': {'us_per_op': us / 100, 'ops': 1},
+                                'locate_click': dict(current['results']['locate_click'])}}
+        current['results']['locate_click']['us_per_op'] *= 100
+        rows = confirm(current, baseline, corpus, repeat = 1)
+        self.assertEqual([row[4] for row in rows], [True, False, False])
+
+
+    def test_same_runner(self):
+        current = run_benchmarks(build_corpus(2), ['search_jump'], repeat = 1)
+        self.assertTrue(same_runner(current, current))
+        self.assertFalse(same_runner(current, dict(current, machine = 'elsewhere')))
+        self.assertFalse(same_runner(current, {'results': {}}))
+
+
+def main():
+    unittest.main()
+
+
+main()
@@ -0,0 +1,146 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the class Bitboard
+'''
+
+from coordinate import Coordinate
+from piece import Piece
+from cell import Cell
+from bitboard import Bitboard, from_checkerboard, coord_to_square, square_to_coord, step, step_back
+from bitboard import INITIAL_BLACK, INITIAL_RED, UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT, BLACK, RED
+import unittest
+
+
+class BitboardTest(unittest.TestCase):
+
+
+    def test_square_coord(self):
+        for square in range(32):
+            x, y = square_to_coord(square)
+            self.assertNotEqual(x % 2, y % 2)
+            self.assertEqual(coord_to_square(x, y), square)
+        self.assertEqual(square_to_coord(0), (1, 0))
+        self.assertEqual(square_to_coord(4), (0, 1))
+        self.assertEqual(square_to_coord(31), (6, 7))
+
+
+    def test_step(self):
+        self.assertEqual(step(1 << coord_to_square(3, 2), UP_LEFT), 1 << coord_to_square(2, 3))
+        self.assertEqual(step(1 << coord_to_square(3, 2), DOWN_RIGHT), 1 << coord_to_square(4, 1))
+        self.assertEqual(step(1 << coord_to_square(0, 1), UP_LEFT), 0)
+        self.assertEqual(step(1 << coord_to_square(6, 7), UP_RIGHT), 0)
+        self.assertEqual(step_back(1 << coord_to_square(2, 3), UP_LEFT), 1 << coord_to_square(3, 2))
+        self.assertEqual(step_back(1 << coord_to_square(1, 0), UP_LEFT), 0)
+
+
+    def test_initial_moves(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        self.assertEqual(len(board.quiet_moves()), 7)
+        self.assertEqual(board.jumps(), [])
+        self.assertFalse(board.has_capture())
+        self.assertEqual(board.count_moves(), 7)
+        board.turn = RED
+        self.assertEqual(len(board.quiet_moves()), 7)
+        self.assertEqual(board.valid_moves()[(0, 5)], [(1, 4)])
+
+
+    def test_jumps(self):
+        board = Bitboard()
+        board.put(coord_to_square(3, 2), BLACK)
+        board.put(coord_to_square(2, 3), RED)
+        board.put(coord_to_square(4, 3), RED)
+        self.assertTrue(board.has_capture())
+        self.assertEqual(sorted(board.valid_moves()[(3, 2)]), [(1, 4), (5, 4)])
+        self.assertEqual(board.count_moves(), 2)
+        board.put(coord_to_square(1, 4), RED)
+        self.assertEqual(board.valid_moves(), {(3, 2): [(5, 4)]})
+
+
+    def test_king_moves(self):
+        board = Bitboard()
+        board.put(coord_to_square(3, 2), BLACK, is_king = True)
+        self.assertEqual(sorted(board.valid_moves()[(3, 2)]), [(2, 1), (2, 3), (4, 1), (4, 3)])
+        board.put(coord_to_square(2, 1), RED)
+        self.assertEqual(board.valid_moves(), {(3, 2): [(1, 0)]})
+        board.turn = RED
+        self.assertEqual(sorted(board.valid_moves()[(2, 1)]), [(1, 0), (3, 0)])
+
+
+    def test_capture_paths(self):
+        board = Bitboard()
+        board.put(coord_to_square(1, 0), BLACK)
+        board.put(coord_to_square(2, 1), RED)
+        board.put(coord_to_square(4, 3), RED)
+        board.put(coord_to_square(2, 3), RED)
+        moves = board.generate_moves()
+        self.assertEqual(sorted(move.coords() for move in moves), [[(1, 0), (3, 2), (1, 4)], [(1, 0), (3, 2), (5, 4)]])
+        self.assertTrue(all(len(move.path) == 3 and move.captured.bit_count() == 2 for move in moves))
+
+
+    def test_capture_paths_crowning(self):
+        board = Bitboard()
+        board.put(coord_to_square(2, 5), BLACK)
+        board.put(coord_to_square(3, 6), RED)
+        board.put(coord_to_square(5, 6), RED)
+        moves = list(board.capture_paths())
+        self.assertEqual(len(moves), 1)
+        self.assertEqual(moves[0].coords(), [(2, 5), (4, 7), (6, 5)])
+        self.assertTrue(moves[0].crowned)
+        after = board.apply_move(moves[0])
+        self.assertEqual(after.black, 1 << coord_to_square(6, 5))
+        self.assertEqual(after.kings, after.black)
+        self.assertEqual(after.red, 0)
+        self.assertEqual(after.turn, RED)
+
+
+    def test_capture_paths_duplicates(self):
+        board = Bitboard()
+        board.put(coord_to_square(1, 2), BLACK, is_king = True)
+        for x, y in [(2, 3), (4, 3), (4, 1), (2, 1)]:
+            board.put(coord_to_square(x, y), RED)
+        moves = list(board.capture_paths())
+        self.assertEqual(len(moves), 1)
+        self.assertEqual(moves[0].from_square(), moves[0].to_square())
+        self.assertEqual(moves[0].captured, board.red)
+
+
+    def test_apply_move(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        moves = board.generate_moves()
+        self.assertEqual(len(moves), 7)
+        after = board.apply_move(moves[0])
+        self.assertEqual(after.turn, RED)
+        self.assertEqual((after.black | after.red).bit_count(), 24)
+        self.assertEqual(board.turn, BLACK)
+
+
+    def test_quiet_move(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        move = board.quiet_move(coord_to_square(3, 2), coord_to_square(2, 3))
+        self.assertEqual(move.coords(), [(3, 2), (2, 3)])
+        self.assertFalse(move.crowned)
+        self.assertIsNone(board.quiet_move(coord_to_square(3, 2), coord_to_square(3, 4)))
+        self.assertIsNone(board.quiet_move(coord_to_square(2, 1), coord_to_square(3, 2)))
+        self.assertIsNone(board.quiet_move(coord_to_square(2, 5), coord_to_square(3, 4)))
+        board = Bitboard()
+        board.put(coord_to_square(2, 6), BLACK)
+        self.assertTrue(board.quiet_move(coord_to_square(2, 6), coord_to_square(3, 7)).crowned)
+
+
+    def test_from_checkerboard(self):
+        checkerboard = [[Cell(Coordinate(col, row)) for row in range(8)] for col in range(8)]
+        checkerboard[3][2].occupied = Piece(player = 0)
+        checkerboard[4][5].occupied = Piece(player = 1, is_king = True)
+        board = from_checkerboard(checkerboard, 1)
+        self.assertEqual(board.black, 1 << coord_to_square(3, 2))
+        self.assertEqual(board.red, 1 << coord_to_square(4, 5))
+        self.assertEqual(board.kings, 1 << coord_to_square(4, 5))
+        self.assertEqual(board.turn, 1)
+
+
+def main():
+    unittest.main()
+
+
+main()
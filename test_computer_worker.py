@@ -0,0 +1,135 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the computer worker
+'''
+
+from computer_worker import ComputerWorker
+from headless import stub_display
+from bitboard import Bitboard, INITIAL_BLACK, INITIAL_RED
+from engine import Engine
+from state import State, HUMAN, COMPUTER
+import contextlib
+import io
+import time
+import unittest
+
+
+class Failing:
+
+
+    def choose_move(self, board, stop_event = None):
+        raise ValueError('no move')
+
+
+class ComputerWorkerTest(unittest.TestCase):
+
+
+    def test_move(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = Engine(max_depth = 3, time_limit = None).choose_move(board)
+            worker = ComputerWorker(Engine(max_depth = 3, time_limit = None))
+            self.assertFalse(worker.done())
+            worker.start(board)
+            self.assertEqual(worker.take(), expected)
+        self.assertTrue(worker.done())
+
+
+    def test_cancel(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        worker = ComputerWorker(Engine(time_limit = None))
+        with contextlib.redirect_stdout(io.StringIO()):
+            worker.start(board)
+            time.sleep(0.2)
+            start = time.perf_counter()
+            worker.cancel()
+            move = worker.take()
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertTrue(worker.cancelled)
+        self.assertIn(move, board.generate_moves())
+
+
+    def test_cancel_before_start(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        engine = Engine(max_depth = 60, time_limit = None)
+        worker = ComputerWorker(engine)
+        worker.cancel()
+        with contextlib.redirect_stdout(io.StringIO()):
+            worker.start(board)
+            move = worker.take()
+        self.assertTrue(worker.cancelled)
+        self.assertIn(move, board.generate_moves())
+        self.assertLess(engine.depth, 60)
+
+
+    def test_late_cancel(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        engine = Engine(max_depth = 4, time_limit = None)
+        with contextlib.redirect_stdout(io.StringIO()):
+            worker = ComputerWorker(engine)
+            worker.start(board)
+            worker.take()
+            worker.cancel()
+            engine.choose_move(board)
+        self.assertFalse(worker.cancelled)
+        self.assertFalse(worker.stop_event.is_set())
+        self.assertEqual(engine.depth, 4)
+
+
+    def test_error(self):
+        worker = ComputerWorker(Failing())
+        worker.start(Bitboard(INITIAL_BLACK, INITIAL_RED))
+        with self.assertRaises(ValueError):
+            worker.take()
+
+
+    def test_state(self):
+        state = State(computer = Engine(max_depth = 2, time_limit = None))
+        with contextlib.redirect_stdout(io.StringIO()):
+            state.render_board()
+            state.init_pieces()
+            state.update_valid_moves()
+            state.display = stub_display(state)
+            state.cell_focused = state.checkerboard[1][2]
+            state.move_piece(state.cell_focused, state.checkerboard[2][3])
+            state.switch_player_to_computer()
+            self.assertIsNotNone(state.worker)
+            self.assertEqual(state.turn, COMPUTER)
+            state.click_handler(0, 0)
+            self.assertEqual(state.turn, COMPUTER)
+            deadline = time.perf_counter() + 10
+            while state.worker and time.perf_counter() < deadline:
+                state.display.scheduler.tick()
+                time.sleep(0.01)
+        self.assertIsNone(state.worker)
+        self.assertEqual(state.turn, HUMAN)
+        self.assertEqual(state.move_count, 3)
+        self.assertGreater(state.display.pen_guide.calls['write'], 0)
+
+
+    def test_state_error(self):
+        state = State(computer = Failing())
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()) as errors:
+            state.render_board()
+            state.init_pieces()
+            state.update_valid_moves()
+            state.display = stub_display(state)
+            state.cell_focused = state.checkerboard[1][2]
+            state.move_piece(state.cell_focused, state.checkerboard[2][3])
+            state.switch_player_to_computer()
+            deadline = time.perf_counter() + 10
+            while state.worker and time.perf_counter() < deadline:
+                state.display.scheduler.tick()
+                time.sleep(0.01)
+        self.assertIn('no move', errors.getvalue())
+        self.assertIsNone(state.worker)
+        self.assertEqual(state.turn, HUMAN)
+        self.assertEqual(state.move_count, 3)
+
+
+def main():
+    unittest.main()
+
+
+main()
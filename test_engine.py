@@ -0,0 +1,109 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the class Engine
+'''
+
+from bitboard import Bitboard, coord_to_square, INITIAL_BLACK, INITIAL_RED, BLACK, RED
+from engine import Engine, evaluate, WIN_SCORE, MAX_PLY
+from piece import Piece
+from state import State
+import threading
+import unittest
+
+
+class EngineTest(unittest.TestCase):
+
+
+    def test_evaluate(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        self.assertEqual(evaluate(board), 0)
+        board.put(coord_to_square(3, 4), BLACK, is_king = True)
+        self.assertEqual(evaluate(board), 160)
+        board.turn = RED
+        self.assertEqual(evaluate(board), -160)
+
+
+    def test_no_moves(self):
+        board = Bitboard()
+        board.put(coord_to_square(1, 0), RED)
+        line, score = Engine(max_depth = 4).search(board)
+        self.assertEqual(line, [])
+        self.assertEqual(score, -WIN_SCORE)
+
+
+    def test_finds_win(self):
+        board = Bitboard()
+        board.put(coord_to_square(2, 3), BLACK)
+        board.put(coord_to_square(7, 0), BLACK)
+        board.put(coord_to_square(3, 4), RED)
+        engine = Engine(max_depth = 8, time_limit = None)
+        line, score = engine.search(board)
+        self.assertGreater(score, WIN_SCORE - MAX_PLY)
+        self.assertEqual([str(move) for move in line], ['(2, 3)x(4, 5)'])
+
+
+    def test_node_limit(self):
+        engine = Engine(max_depth = 30, time_limit = None, node_limit = 5000)
+        line, score = engine.search(Bitboard(INITIAL_BLACK, INITIAL_RED))
+        self.assertTrue(line)
+        self.assertLess(engine.depth, 30)
+        self.assertLessEqual(engine.nodes, 5000)
+
+
+    def test_table(self):
+        engine = Engine(max_depth = 6, time_limit = None)
+        line, score = engine.search(Bitboard(INITIAL_BLACK, INITIAL_RED))
+        self.assertGreater(engine.table.filled(), 0)
+        self.assertGreater(engine.table.hits, 0)
+        nodes = engine.nodes
+        again, score_again = engine.search(Bitboard(INITIAL_BLACK, INITIAL_RED))
+        self.assertLess(engine.nodes, nodes)
+        self.assertEqual(score_again, score)
+
+
+    def test_cancel(self):
+        engine = Engine(max_depth = 60, time_limit = None)
+        timer = threading.Timer(0.2, engine.cancel)
+        timer.start()
+        line, score = engine.search(Bitboard(INITIAL_BLACK, INITIAL_RED))
+        timer.join()
+        self.assertTrue(line)
+        self.assertLess(engine.depth, 60)
+
+
+    def test_cancel_before_search(self):
+        engine = Engine(max_depth = 60, time_limit = None)
+        stop_event = threading.Event()
+        stop_event.set()
+        line, score = engine.search(Bitboard(INITIAL_BLACK, INITIAL_RED), stop_event)
+        self.assertTrue(line)
+        self.assertLess(engine.depth, 60)
+        engine.cancel()
+        engine.max_depth = 2
+        line, score = engine.search(Bitboard(INITIAL_BLACK, INITIAL_RED))
+        self.assertEqual(engine.depth, 2)
+
+
+    def test_state_computer(self):
+        state = State(computer = Engine(max_depth = 4, time_limit = None))
+        state.render_board()
+        state.turn = 1
+        state.checkerboard[4][5].occupied = Piece(player = 1)
+        state.checkerboard[3][4].occupied = Piece(player = 0)
+        state.checkerboard[3][2].occupied = Piece(player = 0)
+        state.checkerboard[7][2].occupied = Piece(player = 0)
+        state.update_valid_moves()
+        state.cell_focused = state.sample_piece()
+        state.auto_play(state.sample_cell())
+        self.assertEqual(state.checkerboard[4][5].occupied, 0)
+        self.assertEqual(state.checkerboard[3][4].occupied, 0)
+        self.assertEqual(state.checkerboard[3][2].occupied, 0)
+        self.assertEqual(state.checkerboard[4][1].occupied.player, 1)
+
+
+def main():
+    unittest.main()
+
+
+main()
@@ -0,0 +1,225 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the frame scheduler
+'''
+
+from frame_scheduler import FrameScheduler
+from metrics import METRICS
+from headless import stub_display
+from state import State
+from stub_pen import StubPen
+import contextlib
+import io
+import time
+import unittest
+
+
+def run_until_idle(scheduler, limit = 5.0):
+    deadline = time.perf_counter() + limit
+    while not scheduler.idle() and time.perf_counter() < deadline:
+        scheduler.tick()
+        time.sleep(0.005)
+
+
+class TimerScreen:
+
+
+    def __init__(self):
+        self.waits = []
+
+
+    def ontimer(self, function, milliseconds):
+        self.waits.append(milliseconds)
+
+
+    def update(self):
+        pass
+
+
+class FrameSchedulerTest(unittest.TestCase):
+
+
+    def setUp(self):
+        self.screen = StubPen()
+        self.scheduler = FrameScheduler(self.screen)
+
+
+    def test_idle(self):
+        self.assertTrue(self.scheduler.idle())
+        self.scheduler.tick()
+        self.assertEqual(self.screen.calls, {})
+        self.assertFalse(self.scheduler.ticking)
+
+
+    def test_coalesce(self):
+        calls = []
+        for index in range(3):
+            self.scheduler.request_redraw('pieces', lambda index = index: calls.append(index))
+        self.scheduler.request_redraw('header', lambda: calls.append('header'))
+        self.assertEqual(self.screen.calls, {'ontimer': 1})
+        self.scheduler.tick()
+        self.assertEqual(calls, [2, 'header'])
+        self.assertEqual(self.screen.calls, {'ontimer': 1, 'update': 1})
+        self.assertTrue(self.scheduler.idle())
+        self.assertFalse(self.scheduler.ticking)
+
+
+    def test_animation(self):
+        steps = []
+
+        def animation():
+            for step in range(3):
+                steps.append(step)
+                yield
+
+        self.scheduler.animate(animation())
+        self.scheduler.tick()
+        self.assertEqual(steps, [0])
+        self.assertEqual(self.screen.calls['ontimer'], 2)
+        self.scheduler.tick()
+        self.scheduler.tick()
+        self.assertEqual(steps, [0, 1, 2])
+        self.assertFalse(self.scheduler.idle())
+        self.scheduler.tick()
+        self.assertTrue(self.scheduler.idle())
+        self.assertEqual(self.screen.calls['update'], 4)
+
+
+    def test_request_while_ticking(self):
+        self.scheduler.request_redraw('pieces', lambda: self.scheduler.request_redraw('header', lambda: None))
+        self.scheduler.tick()
+        self.assertEqual(self.screen.calls['ontimer'], 2)
+        self.assertFalse(self.scheduler.idle())
+        self.scheduler.tick()
+        self.assertTrue(self.scheduler.idle())
+
+
+    def test_budget(self):
+        scheduler = FrameScheduler(self.screen, budget = 0)
+        steps = []
+
+        def animation(name):
+            steps.append(name)
+            yield
+
+        for name in 'abc':
+            scheduler.animate(animation(name))
+        scheduler.tick()
+        self.assertEqual(steps, ['a'])
+        self.assertEqual(scheduler.overruns, 1)
+        scheduler.tick()
+        scheduler.tick()
+        self.assertEqual(steps, ['a', 'b', 'c'])
+
+
+    def test_error(self):
+        calls = []
+
+        def failing():
+            raise ValueError('redraw')
+
+        def broken():
+            yield
+            raise ValueError('animation')
+
+        self.scheduler.request_redraw('pieces', failing)
+        self.scheduler.request_redraw('header', lambda: calls.append('header'))
+        with self.assertRaises(ValueError):
+            self.scheduler.tick()
+        self.assertTrue(self.scheduler.ticking)
+        self.assertEqual(self.screen.calls['ontimer'], 2)
+        self.scheduler.tick()
+        self.assertEqual(calls, ['header'])
+        self.assertFalse(self.scheduler.ticking)
+        self.scheduler.animate(broken())
+        self.scheduler.tick()
+        with self.assertRaises(ValueError):
+            self.scheduler.tick()
+        self.assertTrue(self.scheduler.idle())
+        self.assertFalse(self.scheduler.ticking)
+        self.scheduler.request_redraw('header', lambda: calls.append('again'))
+        self.scheduler.tick()
+        self.assertEqual(calls, ['header', 'again'])
+
+
+    def test_metrics(self):
+        scheduler = FrameScheduler(self.screen, budget = 0)
+
+        def animation():
+            yield
+
+        METRICS.enable()
+        try:
+            scheduler.animate(animation())
+            scheduler.animate(animation())
+            scheduler.tick()
+            scheduler.tick()
+            histograms = METRICS.to_json()['histograms']
+            self.assertEqual(histograms['frame_seconds']['count'], 2)
+            self.assertEqual(METRICS.counters, {'frame_overruns': scheduler.overruns})
+            self.assertEqual(scheduler.overruns, 2)
+        finally:
+            METRICS.disable()
+            METRICS.reset()
+
+
+    def test_deadline(self):
+        screen = TimerScreen()
+        scheduler = FrameScheduler(screen, fps = 50)
+
+        def animation():
+            while True:
+                yield
+
+        scheduler.animate(animation())
+        scheduler.tick()
+        self.assertLessEqual(screen.waits[-1], 20)
+        scheduler.due = time.perf_counter() - 0.015
+        scheduler.tick()
+        self.assertLessEqual(screen.waits[-1], 6)
+        scheduler.due = time.perf_counter() - 0.5
+        scheduler.tick()
+        self.assertGreaterEqual(screen.waits[-1], 18)
+
+
+    def test_after(self):
+        calls = []
+        self.scheduler.after(0.02, lambda: calls.append(1))
+        self.scheduler.tick()
+        self.assertEqual(calls, [])
+        run_until_idle(self.scheduler)
+        self.assertEqual(calls, [1])
+
+
+    def test_display_effects(self):
+        state = State()
+        with contextlib.redirect_stdout(io.StringIO()):
+            state.render_board()
+            state.init_pieces()
+            state.update_valid_moves()
+            display = stub_display(state)
+            state.display = display
+            state.render_pieces()
+            display.scheduler.tick()
+            state.cell_focused = state.checkerboard[1][2]
+            state.move_piece(state.cell_focused, state.checkerboard[2][3])
+            state.render_pieces()
+        self.assertEqual(display.renderer.held, {(2, 3): 1})
+        display.scheduler.tick()
+        self.assertEqual(display.renderer.drawn[(2, 3)], 'held')
+        display.burst(4, 5)
+        self.assertEqual(len(display.effects), 2)
+        run_until_idle(display.scheduler)
+        self.assertEqual(display.effects, [])
+        self.assertEqual(display.renderer.held, {})
+        self.assertEqual(display.renderer.drawn[(2, 3)], state.checkerboard[2][3].occupied.freeze())
+        self.assertEqual(display.pen_out.calls['circle'], 6)
+        self.assertGreater(display.pen_slide.calls['setposition'], 1)
+
+
+def main():
+    unittest.main()
+
+
+main()
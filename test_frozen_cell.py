@@ -0,0 +1,60 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the class FrozenCell
+'''
+
+from frozen_cell import FrozenCell, CELLS, cell_at
+from frozen_coordinate import FrozenCoordinate
+from cell import Cell
+from coordinate import Coordinate
+from tables import NO_SQUARE
+import unittest
+
+
+class FrozenCellTest(unittest.TestCase):
+
+
+    def test_init(self):
+        cell = FrozenCell(3, 2)
+        self.assertEqual(cell.coord, FrozenCoordinate(3, 2))
+        self.assertEqual(cell.square, 9)
+        self.assertTrue(cell.is_dark())
+        self.assertEqual(FrozenCell(2, 2).square, NO_SQUARE)
+        self.assertFalse(FrozenCell(2, 2).is_dark())
+        self.assertEqual(cell.__str__(), 'x: 3 y: 2')
+        self.assertEqual(cell.generate_cell_key(), (3, 2))
+
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            cell_at(3, 2).square = 0
+        with self.assertRaises(AttributeError):
+            cell_at(3, 2).occupied = 0
+
+
+    def test_interned(self):
+        self.assertEqual(len(CELLS), 8)
+        self.assertIs(cell_at(3, 2), CELLS[3][2])
+        self.assertEqual(len({cell for column in CELLS for cell in column}), 64)
+        self.assertEqual(sum(cell.is_dark() for column in CELLS for cell in column), 32)
+
+
+    def test_eq_hash(self):
+        self.assertEqual(FrozenCell(3, 2), cell_at(3, 2))
+        self.assertEqual(hash(FrozenCell(3, 2)), hash(cell_at(3, 2)))
+        self.assertEqual(cell_at(3, 2), Cell(Coordinate(3, 2)))
+        self.assertNotEqual(cell_at(3, 2), cell_at(2, 3))
+        self.assertTrue(cell_at(3, 2).is_adjacent(cell_at(2, 3)))
+        self.assertFalse(cell_at(3, 2).is_adjacent(cell_at(5, 4)))
+
+
+    def test_freeze(self):
+        self.assertIs(Cell(Coordinate(4, 5)).freeze(), cell_at(4, 5))
+
+
+def main():
+    unittest.main()
+
+
+main()
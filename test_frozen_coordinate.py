@@ -0,0 +1,50 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the class FrozenCoordinate
+'''
+
+from frozen_coordinate import FrozenCoordinate
+from coordinate import Coordinate
+import unittest
+
+
+class FrozenCoordinateTest(unittest.TestCase):
+
+
+    def test_init(self):
+        coord = FrozenCoordinate(1, 2)
+        self.assertEqual(coord.x, 1)
+        self.assertEqual(coord.y, 2)
+        self.assertEqual(coord.__str__(), 'x: 1 y: 2')
+
+
+    def test_immutable(self):
+        coord = FrozenCoordinate(1, 2)
+        with self.assertRaises(AttributeError):
+            coord.x = 3
+        with self.assertRaises(AttributeError):
+            coord.z = 3
+        with self.assertRaises(AttributeError):
+            del coord.y
+
+
+    def test_eq_hash(self):
+        self.assertEqual(FrozenCoordinate(1, 2), FrozenCoordinate(1, 2))
+        self.assertEqual(FrozenCoordinate(1, 2), Coordinate(1, 2))
+        self.assertNotEqual(FrozenCoordinate(1, 2), FrozenCoordinate(2, 1))
+        self.assertNotEqual(FrozenCoordinate(1, 2), (1, 2))
+        self.assertEqual(len({FrozenCoordinate(1, 2), FrozenCoordinate(1, 2), FrozenCoordinate(0, 0)}), 2)
+
+
+    def test_thaw(self):
+        coord = FrozenCoordinate(1, 2).thaw()
+        coord.increment_x()
+        self.assertEqual(coord, Coordinate(2, 2))
+
+
+def main():
+    unittest.main()
+
+
+main()
@@ -0,0 +1,54 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the class FrozenPiece
+'''
+
+from frozen_piece import FrozenPiece, PIECES, piece_of
+from piece import Piece
+import unittest
+
+
+class FrozenPieceTest(unittest.TestCase):
+
+
+    def test_init(self):
+        piece = FrozenPiece(1)
+        self.assertEqual(piece.player, 1)
+        self.assertFalse(piece.is_king)
+        self.assertEqual(piece.__str__(), 'player: 1, which is non-king.')
+        self.assertFalse(hasattr(piece, 'color'))
+
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            piece_of(0).is_king = True
+        with self.assertRaises(AttributeError):
+            piece_of(0).color = 'black'
+
+
+    def test_eq_hash(self):
+        self.assertEqual(FrozenPiece(0, True), piece_of(0, True))
+        self.assertNotEqual(piece_of(0, True), piece_of(0, False))
+        self.assertNotEqual(piece_of(0), piece_of(1))
+        self.assertEqual(len({piece_of(player, is_king) for player in (0, 1) for is_king in (False, True)}), 4)
+
+
+    def test_interned(self):
+        self.assertIs(piece_of(1, True), PIECES[1][1])
+        self.assertIs(piece_of(True, 1), PIECES[1][1])
+        self.assertIs(piece_of(0).crowned(), piece_of(0, True))
+
+
+    def test_freeze(self):
+        piece = Piece(player = 1)
+        self.assertIs(piece.freeze(), piece_of(1))
+        piece.crown()
+        self.assertIs(piece.freeze(), piece_of(1, True))
+
+
+def main():
+    unittest.main()
+
+
+main()
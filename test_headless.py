@@ -0,0 +1,37 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the headless States and Displays
+'''
+
+from headless import load_state, stub_display
+from benchmark import build_corpus
+from bitboard import from_checkerboard
+import unittest
+
+
+class HeadlessTest(unittest.TestCase):
+
+
+    def test_load_state(self):
+        for board in build_corpus(6, 2):
+            state = load_state(board)
+            self.assertEqual(from_checkerboard(state.checkerboard, state.turn), board)
+            self.assertEqual(state.key, board.key)
+
+
+    def test_stub_display(self):
+        board = build_corpus(1)[0]
+        display = stub_display(load_state(board))
+        display.render_pieces(load_state(board).checkerboard)
+        self.assertEqual(display.renderer.pens, {})
+        display.scheduler.tick()
+        self.assertEqual(sum(pen.calls.get('shape', 0) for pen in display.renderer.pens.values()), 24)
+        self.assertEqual(display.screen.calls['update'], 1)
+
+
+def main():
+    unittest.main()
+
+
+main()
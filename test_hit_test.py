@@ -0,0 +1,63 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the hit testing of board cells
+'''
+
+from hit_test import grid_indices, cells_at, cell_at
+from state import State
+import random
+import unittest
+
+
+class HitTestTest(unittest.TestCase):
+
+
+    def test_grid_indices(self):
+        self.assertEqual(grid_indices(25, 0, 50, 8), [0])
+        self.assertEqual(grid_indices(50, 0, 50, 8), [0, 1])
+        self.assertEqual(grid_indices(0, 0, 50, 8), [0])
+        self.assertEqual(grid_indices(400, 0, 50, 8), [7])
+        self.assertEqual(grid_indices(-0.1, 0, 50, 8), [])
+        self.assertEqual(grid_indices(400.1, 0, 50, 8), [])
+
+
+    def test_rounding(self):
+        for index in range(1, 30):
+            for value in (0.1 * index, 0.1 * index + 0.1, 0.3 * index / 3):
+                expected = [i for i in range(30) if 0.1 * i <= value <= 0.1 * i + 0.1]
+                self.assertEqual(grid_indices(value, 0, 0.1, 30), expected)
+
+
+    def test_cells_at(self):
+        self.assertEqual(cells_at(10, 10, (0, 0), 50, 8), [(0, 0)])
+        self.assertEqual(cells_at(50, 50, (0, 0), 50, 8), [(0, 0), (0, 1), (1, 0), (1, 1)])
+        self.assertEqual(cells_at(1010, 10, (1000, 0), 50, 8), [(0, 0)])
+        self.assertEqual(cells_at(10, 10, (1000, 0), 50, 8), [])
+
+
+    def test_cell_at(self):
+        self.assertEqual(cell_at(60, 110, (0, 0), 50, 8), (1, 2))
+        self.assertIsNone(cell_at(-1, 110, (0, 0), 50, 8))
+
+
+    def test_locate_click_matches_scan(self):
+        state = State()
+        state.render_board()
+        rng = random.Random(7)
+        points = [(rng.uniform(-220, 220), rng.uniform(-220, 220)) for point in range(2000)]
+        points += [(x, y) for x in range(-225, 226, 25) for y in range(-225, 226, 25)]
+        for x, y in points:
+            expected = 0
+            for col in range(state.num_cells):
+                for row in range(state.num_cells):
+                    if row % 2 != col % 2 and not expected and state.checkerboard[col][row].is_click_in(x, y):
+                        expected = state.checkerboard[col][row]
+            self.assertIs(state.locate_click(x, y), expected)
+
+
+def main():
+    unittest.main()
+
+
+main()
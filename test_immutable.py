@@ -0,0 +1,45 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the class Immutable
+'''
+
+from immutable import Immutable
+from frozen_cell import FrozenCell
+from frozen_coordinate import FrozenCoordinate
+from frozen_piece import FrozenPiece
+import unittest
+
+
+class Point(Immutable):
+
+    __slots__ = ('x',)
+
+
+    def __init__(self, x):
+        object.__setattr__(self, 'x', x)
+
+
+class ImmutableTest(unittest.TestCase):
+
+
+    def test_refuse(self):
+        point = Point(1)
+        with self.assertRaisesRegex(AttributeError, 'Point is immutable'):
+            point.x = 2
+        with self.assertRaisesRegex(AttributeError, 'Point is immutable'):
+            del point.x
+        self.assertEqual(point.x, 1)
+
+
+    def test_no_dict(self):
+        for value in (Point(1), FrozenCoordinate(1, 2), FrozenCell(1, 2), FrozenPiece(0)):
+            self.assertFalse(hasattr(value, '__dict__'))
+            self.assertIsInstance(value, Immutable)
+
+
+def main():
+    unittest.main()
+
+
+main()
@@ -0,0 +1,89 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the class Mcts
+'''
+
+from mcts import Mcts, UCT, PUCT
+from batch_board import NO_WINNER
+from bitboard import Bitboard, coord_to_square, INITIAL_BLACK, INITIAL_RED, BLACK, RED
+import unittest
+
+
+def trap_board():
+    board = Bitboard()
+    board.put(coord_to_square(2, 1), BLACK, is_king = True)
+    board.put(coord_to_square(0, 1), RED)
+    return board
+
+
+class MctsTest(unittest.TestCase):
+
+
+    def test_search(self):
+        mcts = Mcts(200, None, seed = 0)
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        line, score = mcts.search(board)
+        self.assertIn(line[0], board.generate_moves())
+        self.assertEqual(mcts.playouts, 200)
+        self.assertTrue(0 <= score <= 1)
+        self.assertGreater(mcts.playouts_per_second(), 0)
+        self.assertEqual(mcts.root.move, line[0])
+        self.assertEqual(mcts.root.parent.visits, 200)
+        self.assertEqual(mcts.root.parent.virtual, 0)
+        self.assertTrue(all(child.virtual == 0 for child in mcts.root.parent.children))
+
+
+    def test_seed(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        first = Mcts(100, None, seed = 5).search(board)
+        self.assertEqual(Mcts(100, None, seed = 5).search(board), first)
+
+
+    def test_finds_win(self):
+        for selection in (UCT, PUCT):
+            mcts = Mcts(300, None, selection, seed = 0)
+            self.assertEqual(str(mcts.choose_move(trap_board())), '(2, 1)-(1, 0)')
+
+
+    def test_reuse(self):
+        mcts = Mcts(300, None, seed = 1)
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        line, score = mcts.search(board)
+        expected = mcts.root.children[0].visits
+        reply = board.apply_move(line[0]).apply_move(mcts.root.children[0].move)
+        mcts.search(reply)
+        self.assertEqual(mcts.reused, expected)
+        mcts.search(Bitboard(INITIAL_BLACK, INITIAL_RED))
+        self.assertEqual(mcts.reused, 0)
+
+
+    def test_lost(self):
+        board = trap_board().apply_move(trap_board().quiet_move(coord_to_square(2, 1), coord_to_square(1, 0)))
+        self.assertEqual(board.turn, RED)
+        self.assertIsNone(Mcts(10, None).choose_move(board))
+
+
+    def test_play_out(self):
+        mcts = Mcts(10, None, seed = 0)
+        board = trap_board()
+        root = mcts.find_root(board)
+        root.expand()
+        won = [child for child in root.children if str(child.move) == '(2, 1)-(1, 0)'][0]
+        won.expand()
+        self.assertEqual(mcts.play_out([won]), [BLACK])
+        self.assertIn(mcts.play_out([root.children[0]])[0], (BLACK, RED, NO_WINNER))
+
+
+    def test_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            Mcts(selection = 'minimax')
+        with self.assertRaises(ValueError):
+            Mcts(None, None)
+
+
+def main():
+    unittest.main()
+
+
+main()
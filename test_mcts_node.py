@@ -0,0 +1,54 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the class MctsNode
+'''
+
+from mcts_node import MctsNode
+from bitboard import Bitboard, coord_to_square, INITIAL_BLACK, INITIAL_RED, RED
+import math
+import unittest
+
+
+class MctsNodeTest(unittest.TestCase):
+
+
+    def setUp(self):
+        self.node = MctsNode(Bitboard(INITIAL_BLACK, INITIAL_RED))
+
+
+    def test_expand(self):
+        children = self.node.expand()
+        self.assertEqual(len(children), 7)
+        self.assertIs(self.node.children, children)
+        self.assertTrue(all(child.parent is self.node for child in children))
+        self.assertAlmostEqual(sum(child.prior for child in children), 1.0)
+        lost = Bitboard()
+        lost.put(coord_to_square(1, 0), RED)
+        self.assertEqual(MctsNode(lost).expand(), [])
+
+
+    def test_scores(self):
+        child = self.node.expand()[0]
+        self.assertEqual(child.uct_score(1, 1.4), math.inf)
+        self.assertEqual(child.mean_value(0.5), 0.5)
+        child.visits = 4
+        child.value = 3.0
+        self.assertAlmostEqual(child.uct_score(10, 1.0), 0.75 + math.sqrt(math.log(10) / 4))
+        child.virtual = 2
+        self.assertAlmostEqual(child.mean_value(0.5), 0.5)
+        self.assertAlmostEqual(child.puct_score(16, 1.0), 0.5 + child.prior * 4 / 7)
+
+
+    def test_best_child(self):
+        self.assertIsNone(self.node.best_child())
+        children = self.node.expand()
+        children[3].visits = 5
+        self.assertIs(self.node.best_child(), children[3])
+
+
+def main():
+    unittest.main()
+
+
+main()
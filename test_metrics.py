@@ -0,0 +1,147 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the metrics registry
+'''
+
+from metrics import MetricsRegistry, METRICS, PROMETHEUS, timed
+from state import State
+from engine import Engine
+from bitboard import Bitboard, INITIAL_BLACK, INITIAL_RED
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+
+class MetricsRegistryTest(unittest.TestCase):
+
+
+    def test_disabled(self):
+        metrics = MetricsRegistry()
+        metrics.inc('clicks')
+        metrics.observe('render_seconds', 0.1)
+        self.assertIsNone(metrics.start())
+        metrics.stop('render', metrics.start())
+        self.assertEqual(metrics.to_json(), {'counters': {}, 'histograms': {}})
+
+
+    def test_counters(self):
+        metrics = MetricsRegistry()
+        metrics.enable()
+        metrics.inc('clicks')
+        metrics.inc('clicks', 2)
+        self.assertEqual(metrics.counters, {'clicks': 3})
+        metrics.disable()
+        metrics.inc('clicks')
+        self.assertEqual(metrics.counters, {'clicks': 3})
+        metrics.reset()
+        self.assertEqual(metrics.counters, {})
+
+
+    def test_histogram(self):
+        metrics = MetricsRegistry(buckets = (1, 10))
+        metrics.enable()
+        for value in (0.5, 1, 5, 50):
+            metrics.observe('size', value)
+        histogram = metrics.to_json()['histograms']['size']
+        self.assertEqual(histogram, {'buckets': {'1': 2, '10': 1, '+Inf': 1}, 'sum': 56.5, 'count': 4})
+
+
+    def test_prometheus(self):
+        metrics = MetricsRegistry(buckets = (1, 10))
+        metrics.enable()
+        metrics.inc('clicks', 2)
+        for value in (0.5, 5, 50):
+            metrics.observe('size', value)
+        lines = metrics.to_prometheus().splitlines()
+        self.assertEqual(lines, ['# TYPE checkers_clicks_total counter', 'checkers_clicks_total 2',
+                                 '# TYPE checkers_size histogram', 'checkers_size_bucket{le="1"} 1',
+                                 'checkers_size_bucket{le="10"} 2', 'checkers_size_bucket{le="+Inf"} 3',
+                                 'checkers_size_sum 55.5', 'checkers_size_count 3'])
+
+
+    def test_write(self):
+        metrics = MetricsRegistry()
+        metrics.enable()
+        metrics.inc('clicks')
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'metrics.json')
+        metrics.write(path)
+        with open(path) as file:
+            self.assertEqual(json.load(file)['counters'], {'clicks': 1})
+        metrics.write(path + '.prom', PROMETHEUS)
+        with open(path + '.prom') as file:
+            self.assertIn('checkers_clicks_total 1', file.read())
+        self.assertEqual(sorted(os.listdir(directory)), ['metrics.json', 'metrics.json.prom'])
+        os.remove(path)
+        os.remove(path + '.prom')
+        os.rmdir(directory)
+
+
+    def test_enable_format(self):
+        metrics = MetricsRegistry()
+        with self.assertRaises(ValueError):
+            metrics.enable(format = 'xml')
+        self.assertFalse(metrics.enabled)
+
+
+    def test_timed(self):
+        @timed('double')
+        def double(value):
+            return 2 * value
+
+        self.assertEqual(double.__name__, 'double')
+        self.assertEqual(double(2), 4)
+        self.assertNotIn('double_seconds', METRICS.histograms)
+        METRICS.enable()
+        try:
+            self.assertEqual(double(3), 6)
+            self.assertEqual(METRICS.histograms['double_seconds'][-1], 1)
+        finally:
+            METRICS.disable()
+            METRICS.reset()
+
+
+    def test_state(self):
+        METRICS.enable()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                state = State()
+                state.run_checkers()
+                state.cell_focused = state.sample_piece()
+                state.auto_play(state.sample_cell())
+                state.update_state()
+            histograms = METRICS.to_json()['histograms']
+            self.assertEqual(histograms['move_generation_seconds']['count'], 2)
+            self.assertEqual(histograms['render_seconds']['count'], 1)
+            self.assertEqual(METRICS.counters, {'turns': 1})
+        finally:
+            METRICS.disable()
+            METRICS.reset()
+
+
+    def test_engine(self):
+        engine = Engine(max_depth = 3, time_limit = None)
+        METRICS.enable()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                engine.choose_move(Bitboard(INITIAL_BLACK, INITIAL_RED))
+            self.assertEqual(output.getvalue(), '')
+            self.assertEqual(METRICS.counters['engine_searches'], 1)
+            self.assertEqual(METRICS.counters['engine_depth'], 3)
+            self.assertEqual(METRICS.counters['engine_nodes'], engine.nodes)
+            self.assertEqual(METRICS.counters['table_hits'] + METRICS.counters['table_misses'],
+                             engine.table.hits + engine.table.misses)
+        finally:
+            METRICS.disable()
+            METRICS.reset()
+
+
+def main():
+    unittest.main()
+
+
+main()
@@ -0,0 +1,48 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the class Move
+'''
+
+from move import Move
+import unittest
+
+
+class MoveTest(unittest.TestCase):
+
+
+    def test_init(self):
+        move = Move([9, 13])
+        self.assertEqual(move.path, (9, 13))
+        self.assertEqual(move.captured, 0)
+        self.assertFalse(move.crowned)
+
+
+    def test_str(self):
+        self.assertEqual(Move((9, 13)).__str__(), '(3, 2)-(2, 3)')
+        self.assertEqual(Move((9, 18), 1 << 13).__str__(), '(3, 2)x(5, 4)')
+
+
+    def test_eq_hash(self):
+        move1 = Move((9, 18, 25), 1 << 13 | 1 << 22)
+        move2 = Move((9, 18, 25), 1 << 13 | 1 << 22)
+        move3 = Move((9, 18), 1 << 13)
+        self.assertEqual(move1, move2)
+        self.assertFalse(move1 == move3)
+        self.assertEqual(len({move1, move2, move3}), 2)
+
+
+    def test_squares(self):
+        move = Move((9, 18, 25), 1 << 13 | 1 << 22)
+        self.assertEqual(move.from_square(), 9)
+        self.assertEqual(move.to_square(), 25)
+        self.assertTrue(move.is_capture())
+        self.assertFalse(Move((9, 13)).is_capture())
+        self.assertEqual(move.coords(), [(3, 2), (5, 4), (3, 6)])
+
+
+def main():
+    unittest.main()
+
+
+main()
@@ -0,0 +1,86 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the class MovePicker
+'''
+
+from bitboard import Bitboard, INITIAL_BLACK, INITIAL_RED, BLACK, RED, coord_to_square
+from move import Move
+from move_picker import MovePicker, STAGE_TABLE, STAGE_KILLERS, STAGE_QUIETS, STAGE_DONE
+from tables import NUM_DARK_SQUARES
+import unittest
+
+
+def quiet(x, y, x_to, y_to):
+    return Move((coord_to_square(x, y), coord_to_square(x_to, y_to)))
+
+
+class MovePickerTest(unittest.TestCase):
+
+
+    def test_same_moves(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        picked = list(MovePicker(board))
+        self.assertEqual(picked, board.generate_moves())
+
+
+    def test_order(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        history = [0] * (NUM_DARK_SQUARES * NUM_DARK_SQUARES)
+        history[coord_to_square(7, 2) * NUM_DARK_SQUARES + coord_to_square(6, 3)] = 10
+        killers = [quiet(1, 2, 2, 3), quiet(4, 5, 3, 4)]
+        picker = MovePicker(board, quiet(5, 2, 4, 3), killers, history)
+        picked = [str(move) for move in picker]
+        self.assertEqual(picked[:4], ['(5, 2)-(4, 3)', '(1, 2)-(2, 3)', '(7, 2)-(6, 3)', '(1, 2)-(0, 3)'])
+        self.assertEqual(len(picked), 7)
+        self.assertEqual(len(set(picked)), 7)
+
+
+    def test_lazy(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        picker = MovePicker(board, quiet(5, 2, 4, 3), [quiet(1, 2, 2, 3)])
+        moves = picker.moves()
+        next(moves)
+        self.assertEqual(picker.stage, STAGE_TABLE)
+        next(moves)
+        self.assertEqual(picker.stage, STAGE_KILLERS)
+        next(moves)
+        self.assertEqual(picker.stage, STAGE_QUIETS)
+        list(moves)
+        self.assertEqual(picker.stage, STAGE_DONE)
+
+
+    def test_captures_only(self):
+        board = Bitboard()
+        board.put(coord_to_square(2, 3), BLACK)
+        board.put(coord_to_square(6, 1), BLACK)
+        board.put(coord_to_square(3, 4), RED)
+        picker = MovePicker(board, quiet(6, 1, 7, 2), [quiet(6, 1, 5, 2)])
+        picked = [str(move) for move in picker]
+        self.assertEqual(picked, ['(2, 3)x(4, 5)'])
+        self.assertEqual(picker.stage, STAGE_DONE)
+
+
+    def test_table_capture_first(self):
+        board = Bitboard()
+        board.put(coord_to_square(2, 3), BLACK)
+        board.put(coord_to_square(4, 3), BLACK)
+        board.put(coord_to_square(3, 4), RED)
+        moves = board.generate_moves()
+        picker = MovePicker(board, moves[-1])
+        self.assertEqual(list(picker), [moves[-1]] + moves[:-1])
+
+
+    def test_illegal_table_move(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        picked = list(MovePicker(board, quiet(3, 4, 2, 5)))
+        self.assertEqual(picked, board.generate_moves())
+        capture = Move((coord_to_square(2, 3), coord_to_square(4, 5)), 1 << coord_to_square(3, 4))
+        self.assertIsNone(MovePicker(board, capture).table_move_if_legal(False))
+
+
+def main():
+    unittest.main()
+
+
+main()
@@ -0,0 +1,95 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the opening book builder and the class OpeningBook
+'''
+
+from opening_book import OpeningBook, collect, write_book, read_games, play_game, move_weight, HEADER, RECORD
+from bitboard import Bitboard, INITIAL_BLACK, INITIAL_RED, BLACK
+from engine import Engine
+import json
+import os
+import random
+import tempfile
+import unittest
+
+
+class OpeningBookTest(unittest.TestCase):
+
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'test.book')
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        self.first, self.second = board.generate_moves()[:2]
+        reply = board.apply_move(self.first).generate_moves()[0]
+        self.games = [([self.first, reply], BLACK), ([self.first], None), ([self.second], 1 - BLACK)]
+
+
+    def tearDown(self):
+        for name in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, name))
+        os.rmdir(self.directory)
+
+
+    def test_collect(self):
+        stats = collect(self.games)
+        key = Bitboard(INITIAL_BLACK, INITIAL_RED).key
+        self.assertEqual(stats[(key, self.first.path[0], self.first.path[-1], 0)], [2, 1, 1])
+        self.assertEqual(stats[(key, self.second.path[0], self.second.path[-1], 0)], [1, 0, 0])
+        self.assertEqual(len(stats), 3)
+        self.assertEqual(len(collect(self.games, plies = 1)), 2)
+
+
+    def test_write_lookup(self):
+        self.assertEqual(write_book(self.path, collect(self.games)), 3)
+        self.assertEqual(os.path.getsize(self.path), HEADER.size + 3 * RECORD.size)
+        book = OpeningBook(self.path)
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        entries = book.lookup(board)
+        self.assertEqual([entry[0] for entry in entries], sorted([self.first, self.second], key = lambda move: move.path))
+        self.assertEqual(book.choose_move(board), self.first)
+        self.assertIn(book.choose_move(board, random.Random(1)), (self.first, self.second))
+        self.assertEqual(len(book.lookup(board.apply_move(self.first))), 1)
+        self.assertIsNone(book.choose_move(board.apply_move(self.second)))
+        self.assertEqual((book.hits, book.misses), (2, 1))
+        book.close()
+
+
+    def test_move_weight(self):
+        self.assertEqual(move_weight(1, 1), 4)
+        self.assertEqual(move_weight(0, 0), 1)
+
+
+    def test_read_games(self):
+        games_path = os.path.join(self.directory, 'games.jsonl')
+        with open(games_path, 'w') as file:
+            for moves, winner in self.games:
+                file.write(json.dumps({'moves': [str(move) for move in moves], 'winner': winner}) + '\n')
+        self.assertEqual(list(read_games(games_path)), self.games)
+        with open(games_path, 'w') as file:
+            file.write(json.dumps({'moves': [str(self.first), str(self.first)], 'winner': None}) + '\n')
+        with self.assertRaises(ValueError):
+            list(read_games(games_path))
+
+
+    def test_play_game(self):
+        moves, winner = play_game(Engine(2, None), random.Random(0), max_plies = 10)
+        self.assertEqual(len(moves), 10)
+        self.assertIsNone(winner)
+
+
+    def test_engine(self):
+        write_book(self.path, collect(self.games))
+        book = OpeningBook(self.path)
+        engine = Engine(max_depth = 4, time_limit = None, book = book)
+        self.assertEqual(engine.choose_move(Bitboard(INITIAL_BLACK, INITIAL_RED)), self.first)
+        self.assertEqual(engine.nodes, 0)
+        book.close()
+
+
+def main():
+    unittest.main()
+
+
+main()
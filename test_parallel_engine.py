@@ -0,0 +1,145 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the class ParallelEngine
+'''
+
+from bitboard import Bitboard, coord_to_square, INITIAL_BLACK, INITIAL_RED, BLACK, RED
+from engine import Engine, WIN_SCORE, MAX_PLY
+from parallel_engine import ParallelEngine, search_root_move, measure_speedup
+from state import State
+import threading
+import unittest
+
+
+class ParallelEngineTest(unittest.TestCase):
+
+
+    def test_init(self):
+        self.assertRaises(ValueError, ParallelEngine, 0)
+        engine = ParallelEngine(2)
+        self.assertIsNone(engine.pool)
+
+
+    def test_search_root_move(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        move = board.generate_moves()[0]
+        first = search_root_move(board, move, 4, None, None)
+        self.assertEqual(search_root_move(board, move, 4, None, None), first)
+        self.assertEqual(first[1][0], move)
+        self.assertEqual(search_root_move(board, move, 6, None, 10)[:2], (None, None))
+        score = first[0]
+        self.assertLessEqual(search_root_move(board, move, 4, None, None, alpha = score, beta = score + 1)[0], score)
+        self.assertGreater(search_root_move(board, move, 4, None, None, alpha = score - 1, beta = score)[0], score - 1)
+
+
+    def test_table_kept_within_search(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        move = board.generate_moves()[0]
+        cold = search_root_move(board, move, 6, None, None, search = -1)
+        warm = search_root_move(board, move, 6, None, None, search = -1)
+        self.assertEqual(warm[0], cold[0])
+        self.assertLess(warm[2], cold[2])
+        self.assertEqual(search_root_move(board, move, 6, None, None, search = -2), cold)
+
+
+    def test_same_score_as_engine(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        for move in board.generate_moves()[:3]:
+            child = board.apply_move(move)
+            serial = ParallelEngine(1, 5, None)
+            line, score = serial.search(child)
+            self.assertEqual(score, Engine(5, None).search(child)[1])
+            self.assertEqual(serial.depth, 5)
+            self.assertIn(line[0], child.generate_moves())
+
+
+    def test_same_result(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        serial = ParallelEngine(1, 4, None)
+        parallel = ParallelEngine(2, 4, None)
+        try:
+            line, score = parallel.search(board)
+        finally:
+            parallel.close()
+        self.assertEqual(serial.search(board)[1], score)
+        self.assertIn(line[0], board.generate_moves())
+        self.assertEqual(serial.depth, 4)
+        self.assertEqual(parallel.depth, 4)
+
+
+    def test_shared_table(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        shared = ParallelEngine(2, 5, None, shared_capacity = 1 << 12)
+        try:
+            line, score = shared.search(board)
+            self.assertGreater(shared.shared_table.filled(), 0)
+        finally:
+            shared.close()
+        self.assertIsNone(shared.shared_table)
+        self.assertEqual(shared.depth, 5)
+        self.assertIn(line[0], board.generate_moves())
+
+
+    def test_finds_win(self):
+        board = Bitboard()
+        board.put(coord_to_square(2, 3), BLACK)
+        board.put(coord_to_square(7, 0), BLACK)
+        board.put(coord_to_square(3, 4), RED)
+        line, score = ParallelEngine(1, 8, None).search(board)
+        self.assertGreater(score, WIN_SCORE - MAX_PLY)
+        self.assertEqual(str(line[0]), '(2, 3)x(4, 5)')
+
+
+    def test_cancel(self):
+        engine = ParallelEngine(1, 60, None)
+        timer = threading.Timer(0.2, engine.cancel)
+        timer.start()
+        line, score = engine.search(Bitboard(INITIAL_BLACK, INITIAL_RED))
+        timer.join()
+        self.assertTrue(line)
+        self.assertLess(engine.depth, 60)
+
+
+    def test_cancel_before_search(self):
+        engine = ParallelEngine(2, 60, None)
+        stop_event = threading.Event()
+        stop_event.set()
+        line, score = engine.search(Bitboard(INITIAL_BLACK, INITIAL_RED), stop_event)
+        self.assertTrue(line)
+        self.assertLess(engine.depth, 60)
+        engine.cancel()
+        engine.max_depth = 2
+        line, score = engine.search(Bitboard(INITIAL_BLACK, INITIAL_RED))
+        engine.close()
+        self.assertEqual(engine.depth, 2)
+
+
+    def test_measure_speedup(self):
+        results = measure_speedup(Bitboard(INITIAL_BLACK, INITIAL_RED), 3, [1, 2])
+        self.assertEqual([row['workers'] for row in results], [0, 1, 2])
+        self.assertEqual(results[0]['speedup'], 1.0)
+        serial = Engine(3, None)
+        serial.search(Bitboard(INITIAL_BLACK, INITIAL_RED))
+        self.assertEqual(results[0]['nodes'], serial.nodes)
+        for row in results[1:]:
+            self.assertAlmostEqual(row['speedup'], results[0]['seconds'] / row['seconds'])
+            self.assertAlmostEqual(row['efficiency'], row['speedup'] / row['workers'])
+        self.assertEqual(results[1]['move'], results[2]['move'])
+
+
+    def test_state_computer(self):
+        state = State(computer = ParallelEngine(1, 4, None))
+        state.render_board()
+        state.init_pieces()
+        state.update_valid_moves()
+        state.switch_player_to_computer()
+        self.assertEqual(state.turn, 0)
+        self.assertEqual(state.move_count, 3)
+
+
+def main():
+    unittest.main()
+
+
+main()
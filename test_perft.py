@@ -0,0 +1,109 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test perft, hashed perft and the State reference move generator
+'''
+
+from perft import perft, hashed_perft, divide, state_moves, state_perft, parse_position, format_position
+from bitboard import Bitboard, INITIAL_BLACK, INITIAL_RED
+from transposition import TranspositionTable
+from tables import square_to_coord
+from piece import Piece
+from state import State
+import random
+import unittest
+
+
+def state_of(board):
+    state = State()
+    state.render_board()
+    for x in range(state.num_cells):
+        for y in range(state.num_cells):
+            state.checkerboard[x][y].occupied = 0
+    for square in range(32):
+        bit = 1 << square
+        if (board.black | board.red) & bit:
+            x, y = square_to_coord(square)
+            state.checkerboard[x][y].occupied = Piece(player = 0 if board.black & bit else 1,
+                                                      is_king = bool(board.kings & bit))
+    state.turn = board.turn
+    state.key = board.key
+    return state
+
+
+def random_positions(count, seed):
+    rng = random.Random(seed)
+    res = []
+    while len(res) < count:
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        for ply in range(rng.randrange(10, 60)):
+            moves = board.generate_moves()
+            if not moves:
+                break
+            board = board.apply_move(rng.choice(moves))
+        if board.generate_moves():
+            res.append(board)
+    return res
+
+
+class PerftTest(unittest.TestCase):
+
+
+    def test_initial(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        self.assertEqual([perft(board, depth) for depth in range(6)], [1, 7, 49, 302, 1469, 7361])
+
+
+    def test_hashed(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        table = TranspositionTable(1 << 12)
+        self.assertEqual(hashed_perft(board, 6, table), 36768)
+        self.assertGreater(table.hits, 0)
+        for board in random_positions(5, 1):
+            self.assertEqual(hashed_perft(board, 4, TranspositionTable(1 << 8)), perft(board, 4))
+
+
+    def test_divide(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        counts = divide(board, 3)
+        self.assertEqual(len(counts), 7)
+        self.assertEqual(sum(count for move, count in counts), 302)
+        self.assertEqual(divide(board, 3, TranspositionTable(1 << 8)), counts)
+
+
+    def test_state_matches_bitboard(self):
+        for board in random_positions(20, 2):
+            state = state_of(board)
+            key = lambda move: (move.path[0], move.path[-1], move.captured, move.crowned)
+            self.assertEqual(sorted(map(key, state_moves(state))), sorted(map(key, board.generate_moves())))
+        for board in random_positions(3, 3) + [Bitboard(INITIAL_BLACK, INITIAL_RED)]:
+            self.assertEqual(state_perft(state_of(board), 3), perft(board, 3))
+
+
+    def test_crowned_capture(self):
+        board = parse_position('b:' + '.' * 21 + 'b...rr' + '.' * 5)
+        moves = state_moves(state_of(board))
+        self.assertEqual([str(move) for move in moves], ['(2, 5)x(4, 7)x(6, 5)'])
+        self.assertTrue(moves[0].crowned)
+        self.assertEqual(moves, board.generate_moves())
+
+
+    def test_position(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        text = format_position(board)
+        self.assertEqual(text, 'b:bbbbbbbbbbbb........rrrrrrrrrrrr')
+        self.assertEqual(parse_position(text), board)
+        self.assertEqual(parse_position(text).key, board.key)
+        for board in random_positions(5, 4):
+            self.assertEqual(parse_position(format_position(board)), board)
+        with self.assertRaises(ValueError):
+            parse_position('x:' + '.' * 32)
+        with self.assertRaises(ValueError):
+            parse_position('b:...')
+
+
+def main():
+    unittest.main()
+
+
+main()
@@ -44,6 +44,12 @@ class PieceTest(unittest.TestCase):
         self.assertTrue(piece.is_king)
 
 
+    def test_uncrown(self):
+        piece = Piece(player = 1, is_king = True)
+        piece.uncrown()
+        self.assertFalse(piece.is_king)
+
+
 def main():
     unittest.main()
 
@@ -0,0 +1,57 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the piece shapes
+'''
+
+from piece_shapes import circle_points, crown_points, to_shape, shape_name, register_piece_shapes, CIRCLE_STEPS
+from piece import CROWN_SHIFT, NUM_EDGE_OCTAGRAM
+from stub_pen import StubPen
+import math
+import unittest
+
+
+class PieceShapesTest(unittest.TestCase):
+
+
+    def test_circle_points(self):
+        points = circle_points(24)
+        self.assertEqual(len(points), CIRCLE_STEPS)
+        self.assertEqual(points[0], (0, 0))
+        for x, y in points:
+            self.assertAlmostEqual(math.hypot(x, y - 24), 24)
+        self.assertAlmostEqual(points[CIRCLE_STEPS // 2][1], 48)
+
+
+    def test_crown_points(self):
+        points = crown_points(24)
+        self.assertEqual(len(points), NUM_EDGE_OCTAGRAM)
+        self.assertAlmostEqual(math.hypot(*points[0]), CROWN_SHIFT)
+        for index in range(NUM_EDGE_OCTAGRAM):
+            x, y = points[index]
+            next_x, next_y = points[(index + 1) % NUM_EDGE_OCTAGRAM]
+            self.assertAlmostEqual(math.hypot(next_x - x, next_y - y), 24)
+
+
+    def test_to_shape(self):
+        self.assertEqual(to_shape([(1, 0), (0, 2)]), ((0, 1), (-2, 0)))
+
+
+    def test_shape_name(self):
+        names = {shape_name(player, is_king) for player in (0, 1) for is_king in (False, True)}
+        self.assertEqual(len(names), 4)
+        self.assertEqual(shape_name(True, False), shape_name(1, False))
+
+
+    def test_register(self):
+        screen = StubPen()
+        names = register_piece_shapes(screen, ('black', 'dark red'), 24)
+        self.assertEqual(len(names), 4)
+        self.assertEqual(screen.calls, {'register_shape': 4})
+
+
+def main():
+    unittest.main()
+
+
+main()
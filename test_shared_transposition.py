@@ -0,0 +1,91 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the class SharedTranspositionTable
+'''
+
+from shared_transposition import SharedTranspositionTable, pack, unpack, WORDS_PER_ENTRY
+from transposition import EXACT, LOWER, UPPER
+from move import Move
+import multiprocessing
+import unittest
+
+
+def store_in_child(name, capacity):
+    table = SharedTranspositionTable(capacity, name)
+    table.store(99, 4, -7, UPPER, Move((9, 18), 1 << 13))
+    table.close()
+
+
+class SharedTranspositionTableTest(unittest.TestCase):
+
+
+    def setUp(self):
+        self.table = SharedTranspositionTable(16)
+
+
+    def tearDown(self):
+        self.table.close()
+        self.table.unlink()
+
+
+    def test_pack_unpack(self):
+        move = Move((9, 27, 18), 1 << 13 | 1 << 22, True)
+        depth, score, bound, unpacked = unpack(*pack(-3, -99990, LOWER, move))
+        self.assertEqual((depth, score, bound), (-3, -99990, LOWER))
+        self.assertEqual(unpacked.path, (9, 18))
+        self.assertEqual(unpacked.captured, move.captured)
+        self.assertTrue(unpacked.crowned)
+        self.assertEqual(unpack(*pack(200, 5, EXACT, None)), (127, 5, EXACT, None))
+
+
+    def test_probe_store(self):
+        self.assertEqual(self.table.capacity, 16)
+        self.assertIsNone(self.table.probe(5))
+        self.assertTrue(self.table.store(5, 3, 42, EXACT, Move((9, 13))))
+        depth, score, bound, move = self.table.probe(5)
+        self.assertEqual((depth, score, bound, move.path), (3, 42, EXACT, (9, 13)))
+        self.assertEqual(self.table.hits, 1)
+        self.assertEqual(self.table.misses, 1)
+        self.assertEqual(self.table.filled(), 1)
+
+
+    def test_depth_preferred(self):
+        self.table.store(5, 6, 10, LOWER, Move((9, 13)))
+        self.assertFalse(self.table.store(5 + 16, 2, 20, EXACT, None))
+        self.assertIsNone(self.table.probe(5 + 16))
+        self.assertEqual(self.table.collisions, 1)
+        self.assertTrue(self.table.store(5, 1, 30, UPPER, None))
+        self.assertEqual(self.table.probe(5)[3].path, (9, 13))
+
+
+    def test_torn_entry(self):
+        self.table.store(5, 6, 10, LOWER, None)
+        self.table.words[5 * WORDS_PER_ENTRY + 1] ^= 1
+        self.assertIsNone(self.table.probe(5))
+
+
+    def test_shared(self):
+        other = SharedTranspositionTable(16, self.table.name)
+        other.store(7, 2, 1, EXACT, None)
+        self.assertEqual(self.table.probe(7), (2, 1, EXACT, None))
+        other.close()
+        process = multiprocessing.get_context('fork').Process(target = store_in_child, args = (self.table.name, 16))
+        process.start()
+        process.join()
+        depth, score, bound, move = self.table.probe(99)
+        self.assertEqual((depth, score, bound, move.captured), (4, -7, UPPER, 1 << 13))
+
+
+    def test_clear(self):
+        self.table.store(7, 2, 1, EXACT, None)
+        self.table.clear()
+        self.assertEqual(self.table.filled(), 0)
+        self.assertIsNone(self.table.probe(7))
+
+
+def main():
+    unittest.main()
+
+
+main()
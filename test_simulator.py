@@ -0,0 +1,74 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the batch self-play simulator
+'''
+
+from simulator import simulate, play_game, get_player
+from bitboard import Bitboard, INITIAL_BLACK, INITIAL_RED, BLACK, RED
+import random
+import subprocess
+import sys
+import unittest
+
+
+class SimulatorTest(unittest.TestCase):
+
+
+    def test_play_game(self):
+        result = play_game(7, 'random', 'random', 42)
+        self.assertEqual((result['game'], result['seed']), (7, 42))
+        self.assertIn(result['winner'], (BLACK, RED, None))
+        self.assertLessEqual(result['plies'], 200)
+        self.assertEqual(len(result['captures']), 2)
+        self.assertEqual(len(result['move_seconds']), 2)
+        again = play_game(7, 'random', 'random', 42)
+        self.assertEqual((again['winner'], again['plies'], again['captures']),
+                         (result['winner'], result['plies'], result['captures']))
+
+
+    def test_engine_beats_random(self):
+        result = play_game(0, 'engine:2', 'random', 3)
+        self.assertEqual(result['winner'], BLACK)
+        self.assertEqual(result['plies'] % 2, 1)
+
+
+    def test_max_plies(self):
+        result = play_game(0, 'random', 'random', 0, max_plies = 6)
+        self.assertIsNone(result['winner'])
+        self.assertEqual(result['plies'], 6)
+
+
+    def test_workers(self):
+        serial = sorted(simulate(8, 'random', 'engine:1', seed = 5, swap = True), key = lambda result: result['game'])
+        parallel = sorted(simulate(8, 'random', 'engine:1', seed = 5, workers = 2, swap = True),
+                          key = lambda result: result['game'])
+        strip = lambda results: [(result['black'], result['winner'], result['plies'], result['captures']) for result in results]
+        self.assertEqual(strip(serial), strip(parallel))
+        self.assertEqual([result['black'] for result in serial[:2]], ['random', 'engine:1'])
+        self.assertEqual([result['seed'] for result in serial], list(range(5, 13)))
+
+
+    def test_mcts_player(self):
+        board = Bitboard(INITIAL_BLACK, INITIAL_RED)
+        moves = board.generate_moves()
+        choose = get_player('mcts:20')
+        self.assertIn(choose(board, moves, random.Random(0)), moves)
+        self.assertEqual(choose(board, moves, random.Random(0)), choose(board, moves, random.Random(0)))
+
+
+    def test_numpy_optional(self):
+        code = 'import sys, simulator, main; sys.exit("numpy" in sys.modules)'
+        self.assertEqual(subprocess.run([sys.executable, '-c', code]).returncode, 0)
+
+
+    def test_unknown_player(self):
+        with self.assertRaises(ValueError):
+            get_player('nobody')
+
+
+def main():
+    unittest.main()
+
+
+main()
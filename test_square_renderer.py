@@ -0,0 +1,81 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the square renderer
+'''
+
+from square_renderer import SquareRenderer
+from state import State
+from stub_pen import StubPen
+import contextlib
+import io
+import unittest
+
+
+class SquareRendererTest(unittest.TestCase):
+
+
+    def setUp(self):
+        self.state = State()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.state.run_checkers()
+        self.screen = StubPen()
+        self.renderer = SquareRenderer(self.state.num_cells, self.state.cell_size, (-200, -200), self.screen, StubPen)
+
+
+    def shapes(self):
+        return sum(pen.calls.get('shape', 0) for pen in self.renderer.pens.values())
+
+
+    def test_first_frame(self):
+        self.assertEqual(self.renderer.render(self.state.checkerboard), 32)
+        self.assertEqual(len(self.renderer.pens), 32)
+        self.assertEqual(self.shapes(), 24)
+        self.assertEqual(self.screen.calls, {'update': 1})
+
+
+    def test_unchanged_frame(self):
+        self.renderer.render(self.state.checkerboard)
+        self.assertEqual(self.renderer.render(self.state.checkerboard), 0)
+        self.assertEqual(self.screen.calls, {'update': 1})
+
+
+    def test_move(self):
+        self.renderer.render(self.state.checkerboard)
+        for pen in self.renderer.pens.values():
+            pen.reset()
+        record = self.state.make_move(self.state.generate_moves()[0])
+        self.assertEqual(self.renderer.render(self.state.checkerboard), 2)
+        from_pen = self.renderer.pens[record.from_cell.generate_cell_key()]
+        to_pen = self.renderer.pens[record.to_cell.generate_cell_key()]
+        self.assertEqual(from_pen.calls, {'hideturtle': 1})
+        self.assertEqual(to_pen.calls, {'shape': 1, 'showturtle': 1})
+        self.assertEqual(self.shapes(), 1)
+        self.assertEqual(self.screen.calls, {'update': 2})
+
+
+    def test_crown(self):
+        self.renderer.render(self.state.checkerboard)
+        cell = self.state.checkerboard[1][0]
+        cell.occupied.crown()
+        self.assertEqual(self.renderer.render(self.state.checkerboard), 1)
+        self.assertEqual(self.renderer.pens[(1, 0)].calls['shape'], 2)
+
+
+    def test_invalidate(self):
+        self.renderer.render(self.state.checkerboard)
+        self.renderer.invalidate()
+        self.assertEqual(self.renderer.render(self.state.checkerboard), 32)
+
+
+    def test_pen_position(self):
+        pen = self.renderer.pen_at(1, 0)
+        self.assertIs(self.renderer.pen_at(1, 0), pen)
+        self.assertEqual(pen.calls['setposition'], 1)
+
+
+def main():
+    unittest.main()
+
+
+main()
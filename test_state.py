@@ -8,7 +8,10 @@ from coordinate import Coordinate
 from piece import Piece
 from cell import Cell 
 from state import State
+from bitboard import from_checkerboard
+from frozen_piece import piece_of
 import unittest
+import sys
 
 
 class CellTest(unittest.TestCase):
@@ -34,6 +37,16 @@ class CellTest(unittest.TestCase):
         self.assertEqual(state.move_count, 1)
 
 
+    def test_headless(self):
+        state = State()
+        self.assertIsNone(state.display)
+        self.assertNotIn('turtle', sys.modules)
+        state.render_board()
+        state.init_pieces()
+        state.update_valid_moves()
+        self.assertEqual(len(state.valid_moves), 4)
+
+
     def test_render_board(self):
         state = State()
         state.render_board()
@@ -83,6 +96,73 @@ class CellTest(unittest.TestCase):
         self.assertEqual(state.checkerboard[7][7].occupied.player, 1)
 
 
+    def test_play_move(self):
+        state = State()
+        state.render_board()
+        state.checkerboard[1][0].occupied = Piece(player = 0)
+        state.checkerboard[2][1].occupied = Piece(player = 1)
+        state.checkerboard[4][3].occupied = Piece(player = 1)
+        state.checkerboard[4][5].occupied = Piece(player = 1)
+        moves = state.generate_moves()
+        self.assertEqual(len(moves), 1)
+        self.assertEqual(moves[0].coords(), [(1, 0), (3, 2), (5, 4), (3, 6)])
+        before = from_checkerboard(state.checkerboard, state.turn)
+        state.play_move(moves[0])
+        self.assertEqual(state.cell_focused, state.checkerboard[3][6])
+        self.assertEqual(state.checkerboard[2][1].occupied, 0)
+        self.assertEqual(state.checkerboard[4][3].occupied, 0)
+        self.assertEqual(state.checkerboard[4][5].occupied, 0)
+        self.assertEqual(from_checkerboard(state.checkerboard, 1), before.apply_move(moves[0]))
+
+
+    def test_make_unmake_move(self):
+        state = State()
+        state.render_board()
+        black = Piece(player = 0)
+        red = [Piece(player = 1), Piece(player = 1, is_king = True)]
+        state.checkerboard[2][5].occupied = black
+        state.checkerboard[3][6].occupied = red[0]
+        state.checkerboard[5][6].occupied = red[1]
+        state.update_valid_moves()
+        key = state.key
+        move = state.generate_moves()[0]
+        self.assertEqual(move.coords(), [(2, 5), (4, 7), (6, 5)])
+        record = state.make_move(move)
+        self.assertEqual(state.checkerboard[6][5].occupied, black)
+        self.assertTrue(black.is_king)
+        self.assertEqual(state.checkerboard[3][6].occupied, 0)
+        self.assertEqual(state.checkerboard[5][6].occupied, 0)
+        self.assertEqual(state.turn, 1)
+        self.assertEqual(state.move_count, 2)
+        self.assertEqual(state.key, from_checkerboard(state.checkerboard, 1).key)
+        state.unmake_move(record)
+        self.assertIs(state.checkerboard[2][5].occupied, black)
+        self.assertFalse(black.is_king)
+        self.assertIs(state.checkerboard[3][6].occupied, red[0])
+        self.assertIs(state.checkerboard[5][6].occupied, red[1])
+        self.assertEqual(state.checkerboard[6][5].occupied, 0)
+        self.assertEqual(state.turn, 0)
+        self.assertEqual(state.move_count, 1)
+        self.assertEqual(state.key, key)
+        state.refresh_valid_moves()
+        self.assertEqual(list(state.valid_moves.keys()), [(2, 5)])
+
+
+    def test_snapshot(self):
+        state = State()
+        state.render_board()
+        state.init_pieces()
+        pieces, turn = state.snapshot()
+        self.assertEqual(turn, 0)
+        self.assertEqual(len(pieces), 32)
+        self.assertEqual(pieces[:12], (piece_of(0),) * 12)
+        self.assertEqual(pieces[12:20], (None,) * 8)
+        self.assertIs(pieces[20], piece_of(1))
+        self.assertEqual(len({state.snapshot(), state.snapshot()}), 1)
+        state.play_move(state.generate_moves()[0])
+        self.assertNotEqual(state.snapshot(), (pieces, turn))
+
+
     def test_capture_and_continue(self):
         state = State()
         state.render_board()
@@ -255,6 +335,37 @@ class CellTest(unittest.TestCase):
         self.assertEqual(state.valid_moves, {(3, 2):[state.checkerboard[1][4]]})
 
     
+    def test_refresh_valid_moves(self):
+        state = State()
+        state.render_board()
+        state.init_pieces()
+        state.refresh_valid_moves()
+        self.assertEqual(len(state.pieces[0]), 12)
+        self.assertEqual(state.capturers, [0, 0])
+        self.assertEqual(state.valid_moves[(7, 2)], [state.checkerboard[6][3]])
+
+        state.move_piece(state.checkerboard[3][2], state.checkerboard[4][3])
+        state.turn = 1
+        state.refresh_valid_moves()
+        self.assertEqual(state.dirty, set())
+        self.assertFalse(state.is_capture)
+        state.move_piece(state.checkerboard[6][5], state.checkerboard[5][4])
+        state.turn = 0
+        state.refresh_valid_moves()
+        self.assertTrue(state.is_capture)
+        self.assertEqual(state.capturers, [1, 1])
+        self.assertEqual(state.valid_moves, {(4, 3): [state.checkerboard[6][5]]})
+
+        state.move_piece(state.checkerboard[4][3], state.checkerboard[6][5])
+        state.burst_cell_in_between(state.checkerboard[4][3], state.checkerboard[6][5])
+        state.turn = 1
+        state.refresh_valid_moves()
+        jumps = dict(state.valid_moves)
+        state.update_valid_moves()
+        self.assertEqual(jumps, state.valid_moves)
+        self.assertEqual(len(state.pieces[1]), 11)
+
+    
     def test_auto_play(self):
         state = State()
         state.render_board()
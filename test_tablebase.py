@@ -0,0 +1,168 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the tablebase generator and the class Tablebase
+'''
+
+from tablebase import Tablebase, build_all, build_predecessors, enumerate_positions, index_of, signature_of, \
+                      signatures, table_size, signature_name
+from array import array
+from bitboard import Bitboard, coord_to_square, BLACK, RED
+from engine import Engine, WIN_SCORE
+from parallel_engine import ParallelEngine
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class TablebaseTest(unittest.TestCase):
+
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.built = build_all(cls.directory, 2)
+
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+
+    def setUp(self):
+        self.tablebase = Tablebase(self.directory)
+
+
+    def tearDown(self):
+        self.tablebase.close()
+
+
+    def test_signatures(self):
+        levels = signatures(3)
+        self.assertEqual(levels[0], [(0, 1, 0, 1)])
+        flat = [signature for level in levels for signature in level]
+        self.assertEqual(len(flat), len(set(flat)))
+        self.assertIn((2, 0, 0, 1), flat)
+        self.assertNotIn((0, 0, 0, 2), flat)
+        self.assertLess(flat.index((0, 2, 0, 1)), flat.index((1, 1, 0, 1)))
+        self.assertLess(flat.index((1, 0, 1, 0)), flat.index((1, 0, 1, 1)))
+
+
+    def test_index(self):
+        for signature in ((1, 0, 1, 0), (0, 2, 1, 0)):
+            seen = set()
+            for board in enumerate_positions(signature):
+                self.assertEqual(signature_of(board), signature)
+                index = index_of(board, signature)
+                self.assertTrue(0 <= index < table_size(signature))
+                seen.add(index)
+            self.assertEqual(len(seen), len(list(enumerate_positions(signature))))
+
+
+    def test_size(self):
+        self.assertEqual(table_size((1, 0, 1, 0)), 2 * 28 * 28)
+        self.assertEqual(table_size((0, 1, 0, 1)), 2 * 32 * 31)
+        self.assertEqual(table_size((1, 1, 1, 0)), 2 * 28 * 28 * 30)
+        for signature in ((0, 2, 0, 1), (1, 1, 1, 0), (2, 0, 1, 0)):
+            self.assertGreater(len(list(enumerate_positions(signature))), table_size(signature) * 0.9)
+
+
+    def test_predecessors(self):
+        starts, predecessors = build_predecessors(array('I', [2, 0, 2]), array('I', [1, 2, 3]), 3)
+        self.assertEqual(list(starts), [0, 1, 1, 3])
+        self.assertEqual(list(predecessors), [2, 1, 3])
+
+
+    def test_built(self):
+        self.assertEqual(sorted(row[0] for row in self.built), [(0, 1, 0, 1), (0, 1, 1, 0), (1, 0, 0, 1), (1, 0, 1, 0)])
+        self.assertEqual(self.tablebase.max_pieces, 2)
+        for signature in self.tablebase.available:
+            self.assertTrue(os.path.exists(os.path.join(self.directory, signature_name(signature))))
+
+
+    def test_probe(self):
+        board = Bitboard()
+        board.put(coord_to_square(2, 3), BLACK, is_king = True)
+        board.put(coord_to_square(3, 4), RED, is_king = True)
+        self.assertEqual(self.tablebase.probe(board), 1)
+        board.turn = RED
+        self.assertEqual(self.tablebase.probe(board), 1)
+        board = Bitboard()
+        board.put(coord_to_square(1, 0), RED)
+        self.assertEqual(self.tablebase.probe(board), -1)
+        board.put(coord_to_square(1, 2), BLACK)
+        board.put(coord_to_square(5, 2), BLACK)
+        self.assertIsNone(self.tablebase.probe(board))
+        self.assertEqual(self.tablebase.misses, 1)
+
+
+    def test_consistent(self):
+        for signature in self.tablebase.available:
+            for board in enumerate_positions(signature):
+                children = [self.tablebase.probe(board.apply_move(move)) for move in board.generate_moves()]
+                value = self.tablebase.probe(board)
+                if not children:
+                    self.assertEqual(value, -1)
+                elif any(child < 0 for child in children):
+                    self.assertEqual(value, min(-child for child in children if child < 0))
+                elif all(child > 0 for child in children):
+                    self.assertEqual(value, -max(children) - 2)
+                else:
+                    self.assertEqual(value, 0)
+
+
+    def test_lru(self):
+        tablebase = Tablebase(self.directory, max_open = 1)
+        board = Bitboard()
+        board.put(coord_to_square(2, 3), BLACK, is_king = True)
+        board.put(coord_to_square(3, 4), RED, is_king = True)
+        tablebase.probe(board)
+        first = list(tablebase.open_tables)
+        board = Bitboard(1 << coord_to_square(2, 1), 1 << coord_to_square(3, 4), 1 << coord_to_square(3, 4))
+        tablebase.probe(board)
+        self.assertEqual(len(tablebase.open_tables), 1)
+        self.assertNotEqual(list(tablebase.open_tables), first)
+        tablebase.close()
+        self.assertEqual(len(tablebase.open_tables), 0)
+
+
+    def test_parallel_build(self):
+        directory = tempfile.mkdtemp()
+        try:
+            build_all(directory, 2, workers = 2)
+            for signature in self.tablebase.available:
+                with open(os.path.join(directory, signature_name(signature)), 'rb') as file:
+                    parallel = file.read()
+                with open(os.path.join(self.directory, signature_name(signature)), 'rb') as file:
+                    self.assertEqual(file.read(), parallel)
+        finally:
+            shutil.rmtree(directory)
+
+
+    def test_engine(self):
+        wins = [board for board in enumerate_positions((1, 0, 0, 1)) if self.tablebase.probe(board) > 2]
+        board = wins[0]
+        engine = Engine(max_depth = 2, time_limit = None, tablebase = self.tablebase)
+        line, score = engine.search(board)
+        self.assertEqual(score, WIN_SCORE - self.tablebase.probe(board))
+        self.assertEqual(self.tablebase.probe(board.apply_move(line[0])), -self.tablebase.probe(board))
+
+
+    def test_parallel_engine(self):
+        wins = [board for board in enumerate_positions((1, 0, 0, 1)) if self.tablebase.probe(board) > 2]
+        board = wins[0]
+        for workers in (1, 2):
+            engine = ParallelEngine(workers, 2, None, tablebase = self.tablebase)
+            try:
+                line, score = engine.search(board)
+            finally:
+                engine.close()
+            self.assertEqual(score, WIN_SCORE - self.tablebase.probe(board))
+
+
+def main():
+    unittest.main()
+
+
+main()
@@ -0,0 +1,57 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the precomputed square tables
+'''
+
+from tables import SQUARE_STEPS, CELL_STEPS, LANDINGS, SEARCH_COORDS, NEIGHBOR, LANDING, NO_SQUARE
+from tables import BLACK_MAN, RED_MAN, KING, UP_LEFT, DOWN_RIGHT, coord_to_square, piece_kind
+import unittest
+
+
+class TablesTest(unittest.TestCase):
+
+
+    def test_piece_kind(self):
+        self.assertEqual(piece_kind(0, False), BLACK_MAN)
+        self.assertEqual(piece_kind(1, False), RED_MAN)
+        self.assertEqual(piece_kind(0, True), KING)
+        self.assertEqual(piece_kind(1, True), KING)
+
+
+    def test_neighbor_landing(self):
+        self.assertEqual(NEIGHBOR[UP_LEFT][coord_to_square(3, 2)], coord_to_square(2, 3))
+        self.assertEqual(LANDING[UP_LEFT][coord_to_square(3, 2)], coord_to_square(1, 4))
+        self.assertEqual(NEIGHBOR[UP_LEFT][coord_to_square(0, 1)], NO_SQUARE)
+        self.assertEqual(LANDING[DOWN_RIGHT][coord_to_square(6, 1)], NO_SQUARE)
+
+
+    def test_square_steps(self):
+        square = coord_to_square(0, 1)
+        self.assertEqual(SQUARE_STEPS[BLACK_MAN][square], ((coord_to_square(1, 2), coord_to_square(2, 3)),))
+        self.assertEqual(SQUARE_STEPS[RED_MAN][square], ((coord_to_square(1, 0), NO_SQUARE),))
+        self.assertEqual(len(SQUARE_STEPS[KING][coord_to_square(3, 2)]), 4)
+
+
+    def test_cell_steps(self):
+        self.assertEqual(CELL_STEPS[BLACK_MAN][3][2], ((2, 3, 1, 4), (4, 3, 5, 4)))
+        self.assertEqual(CELL_STEPS[RED_MAN][1][0], ())
+        self.assertEqual(CELL_STEPS[KING][7][6], ((6, 5, 5, 4), (6, 7, NO_SQUARE, NO_SQUARE)))
+
+
+    def test_landings(self):
+        self.assertEqual(LANDINGS[(3, 2, 2, 3)], (1, 4))
+        self.assertNotIn((1, 2, 0, 3), LANDINGS)
+
+
+    def test_search_coords(self):
+        self.assertEqual(SEARCH_COORDS[BLACK_MAN][6][5], [[5, 7], [6]])
+        self.assertEqual(SEARCH_COORDS[RED_MAN][3][7], [[2, 4], [6]])
+        self.assertEqual(SEARCH_COORDS[KING][3][2], [[2, 4], [1, 3]])
+
+
+def main():
+    unittest.main()
+
+
+main()
@@ -0,0 +1,69 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the class TranspositionTable
+'''
+
+from transposition import TranspositionTable, EXACT, LOWER, UPPER
+from move import Move
+import unittest
+
+
+class TranspositionTableTest(unittest.TestCase):
+
+
+    def test_init(self):
+        table = TranspositionTable(1000)
+        self.assertEqual(table.capacity, 512)
+        self.assertEqual(table.filled(), 0)
+        self.assertRaises(ValueError, TranspositionTable, 0)
+
+
+    def test_probe_store(self):
+        table = TranspositionTable(16)
+        move = Move((9, 13))
+        self.assertIsNone(table.probe(5))
+        self.assertTrue(table.store(5, 3, 42, EXACT, move))
+        self.assertEqual(table.probe(5), (3, 42, EXACT, move))
+        self.assertEqual(table.hits, 1)
+        self.assertEqual(table.misses, 1)
+        self.assertEqual(table.collisions, 0)
+        self.assertEqual(table.filled(), 1)
+        self.assertEqual(table.hit_rate(), 0.5)
+
+
+    def test_depth_preferred(self):
+        table = TranspositionTable(16)
+        table.store(5, 6, 10, LOWER, None)
+        self.assertFalse(table.store(5 + 16, 2, 20, EXACT, None))
+        self.assertEqual(table.rejected, 1)
+        self.assertIsNone(table.probe(5 + 16))
+        self.assertEqual(table.collisions, 1)
+        self.assertTrue(table.store(5, 1, 30, UPPER, None))
+        self.assertEqual(table.probe(5), (1, 30, UPPER, None))
+        self.assertTrue(table.store(5 + 16, 2, 20, EXACT, None))
+        self.assertEqual(table.probe(5 + 16), (2, 20, EXACT, None))
+
+
+    def test_keep_move(self):
+        table = TranspositionTable(16)
+        move = Move((9, 13))
+        table.store(7, 2, 0, LOWER, move)
+        table.store(7, 3, -5, UPPER, None)
+        self.assertEqual(table.probe(7), (3, -5, UPPER, move))
+
+
+    def test_clear(self):
+        table = TranspositionTable(16)
+        table.store(7, 2, 0, LOWER, None)
+        table.probe(7)
+        table.clear()
+        self.assertEqual(table.filled(), 0)
+        self.assertEqual(table.hits, 0)
+
+
+def main():
+    unittest.main()
+
+
+main()
@@ -0,0 +1,74 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To test the Zobrist keys
+'''
+
+from zobrist import PIECE_KEYS, TURN_KEY, piece_type, piece_key, hash_masks, hash_checkerboard
+from bitboard import Bitboard, INITIAL_BLACK, INITIAL_RED, BLACK, RED, coord_to_square
+from piece import Piece
+from state import State
+import unittest
+
+
+class ZobristTest(unittest.TestCase):
+
+
+    def test_keys(self):
+        keys = [key for row in PIECE_KEYS for key in row] + [TURN_KEY]
+        self.assertEqual(len(keys), 129)
+        self.assertEqual(len(set(keys)), 129)
+
+
+    def test_piece_type(self):
+        self.assertEqual(piece_type(BLACK, False), 0)
+        self.assertEqual(piece_type(RED, False), 1)
+        self.assertEqual(piece_type(BLACK, True), 2)
+        self.assertEqual(piece_type(RED, True), 3)
+
+
+    def test_hash_masks(self):
+        self.assertEqual(hash_masks(0, 0, 0, BLACK), 0)
+        self.assertEqual(hash_masks(0, 0, 0, RED), TURN_KEY)
+        self.assertEqual(hash_masks(1 << 5, 1 << 9, 1 << 9, BLACK), piece_key(BLACK, False, 5) ^ piece_key(RED, True, 9))
+
+
+    def test_hash_checkerboard(self):
+        state = State()
+        state.render_board()
+        state.init_pieces()
+        self.assertEqual(hash_checkerboard(state.checkerboard, 0), Bitboard(INITIAL_BLACK, INITIAL_RED).key)
+        self.assertEqual(state.key, Bitboard(INITIAL_BLACK, INITIAL_RED).key)
+
+
+    def test_apply_move(self):
+        board = Bitboard()
+        board.put(coord_to_square(2, 5), BLACK)
+        board.put(coord_to_square(3, 6), RED)
+        board.put(coord_to_square(5, 6), RED, is_king = True)
+        board.put(coord_to_square(0, 1), RED)
+        for move in board.generate_moves():
+            after = board.apply_move(move)
+            self.assertEqual(after.key, hash_masks(after.black, after.red, after.kings, after.turn))
+        self.assertNotEqual(board.key, Bitboard(board.black, board.red, board.kings, RED).key)
+
+
+    def test_state_key(self):
+        state = State()
+        state.render_board()
+        state.checkerboard[2][5].occupied = Piece(player = 0)
+        state.checkerboard[3][6].occupied = Piece(player = 1)
+        state.checkerboard[5][6].occupied = Piece(player = 1, is_king = True)
+        state.checkerboard[0][1].occupied = Piece(player = 1)
+        state.update_valid_moves()
+        state.play_move(state.generate_moves()[0])
+        state.update_state()
+        self.assertEqual(state.checkerboard[6][5].occupied.is_king, True)
+        self.assertEqual(state.key, hash_checkerboard(state.checkerboard, state.turn))
+
+
+def main():
+    unittest.main()
+
+
+main()
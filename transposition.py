@@ -0,0 +1,158 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To remember searched positions in a fixed-size table keyed by Zobrist keys
+'''
+
+
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+DEFAULT_CAPACITY = 1 << 18
+NO_KEY = -1
+
+
+class TranspositionTable:
+    '''
+    Class -- TranspositionTable
+        A fixed number of slots, each holding one entry. A position goes to the slot picked by
+        the low bits of its key, and an entry is only replaced by a search at least as deep,
+        or by the same position, so the deep and expensive results survive.
+    Attributes:
+        capacity -- an integer, the number of slots, a power of two
+        mask -- an integer, capacity - 1, picking the slot from the low bits of a key
+        keys -- a list of integers, the key stored in each slot, NO_KEY for an empty slot
+        depths -- a list of integers, the depth each entry was searched to
+        scores -- a list of integers, the score of each entry
+        bounds -- a list of integers, EXACT, LOWER or UPPER, what the score of each entry is
+        moves -- a list of Move, the best move of each entry, None if unknown
+        hits -- an integer, probes that found their position
+        misses -- an integer, probes that did not
+        collisions -- an integer, probes that found another position in the slot
+        stores -- an integer, entries written
+        rejected -- an integer, stores dropped to keep a deeper entry of another position
+    Methods:
+        slot, probe, store, clear, filled, hit_rate
+    '''
+
+
+    def __init__(self, capacity = DEFAULT_CAPACITY):
+        '''
+        Constructor -- creates a new instance of TranspositionTable.
+        Parameters:
+            self -- the current TranspositionTable object
+            capacity -- an integer, the number of slots, rounded down to a power of two
+        '''
+        if capacity < 1:
+            raise ValueError('capacity must be positive')
+        self.capacity = 1 << (capacity.bit_length() - 1)
+        self.mask = self.capacity - 1
+        self.clear()
+
+
+    def slot(self, key):
+        '''
+        Method -- slot
+            Gets the slot a position goes to.
+        Parameters:
+            key -- an integer, the Zobrist key of the position
+        Returns:
+            An integer in [0, capacity).
+        '''
+        return key & self.mask
+
+
+    def probe(self, key):
+        '''
+        Method -- probe
+            Looks a position up.
+        Parameters:
+            key -- an integer, the Zobrist key of the position
+        Returns:
+            A tuple (depth, score, bound, move), None if the position is not in the table.
+        '''
+        index = key & self.mask
+        stored = self.keys[index]
+        if stored == key:
+            self.hits += 1
+            return self.depths[index], self.scores[index], self.bounds[index], self.moves[index]
+        self.misses += 1
+        if stored != NO_KEY:
+            self.collisions += 1
+        return None
+
+
+    def store(self, key, depth, score, bound, move):
+        '''
+        Method -- store
+            Writes the result of a search, unless the slot holds a deeper search of another position.
+        Parameters:
+            key -- an integer, the Zobrist key of the position
+            depth -- an integer, the depth the position was searched to
+            score -- an integer, the score found
+            bound -- an integer, EXACT, LOWER or UPPER
+            move -- a Move, the best move found, None if unknown
+        Returns:
+            A boolean, True if the entry was written.
+        '''
+        index = key & self.mask
+        stored = self.keys[index]
+        if stored != key and stored != NO_KEY and depth < self.depths[index]:
+            self.rejected += 1
+            return False
+        if stored == key and move is None:
+            move = self.moves[index]
+        self.keys[index] = key
+        self.depths[index] = depth
+        self.scores[index] = score
+        self.bounds[index] = bound
+        self.moves[index] = move
+        self.stores += 1
+        return True
+
+
+    def clear(self):
+        '''
+        Method -- clear
+            Empties every slot and resets the counters.
+        Parameters:
+            N/A
+        Returns:
+            N/A, but empties the table.
+        '''
+        self.keys = [NO_KEY] * self.capacity
+        self.depths = [0] * self.capacity
+        self.scores = [0] * self.capacity
+        self.bounds = [EXACT] * self.capacity
+        self.moves = [None] * self.capacity
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.stores = 0
+        self.rejected = 0
+
+
+    def filled(self):
+        '''
+        Method -- filled
+            Counts the slots in use, to size the table against the memory budget.
+        Parameters:
+            N/A
+        Returns:
+            An integer, the number of slots holding an entry.
+        '''
+        return self.capacity - self.keys.count(NO_KEY)
+
+
+    def hit_rate(self):
+        '''
+        Method -- hit_rate
+            Gets the share of probes that found their position.
+        Parameters:
+            N/A
+        Returns:
+            A float in [0, 1], 0 when nothing was probed yet.
+        '''
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
@@ -0,0 +1,53 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To remember what State.make_move changed, so that State.unmake_move can restore it exactly
+'''
+
+
+class UndoRecord:
+    '''
+    Class -- UndoRecord
+    Attributes:
+        move -- a Move, the move that was made
+        from_cell -- a cell, that the piece came from
+        to_cell -- a cell, that the piece moved to
+        piece -- a piece, the piece that moved
+        crowned -- a boolean, True if the move crowned the piece
+        captured -- a list of tuples (cell, piece), the pieces the move removed
+        turn -- the turn marker before the move
+        move_count -- an integer, the move counter before the move
+        key -- an integer, the Zobrist key before the move
+        is_capture -- a boolean, the capture marker before the move
+        cell_focused -- a cell, the focused cell before the move
+    '''
+
+
+    def __init__(self, move, from_cell, to_cell, piece, crowned, captured, turn, move_count, key, is_capture, cell_focused):
+        '''
+        Constructor -- creates a new instance of UndoRecord.
+        Parameters:
+            self -- the current UndoRecord object
+            move -- a Move
+            from_cell -- a cell, that the piece came from
+            to_cell -- a cell, that the piece moved to
+            piece -- a piece, the piece that moved
+            crowned -- a boolean, True if the move crowned the piece
+            captured -- a list of tuples (cell, piece)
+            turn -- the turn marker before the move
+            move_count -- an integer, the move counter before the move
+            key -- an integer, the Zobrist key before the move
+            is_capture -- a boolean, the capture marker before the move
+            cell_focused -- a cell, the focused cell before the move
+        '''
+        self.move = move
+        self.from_cell = from_cell
+        self.to_cell = to_cell
+        self.piece = piece
+        self.crowned = crowned
+        self.captured = captured
+        self.turn = turn
+        self.move_count = move_count
+        self.key = key
+        self.is_capture = is_capture
+        self.cell_focused = cell_focused
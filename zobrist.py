@@ -0,0 +1,102 @@
+'''
+Created by: Shiyao Wang
+Time: Oct 18, 2026
+Purpose: To give every checkers position a 64-bit Zobrist key, updated incrementally as pieces move
+'''
+
+
+import random
+from tables import NUM_DARK_SQUARES, coord_to_square
+
+
+SEED = 20261018
+KEY_BITS = 64
+NUM_PIECE_TYPES = 4
+
+
+def build_keys():
+    '''
+    Function -- build_keys
+        Draws the random keys from a fixed seed, so keys are the same in every run and process.
+    Parameters:
+        N/A
+    Returns:
+        A tuple (piece_keys, turn_key): piece_keys is a tuple of four tuples of 32 integers,
+        indexed by piece type then square, and turn_key is the integer toggled when red is to move.
+    '''
+    generator = random.Random(SEED)
+    piece_keys = tuple(tuple(generator.getrandbits(KEY_BITS) for square in range(NUM_DARK_SQUARES))
+                       for piece_type in range(NUM_PIECE_TYPES))
+    return piece_keys, generator.getrandbits(KEY_BITS)
+
+
+PIECE_KEYS, TURN_KEY = build_keys()
+
+
+def piece_type(player, is_king):
+    '''
+    Function -- piece_type
+        Gets the index of a piece in PIECE_KEYS. Unlike tables.piece_kind, kings of the two
+        players are different types, since they are different pieces in a position.
+    Parameters:
+        player -- an integer, 0 for black, 1 for red
+        is_king -- a boolean, True for a king piece
+    Returns:
+        An integer in [0, 4).
+    '''
+    return player + 2 * bool(is_king)
+
+
+def piece_key(player, is_king, square):
+    '''
+    Function -- piece_key
+        Gets the key of a piece standing on a square.
+    Parameters:
+        player -- an integer, 0 for black, 1 for red
+        is_king -- a boolean, True for a king piece
+        square -- an integer, the square index
+    Returns:
+        An integer, the key to XOR in or out of a position key.
+    '''
+    return PIECE_KEYS[player + 2 * bool(is_king)][square]
+
+
+def hash_masks(black, red, kings, turn):
+    '''
+    Function -- hash_masks
+        Computes the key of a position from scratch, from its bitboard masks.
+    Parameters:
+        black -- an integer, the mask of black pieces
+        red -- an integer, the mask of red pieces
+        kings -- an integer, the mask of king pieces
+        turn -- an integer, the player to move
+    Returns:
+        An integer, the Zobrist key of the position.
+    '''
+    key = TURN_KEY if turn else 0
+    for player, pieces in ((0, black), (1, red)):
+        while pieces:
+            low = pieces & -pieces
+            pieces ^= low
+            square = low.bit_length() - 1
+            key ^= PIECE_KEYS[player + 2 * bool(kings & low)][square]
+    return key
+
+
+def hash_checkerboard(checkerboard, turn):
+    '''
+    Function -- hash_checkerboard
+        Computes the key of a position from scratch, from the 2D list of cells maintained by State.
+    Parameters:
+        checkerboard -- a 2D list of cells, indexed by column then row
+        turn -- an integer, the player to move
+    Returns:
+        An integer, the Zobrist key of the position, equal to the key of the same Bitboard.
+    '''
+    key = TURN_KEY if turn else 0
+    for x in range(len(checkerboard)):
+        for y in range(len(checkerboard[x])):
+            piece = checkerboard[x][y].occupied
+            if piece:
+                key ^= piece_key(piece.player, piece.is_king, coord_to_square(x, y))
+    return key